@@ -3,21 +3,271 @@
 CLI tool for managing the paper-to-PDF mapping worklist.
 """
 
+import functools
 import json
+import os
+import random
+import zlib
 import click
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, List, Dict, Tuple
 import re
 import sys
-from difflib import SequenceMatcher
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _load_json_file(path) -> Dict:
+    """Parse a JSON file, using orjson when available."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _dump_json_file(path, data, fsync: bool = False, compact: bool = False):
+    """Write JSON (pretty-printed unless compact), using orjson when available.
+
+    With fsync=True the data is forced to disk before returning, so a
+    following os.replace can't leave a not-yet-durable file behind.
+    Compact output skips indentation — smaller writes for save-heavy
+    workloads at the cost of human-diffable files.
+    """
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data) if compact
+                    else orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            if compact:
+                json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
+            else:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+
+# Optional fields copied verbatim from a parsed BibTeX entry.
+_BIB_OPTIONAL_FIELDS = frozenset([
+    'journal', 'booktitle', 'volume', 'number', 'pages',
+    'doi', 'url', 'note', 'publisher', 'series', 'editor',
+    'edition', 'address', 'school', 'institution', 'eprint',
+    'archivePrefix', 'primaryClass',
+])
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_bibtex_entries(raw_bibtex: str) -> tuple:
+    """Parse raw BibTeX into a tuple of entry dicts, memoized per string.
+
+    A fresh BibTexParser is built per parse — the parser object
+    accumulates database state and is unsafe to reuse — but the lru_cache
+    means repeated adds of the same entry skip the parse entirely.
+    """
+    import bibtexparser
+    from bibtexparser.bparser import BibTexParser
+    from bibtexparser.customization import convert_to_unicode
+
+    parser = BibTexParser(common_strings=True)
+    parser.customization = convert_to_unicode
+    return tuple(bibtexparser.loads(raw_bibtex, parser=parser).entries)
+
+
+# Strips LaTeX escapes/braces from author names; compiled once rather than
+# re-parsed inside the per-author loops.
+_LATEX_STRIP = re.compile(r'[\\{}\"\']')
+
+# Tokenizes a lowercased PDF filename into words and 4-digit years.
+_FILENAME_TOKENS = re.compile(r'[a-z]+|\d{4}')
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_last_names(authors: str, limit: int = 3) -> tuple:
+    """First `limit` author last names, lowercased and LaTeX-stripped.
+
+    Memoized: author strings repeat across papers and across cache
+    rebuilds, and the parse is invariant per string.
+    """
+    names = []
+    for author in authors.lower().split(' and ')[:limit]:
+        if ',' in author:
+            last_name = author.split(',')[0].strip()
+        else:
+            parts = author.strip().split()
+            last_name = parts[-1] if parts else ''
+        names.append(_LATEX_STRIP.sub('', last_name))
+    return tuple(names)
+
+
+def _dumps_json(data) -> str:
+    """Pretty-print a value as JSON text, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def _bigrams(s: str) -> frozenset:
+    """Character-bigram shingle set of a string (for fast similarity)."""
+    return frozenset(s[i:i + 2] for i in range(len(s) - 1))
+
+
+# Banded-minhash parameters for the similar-paper candidate index.
+# 32 bands of 1 row: per-pair recall at Jaccard j is 1 - (1 - j)^32,
+# which is > 0.9999 at j ~ 0.33 (the Jaccard level matching the
+# combined-Dice 0.5 cutoff find_similar scores against), so the filter
+# cannot lose above-threshold pairs except with negligible probability.
+# The index only engages above _LSH_MIN_PAPERS; smaller corpora are
+# scanned exactly, which is both cheaper and lossless at that size.
+_LSH_ROWS = 1
+_LSH_BANDS = 32
+_LSH_NUM_PERM = _LSH_ROWS * _LSH_BANDS
+_LSH_MIN_PAPERS = 1000
+
+# Seeded universal-hash coefficients for the minhash permutations.
+# Shingles are hashed with crc32 (stable across processes, unlike the
+# builtin hash, which is salted per interpreter) and mixed with fixed
+# per-permutation constants, so signatures — and therefore find_similar
+# results — are reproducible between CLI invocations.
+_LSH_PRIME = (1 << 61) - 1
+_lsh_rng = random.Random(0x5EED)
+_LSH_COEFFS = [(_lsh_rng.randrange(1, _LSH_PRIME), _lsh_rng.randrange(_LSH_PRIME))
+               for _ in range(_LSH_NUM_PERM)]
+del _lsh_rng
+
+
+@functools.lru_cache(maxsize=65536)
+def _shingle_hash(s: str) -> int:
+    """Stable 32-bit hash of a shingle (process-independent)."""
+    return zlib.crc32(s.encode('utf-8'))
+
+
+def _dice(a: frozenset, b: frozenset) -> float:
+    """Dice coefficient between two shingle sets (2|A∩B| / (|A|+|B|))."""
+    if not a and not b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    return 2.0 * len(a & b) / (len(a) + len(b))
+
+
+def _score_pdf_prefix(prefix_lower, title_postings, author_postings,
+                      features, skip_keys, max_suggestions):
+    """Score a lowercased PDF text prefix against the paper needle postings.
+
+    Probes each distinct needle over the prefix once, then walks the
+    postings lists of the needles that hit; papers sharing no needle with
+    the prefix are never visited (the year bonus alone can't clear the
+    0.3 threshold, so skipping them is exact). A pure function over
+    picklable inputs so bulk investigation can run it in worker
+    processes. Returns [(bib_key, score)] sorted by descending score.
+    """
+    title_hits = {}
+    for word in title_postings:
+        if word in prefix_lower:
+            for bib_key in title_postings[word]:
+                title_hits[bib_key] = title_hits.get(bib_key, 0) + 1
+
+    author_hits = {}
+    for name in author_postings:
+        if name in prefix_lower:
+            for bib_key in author_postings[name]:
+                author_hits[bib_key] = author_hits.get(bib_key, 0) + 1
+
+    suggestions = []
+    for bib_key in sorted(title_hits.keys() | author_hits.keys()):
+        if bib_key in skip_keys:
+            continue
+
+        score = 0.0
+        title_matches = title_hits.get(bib_key, 0)
+        if title_matches >= 3:
+            score += title_matches * 0.3
+        author_matches = author_hits.get(bib_key, 0)
+        if author_matches > 0:
+            score += author_matches * 0.2
+        year = features[bib_key][2]
+        if year and year in prefix_lower:
+            score += 0.2
+
+        if score > 0.3:
+            suggestions.append((bib_key, score))
+
+    suggestions.sort(key=lambda x: x[1], reverse=True)
+    return suggestions[:max_suggestions]
+
+
+# Read-only match data shared with worker processes, set per worker by
+# the Pool initializer so it isn't re-pickled for every task.
+_POOL_STATE = {}
+
+
+def _pool_init(title_postings, author_postings, features, skip_keys):
+    _POOL_STATE['args'] = (title_postings, author_postings, features, skip_keys)
+
+
+def _pool_score(task):
+    pdf_name, prefix_lower = task
+    title_postings, author_postings, features, skip_keys = _POOL_STATE['args']
+    return pdf_name, _score_pdf_prefix(prefix_lower, title_postings,
+                                       author_postings, features, skip_keys, 5)
+
+
+def _journaled(func):
+    """Record a mutator call in the append-only journal before applying it.
+
+    Only the outermost mutator of a call chain is recorded; replaying it
+    re-executes any mutations it performs internally.
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if self._journal_depth == 0:
+            self._log_op(func.__name__, args, kwargs)
+        self._journal_depth += 1
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self._journal_depth -= 1
+    return wrapper
+
 
 class WorklistManager:
     """Manages the worklist data and operations."""
 
-    def __init__(self, worklist_path: str = "paper_data.json"):
+    def __init__(self, worklist_path: str = "paper_data.json", compact_saves: bool = False,
+                 journal_saves: bool = False):
         self.worklist_path = Path(worklist_path)
         self.pdf_extracts_path = Path("pdf_extracts.json")
+        self.compact_saves = compact_saves
+        self.journal_saves = journal_saves
+        self._journal_fh = None
+        self._journal_bytes = 0
+        self._journal_depth = 0
+        self._replaying = False
+        self._snapshot_bytes = 0
+        self._defer_depth = 0
+        self._dirty = False
+        self._paper_shingles = None
+        self._match_features = None
+        self._paper_matchkeys = None
+        self._lower_cache = {}
+        self._pdf_prefixes = None
+        self._pdf_stem_index = None
+        self._suggest_cache = {}
+        self._similar_cache = {}
+        self._needle_postings = None
+        self._paper_display = None
+        self._similar_lsh = None
+        self._now_cache = None
         self.load()
 
     def load(self):
@@ -25,101 +275,340 @@ class WorklistManager:
         if not self.worklist_path.exists():
             raise FileNotFoundError(f"Worklist not found: {self.worklist_path}")
 
-        with open(self.worklist_path, 'r', encoding='utf-8') as f:
-            self.data = json.load(f)
+        self.data = _load_json_file(self.worklist_path)
+        self._snapshot_bytes = self.worklist_path.stat().st_size
 
-        # Load PDF extracts if available
-        self.pdf_extracts = {}
-        if self.pdf_extracts_path.exists():
-            with open(self.pdf_extracts_path, 'r', encoding='utf-8') as f:
-                self.pdf_extracts = json.load(f)
+        # PDF extracts are large and only needed by a few commands; load lazily
+        self._pdf_extracts = None
 
-    def save(self):
-        """Save the worklist to disk."""
-        self.data['metadata']['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        with open(self.worklist_path, 'w', encoding='utf-8') as f:
-            json.dump(self.data, f, indent=2, ensure_ascii=False)
+        self._build_indexes()
 
+        if self._replay_journal():
+            if self.journal_saves:
+                # Snapshot + journal already capture this state on disk
+                self._dirty = False
+            else:
+                self.save()
+
+    @property
+    def pdf_extracts(self) -> Dict:
+        """PDF extract texts, loaded from disk on first access."""
+        if self._pdf_extracts is None:
+            self._pdf_extracts = {}
+            if self.pdf_extracts_path.exists():
+                self._pdf_extracts = _load_json_file(self.pdf_extracts_path)
+        return self._pdf_extracts
+
+    def _build_indexes(self):
+        """Build reverse status/tag indexes in one pass over the data.
+
+        The indexes map status -> keys and tag -> keys per item type, so
+        status/tag queries are O(hits) instead of full scans. Inner dicts
+        are used as ordered sets (key -> None) to keep insertion order.
+        They are maintained incrementally by the mutators and never
+        persisted — they are rebuilt here on every load.
+        """
+        self._mapping_by_bib = {}
+        self._mapping_by_pdf = {}
+        for mapping in self.data['mappings']:
+            self._mapping_by_bib.setdefault(self._mapping_paper_key(mapping), []).append(mapping)
+            self._mapping_by_pdf.setdefault(mapping['pdf_file'], []).append(mapping)
+
+        self._by_status = {'papers': {}, 'pdfs': {}}
+        self._by_tag = {'papers': {}, 'pdfs': {}}
+        for item_type in ('papers', 'pdfs'):
+            status_index = self._by_status[item_type]
+            tag_index = self._by_tag[item_type]
+            for key, entry in self.data.get(item_type, {}).items():
+                status_index.setdefault(entry['status'], {})[key] = None
+                for tag in entry.get('tags', []):
+                    tag_index.setdefault(tag, {})[key] = None
+
+    def _set_entry_status(self, item_type: str, key: str, status: str):
+        """Set an entry's status, keeping the status index in sync."""
+        entry = self.data[item_type][key]
+        old_status = entry.get('status')
+        entry['status'] = status
+        index = self._by_status[item_type]
+        if old_status is not None and old_status in index:
+            index[old_status].pop(key, None)
+        index.setdefault(status, {})[key] = None
+
+    def _drop_from_indexes(self, item_type: str, key: str):
+        """Remove an entry's key from the status and tag indexes."""
+        entry = self.data[item_type][key]
+        status_keys = self._by_status[item_type].get(entry.get('status'))
+        if status_keys is not None:
+            status_keys.pop(key, None)
+        tag_index = self._by_tag[item_type]
+        for tag in entry.get('tags', []):
+            if tag in tag_index:
+                tag_index[tag].pop(key, None)
+
+    def _now(self) -> str:
+        """Formatted current timestamp, computed at most once per write.
+
+        strftime is costly enough to show up when create_mapping runs in a
+        loop; the cache is dropped after each save and on batch() entry so
+        every flushed state still carries a fresh last_updated.
+        """
+        if self._now_cache is None:
+            self._now_cache = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        return self._now_cache
+
+    def save(self, fsync: bool = False):
+        """Save the worklist to disk (atomically, via a temp file + rename).
+
+        fsync is off by default for throughput; pass True when durability
+        matters more than speed (e.g. right before a risky bulk edit).
+        """
+        self.data['metadata']['last_updated'] = self._now()
+        tmp_path = self.worklist_path.with_suffix('.json.tmp')
+        _dump_json_file(tmp_path, self.data, fsync=fsync, compact=self.compact_saves)
+        os.replace(tmp_path, self.worklist_path)
+        self._snapshot_bytes = self.worklist_path.stat().st_size
+        # A full snapshot supersedes any journaled mutations
+        self._truncate_journal()
+        self._dirty = False
+        self._now_cache = None
+
+    @property
+    def journal_path(self) -> Path:
+        """Sidecar JSONL file holding mutations since the last snapshot."""
+        return Path(str(self.worklist_path) + '.log')
+
+    def _log_op(self, op: str, args, kwargs):
+        """Append one mutation record to the journal and flush it."""
+        if not self.journal_saves or self._replaying:
+            return
+        record = {'op': op, 'args': list(args)}
+        if kwargs:
+            record['kwargs'] = kwargs
+        if orjson is not None:
+            line = orjson.dumps(record) + b'\n'
+        else:
+            line = (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+        if self._journal_fh is None:
+            self._journal_fh = open(self.journal_path, 'ab')
+        self._journal_fh.write(line)
+        self._journal_fh.flush()
+        self._journal_bytes += len(line)
+
+    def _truncate_journal(self):
+        """Discard the journal; callers must have snapshotted its effects."""
+        if self._journal_fh is not None:
+            self._journal_fh.close()
+            self._journal_fh = None
+        try:
+            self.journal_path.unlink()
+        except FileNotFoundError:
+            pass
+        self._journal_bytes = 0
+
+    def _replay_journal(self):
+        """Re-apply journaled mutations left over from a previous run."""
+        try:
+            raw = self.journal_path.read_bytes()
+        except FileNotFoundError:
+            return False
+        applied = False
+        self._replaying = True
+        try:
+            for line in raw.splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break  # torn final write from a crash; drop the tail
+                method = getattr(self, record.get('op', ''), None)
+                if method is None:
+                    continue
+                method(*record.get('args', []), **record.get('kwargs', {}))
+                applied = True
+        finally:
+            self._replaying = False
+        self._journal_bytes = len(raw)
+        return applied
+
+    def compact(self):
+        """Write a fresh snapshot and truncate the journal."""
+        self.save()
+
+    def _maybe_compact(self):
+        """Fold the journal into a snapshot once it outgrows half the file."""
+        if self._journal_bytes > max(self._snapshot_bytes // 2, 4096):
+            self.compact()
+
+    def _mark_dirty(self):
+        """Record a mutation; save immediately unless inside a batch()."""
+        self._dirty = True
+        self._paper_shingles = None
+        self._match_features = None
+        self._paper_matchkeys = None
+        self._lower_cache.clear()
+        self._pdf_prefixes = None
+        self._pdf_stem_index = None
+        self._suggest_cache.clear()
+        self._similar_cache.clear()
+        self._needle_postings = None
+        self._paper_display = None
+        self._similar_lsh = None
+        if self._defer_depth == 0 and not self._replaying:
+            if self.journal_saves:
+                # The op is already durable in the journal; only rewrite
+                # the snapshot once the journal stops paying for itself.
+                self._maybe_compact()
+            else:
+                self._flush()
+
+    def _flush(self):
+        """Write out pending changes, if any."""
+        if self._dirty:
+            self.save()
+
+    @contextmanager
+    def batch(self):
+        """Defer saves for a block of mutations, writing the file once at the end.
+
+        Usage:
+            with manager.batch():
+                for key in keys:
+                    manager.add_tags('papers', key, tags)
+        """
+        self._defer_depth += 1
+        if self._defer_depth == 1:
+            self._now_cache = None
+        try:
+            yield self
+        finally:
+            self._defer_depth -= 1
+            if self._defer_depth == 0:
+                self._flush()
+
+    @_journaled
     def update_status(self, item_type: str, key: str, status: str) -> bool:
         """Update the status of an item."""
         collection = self.data.get(item_type)
         if collection and key in collection:
-            collection[key]['status'] = status
-            self.save()
+            if collection[key]['status'] == status:
+                return True  # Already set; don't dirty the worklist
+            self._set_entry_status(item_type, key, status)
+            self._mark_dirty()
             return True
         return False
 
+    @_journaled
     def set_markdown_file(self, pdf_file: str, markdown_path: str) -> bool:
         """Set the markdown_file field for a PDF."""
         if pdf_file in self.data['pdfs']:
-            self.data['pdfs'][pdf_file]['markdown_file'] = markdown_path
-            self.save()
+            entry = self.data['pdfs'][pdf_file]
+            if entry.get('markdown_file') != markdown_path:
+                entry['markdown_file'] = markdown_path
+                self._mark_dirty()
             return True
         return False
 
+    @_journaled
     def set_extracted_paper_info(self, bib_key: str, info_data: dict) -> bool:
         """Set the extracted_paper_info field for a paper entry."""
         if bib_key in self.data['papers']:
-            self.data['papers'][bib_key]['extracted_paper_info'] = info_data
-            self.save()
+            entry = self.data['papers'][bib_key]
+            if entry.get('extracted_paper_info') != info_data:
+                entry['extracted_paper_info'] = info_data
+                self._mark_dirty()
             return True
         return False
 
+    @_journaled
     def set_raw_bibtex(self, bib_key: str, raw_bibtex: str) -> bool:
         """Set the raw_bibtex field for a paper entry."""
         if bib_key in self.data['papers']:
-            self.data['papers'][bib_key]['raw_bibtex'] = raw_bibtex
-            self.save()
+            entry = self.data['papers'][bib_key]
+            if entry.get('raw_bibtex') != raw_bibtex:
+                entry['raw_bibtex'] = raw_bibtex
+                self._mark_dirty()
             return True
         return False
 
+    @_journaled
     def set_under_submission(self, bib_key: str, under_submission: bool) -> bool:
         """Set the under_submission field for a paper entry."""
         if bib_key in self.data['papers']:
-            self.data['papers'][bib_key]['under_submission'] = under_submission
-            self.save()
+            entry = self.data['papers'][bib_key]
+            if entry.get('under_submission') != under_submission:
+                entry['under_submission'] = under_submission
+                self._mark_dirty()
             return True
         return False
 
+    @_journaled
     def set_paper_field(self, bib_key: str, field_name: str, field_value: str) -> bool:
         """Set a field for a paper entry."""
         if bib_key in self.data['papers']:
-            self.data['papers'][bib_key][field_name] = field_value
-            self.save()
+            if self.data['papers'][bib_key].get(field_name) == field_value:
+                return True  # Already set; don't dirty the worklist
+            if field_name == 'status':
+                # Route through the helper so the status index stays in sync
+                self._set_entry_status('papers', bib_key, field_value)
+            else:
+                self.data['papers'][bib_key][field_name] = field_value
+            self._mark_dirty()
             return True
         return False
 
+    @_journaled
     def add_tags(self, item_type: str, key: str, tags: List[str]) -> bool:
         """Add tags to an item (appends to existing tags, avoiding duplicates)."""
         collection = self.data.get(item_type)
         if collection and key in collection:
-            if 'tags' not in collection[key]:
-                collection[key]['tags'] = []
-            # Add tags, avoiding duplicates
-            existing_tags = set(collection[key]['tags'])
-            for tag in tags:
-                if tag not in existing_tags:
-                    collection[key]['tags'].append(tag)
-            self.save()
+            # Dedupe against what's stored, preserving order. Stored tags
+            # may themselves contain duplicates (set_tags stores its
+            # argument verbatim), so compare membership, not lengths.
+            existing = collection[key].get('tags') or []
+            present = dict.fromkeys(existing)
+            new = [t for t in dict.fromkeys(tags) if t not in present]
+            if not new:
+                return True  # All tags already present; nothing to write
+            collection[key]['tags'] = [*existing, *new]
+            tag_index = self._by_tag[item_type]
+            for tag in new:
+                tag_index.setdefault(tag, {})[key] = None
+            self._mark_dirty()
             return True
         return False
 
+    @_journaled
     def remove_tags(self, item_type: str, key: str, tags: List[str]) -> bool:
         """Remove tags from an item."""
         collection = self.data.get(item_type)
         if collection and key in collection:
             if 'tags' in collection[key]:
-                collection[key]['tags'] = [t for t in collection[key]['tags'] if t not in tags]
-            self.save()
+                to_remove = set(tags)
+                collection[key]['tags'] = [t for t in collection[key]['tags'] if t not in to_remove]
+                tag_index = self._by_tag[item_type]
+                for tag in tags:
+                    if tag in tag_index:
+                        tag_index[tag].pop(key, None)
+            self._mark_dirty()
             return True
         return False
 
+    @_journaled
     def set_tags(self, item_type: str, key: str, tags: List[str]) -> bool:
         """Set tags for an item (replaces existing tags)."""
         collection = self.data.get(item_type)
         if collection and key in collection:
+            if collection[key].get('tags') == tags:
+                return True  # Unchanged; nothing to write
+            tag_index = self._by_tag[item_type]
+            for tag in collection[key].get('tags', []):
+                if tag in tag_index:
+                    tag_index[tag].pop(key, None)
             collection[key]['tags'] = tags
-            self.save()
+            for tag in tags:
+                tag_index.setdefault(tag, {})[key] = None
+            self._mark_dirty()
             return True
         return False
 
@@ -132,28 +621,33 @@ class WorklistManager:
 
     def list_by_tag(self, item_type: str, tag: str) -> List[str]:
         """List all items that have a specific tag."""
-        collection = self.data.get(item_type)
-        if not collection:
+        tag_index = self._by_tag.get(item_type)
+        if tag_index is None:
             return []
-        return [k for k, v in collection.items() if tag in v.get('tags', [])]
+        return sorted(tag_index.get(tag, ()))
 
+    @_journaled
     def rename_tag(self, item_type: str, old_tag: str, new_tag: str) -> int:
         """Rename a tag across all items. Returns count of items updated."""
         collection = self.data.get(item_type)
         if not collection:
             return 0
 
+        tag_index = self._by_tag[item_type]
         count = 0
-        for key, entry in collection.items():
-            if 'tags' in entry and old_tag in entry['tags']:
-                # Replace old tag with new tag
-                entry['tags'] = [new_tag if t == old_tag else t for t in entry['tags']]
-                count += 1
+        for key in list(tag_index.get(old_tag, ())):
+            entry = collection[key]
+            # Replace old tag with new tag
+            entry['tags'] = [new_tag if t == old_tag else t for t in entry['tags']]
+            tag_index[old_tag].pop(key, None)
+            tag_index.setdefault(new_tag, {})[key] = None
+            count += 1
 
         if count > 0:
-            self.save()
+            self._mark_dirty()
         return count
 
+    @_journaled
     def add_bibtex_entry(self, bib_key: str, raw_bibtex: str, under_submission: bool = False) -> bool:
         """Add a new paper entry to the worklist."""
         if bib_key in self.data['papers']:
@@ -161,18 +655,12 @@ class WorklistManager:
 
         # Parse the bibtex to extract fields
         try:
-            import bibtexparser
-            from bibtexparser.bparser import BibTexParser
-            from bibtexparser.customization import convert_to_unicode
-
-            parser = BibTexParser(common_strings=True)
-            parser.customization = convert_to_unicode
-            bib_db = bibtexparser.loads(raw_bibtex, parser=parser)
+            entries = _parse_bibtex_entries(raw_bibtex)
 
-            if not bib_db.entries:
+            if not entries:
                 return False
 
-            entry = bib_db.entries[0]
+            entry = entries[0]
 
             # Create new entry with parsed fields
             new_entry = {
@@ -185,14 +673,8 @@ class WorklistManager:
             }
 
             # Add optional fields if present
-            optional_fields = ['journal', 'booktitle', 'volume', 'number', 'pages',
-                             'doi', 'url', 'note', 'publisher', 'series', 'editor',
-                             'edition', 'address', 'school', 'institution', 'eprint',
-                             'archivePrefix', 'primaryClass']
-
-            for field in optional_fields:
-                if field in entry:
-                    new_entry[field] = entry[field].replace('\n', ' ').strip()
+            new_entry.update({k: v.replace('\n', ' ').strip()
+                              for k, v in entry.items() if k in _BIB_OPTIONAL_FIELDS})
 
             # Set venue based on type
             if new_entry['type'] == 'article' and 'journal' in entry:
@@ -206,14 +688,16 @@ class WorklistManager:
 
             # Add the entry
             self.data['papers'][bib_key] = new_entry
+            self._by_status['papers'].setdefault(new_entry['status'], {})[bib_key] = None
             self.data['metadata']['total_papers'] = len(self.data['papers'])
-            self.save()
+            self._mark_dirty()
             return True
 
         except Exception as e:
             print(f"Error parsing bibtex: {e}", file=sys.stderr)
             return False
 
+    @_journaled
     def add_pdf_entry(self, pdf_file: str, has_text: bool = False) -> bool:
         """Add a new PDF entry to the worklist."""
         if pdf_file in self.data['pdfs']:
@@ -223,38 +707,49 @@ class WorklistManager:
             'status': 'NOT_INVESTIGATED',
             'has_text': has_text
         }
+        self._by_status['pdfs'].setdefault('NOT_INVESTIGATED', {})[pdf_file] = None
         self.data['metadata']['total_pdfs'] = len(self.data['pdfs'])
-        self.save()
+        self._mark_dirty()
         return True
 
+    @_journaled
     def add_awards(self, bib_key: str, awards: List[str]) -> bool:
         """Add awards to a paper entry (appends to existing awards, avoiding duplicates)."""
         if bib_key in self.data['papers']:
-            if 'awards' not in self.data['papers'][bib_key]:
-                self.data['papers'][bib_key]['awards'] = []
-            # Add awards, avoiding duplicates
-            existing_awards = set(self.data['papers'][bib_key]['awards'])
-            for award in awards:
-                if award not in existing_awards:
-                    self.data['papers'][bib_key]['awards'].append(award)
-            self.save()
+            # Dedupe against what's stored, preserving order; stored
+            # awards may contain duplicates, so compare membership
+            existing = self.data['papers'][bib_key].get('awards') or []
+            present = dict.fromkeys(existing)
+            new = [a for a in dict.fromkeys(awards) if a not in present]
+            if not new:
+                return True  # All awards already present; nothing to write
+            self.data['papers'][bib_key]['awards'] = [*existing, *new]
+            self._mark_dirty()
             return True
         return False
 
+    @_journaled
     def remove_awards(self, bib_key: str, awards: List[str]) -> bool:
         """Remove awards from a paper entry."""
         if bib_key in self.data['papers']:
-            if 'awards' in self.data['papers'][bib_key]:
-                self.data['papers'][bib_key]['awards'] = [a for a in self.data['papers'][bib_key]['awards'] if a not in awards]
-            self.save()
+            existing = self.data['papers'][bib_key].get('awards', [])
+            to_remove = set(awards)
+            remaining = [a for a in existing if a not in to_remove]
+            if len(remaining) == len(existing):
+                return True  # None of the awards were present; nothing to write
+            self.data['papers'][bib_key]['awards'] = remaining
+            self._mark_dirty()
             return True
         return False
 
+    @_journaled
     def set_awards(self, bib_key: str, awards: List[str]) -> bool:
         """Set awards for a paper entry (replaces existing awards)."""
         if bib_key in self.data['papers']:
+            if self.data['papers'][bib_key].get('awards') == awards:
+                return True  # Unchanged; nothing to write
             self.data['papers'][bib_key]['awards'] = awards
-            self.save()
+            self._mark_dirty()
             return True
         return False
 
@@ -264,24 +759,50 @@ class WorklistManager:
             return self.data['papers'][bib_key].get('awards', [])
         return None
 
+    def _get_pdf_stem_index(self) -> Dict[str, str]:
+        """stem -> PDF filename map, built once and invalidated on mutation."""
+        if self._pdf_stem_index is None:
+            self._pdf_stem_index = {Path(p).stem: p for p in self.data['pdfs']}
+        return self._pdf_stem_index
+
+    def get_paper_display(self, bib_key: str) -> Dict[str, str]:
+        """Pre-truncated title/authors/year strings for CLI output.
+
+        Built once per generation for all papers so repeated suggest/next
+        calls against a warm daemon skip the per-call dict-gets and slicing.
+        """
+        if self._paper_display is None:
+            display = {}
+            for key, entry in self.data['papers'].items():
+                title = entry.get('title', 'N/A')
+                authors = entry.get('authors', 'N/A')
+                display[key] = {
+                    'title': title,
+                    'title80': title[:80],
+                    'authors80': authors[:80],
+                    'authors100': authors[:100],
+                    'year': entry.get('year', 'N/A'),
+                }
+            self._paper_display = display
+        return self._paper_display[bib_key]
+
     def get_paper_by_pdf_stem(self, pdf_stem: str) -> Optional[str]:
         """Find paper key by PDF filename stem (without extension)."""
-        # Look for PDF files that match the stem
-        for pdf_name, pdf_entry in self.data['pdfs'].items():
-            # Check if this PDF's stem matches
-            if Path(pdf_name).stem == pdf_stem:
-                # Return the mapped paper key if it exists
-                return pdf_entry.get('mapped_paper')
-        return None
+        pdf_name = self._get_pdf_stem_index().get(pdf_stem)
+        if pdf_name is None:
+            return None
+        # Return the mapped paper key if it exists
+        return self.data['pdfs'][pdf_name].get('mapped_paper')
 
     def get_paper_with_markdown(self, status: Optional[str] = 'MAPPED') -> List[Tuple[str, Dict]]:
         """Get paper entries that have an associated PDF with markdown."""
         results = []
-        for bib_key, bib_entry in self.data['papers'].items():
-            # Filter by status if specified
-            if status and bib_entry['status'] != status:
-                continue
-
+        if status:
+            candidates = [(k, self.data['papers'][k])
+                          for k in self._by_status['papers'].get(status, ())]
+        else:
+            candidates = self.data['papers'].items()
+        for bib_key, bib_entry in candidates:
             # Check if this paper has a mapped PDF
             mapped_pdf = bib_entry.get('mapped_pdf')
             if not mapped_pdf:
@@ -304,31 +825,29 @@ class WorklistManager:
 
     def get_next_uninvestigated(self, item_type: str) -> Optional[Tuple[str, Dict]]:
         """Get the next NOT_INVESTIGATED item."""
-        collection = self.data.get(item_type)
-        if collection:
-            for key, value in collection.items():
-                if value['status'] == 'NOT_INVESTIGATED':
-                    return key, value
-        return None
+        return self.get_next_by_status(item_type, 'NOT_INVESTIGATED')
 
     def get_next_by_status(self, item_type: str, status: str) -> Optional[Tuple[str, Dict]]:
         """Get the next item with specific status."""
         collection = self.data.get(item_type)
         if collection:
-            for key, value in collection.items():
-                if value['status'] == status:
-                    return key, value
+            for key in self._by_status[item_type].get(status, ()):
+                return key, collection[key]
         return None
 
-    def list_keys(self, item_type: str, status: Optional[str] = None) -> List[str]:
-        """List all keys, optionally filtered by status."""
+    def iter_keys(self, item_type: str, status: Optional[str] = None):
+        """Yield keys lazily, optionally filtered by status."""
         collection = self.data.get(item_type)
         if not collection:
-            return []
-
+            return
         if status:
-            return [k for k, v in collection.items() if v['status'] == status]
-        return list(collection.keys())
+            yield from self._by_status[item_type].get(status, ())
+        else:
+            yield from collection.keys()
+
+    def list_keys(self, item_type: str, status: Optional[str] = None) -> List[str]:
+        """List all keys, optionally filtered by status."""
+        return list(self.iter_keys(item_type, status))
 
     def get_entry(self, item_type: str, key: str) -> Optional[Dict]:
         """Get full details of an entry."""
@@ -337,21 +856,74 @@ class WorklistManager:
             return collection[key]
         return None
 
+    @staticmethod
+    def _mapping_paper_key(mapping: Dict) -> str:
+        """Paper key of a mapping, tolerating the pre-migration 'bib_key' name."""
+        return mapping.get('paper_key', mapping.get('bib_key'))
+
+    def _pop_mapping(self, bib_key: str = None, pdf_file: str = None) -> Optional[Dict]:
+        """Remove and return the first mapping for a paper key or PDF file.
+
+        Uses the mapping indexes for the lookup; duplicates (several
+        mappings sharing a key) are handled by keeping per-key lists, so
+        removing one uncovers the next.
+        """
+        if bib_key is not None:
+            bucket = self._mapping_by_bib.get(bib_key)
+            if not bucket:
+                return None
+            mapping = bucket.pop(0)
+            if not bucket:
+                del self._mapping_by_bib[bib_key]
+            other = self._mapping_by_pdf.get(mapping['pdf_file'])
+        else:
+            bucket = self._mapping_by_pdf.get(pdf_file)
+            if not bucket:
+                return None
+            mapping = bucket.pop(0)
+            if not bucket:
+                del self._mapping_by_pdf[pdf_file]
+            other = self._mapping_by_bib.get(self._mapping_paper_key(mapping))
+
+        if other is not None and mapping in other:
+            other.remove(mapping)
+            if not other:
+                if bib_key is not None:
+                    del self._mapping_by_pdf[mapping['pdf_file']]
+                else:
+                    del self._mapping_by_bib[self._mapping_paper_key(mapping)]
+
+        self.data['mappings'].remove(mapping)
+        self.data['metadata']['mapped_count'] = len(self.data['mappings'])
+        return mapping
+
+    @_journaled
     def create_mapping(self, bib_key: str, pdf_file: str, confidence: str = "high", notes: str = None, found: bool = False):
         """Create a mapping between paper and PDF."""
+        # Re-asserting an identical, still-effective mapping is a no-op;
+        # don't append a duplicate record or rewrite the file for it
+        for mapping in self._mapping_by_bib.get(bib_key, ()):
+            if (mapping['pdf_file'] == pdf_file
+                    and mapping.get('confidence') == confidence
+                    and mapping.get('notes') == notes
+                    and bool(mapping.get('found')) == bool(found)
+                    and self.data['papers'].get(bib_key, {}).get('mapped_pdf') == pdf_file
+                    and self.data['pdfs'].get(pdf_file, {}).get('mapped_paper') == bib_key):
+                return
+
         # Update paper entry
         if bib_key in self.data['papers']:
-            self.data['papers'][bib_key]['status'] = 'MAPPED'
+            self._set_entry_status('papers', bib_key, 'MAPPED')
             self.data['papers'][bib_key]['mapped_pdf'] = pdf_file
             if notes:
                 self.data['papers'][bib_key]['notes'] = notes
             if found:
                 self.data['papers'][bib_key]['found_pdf'] = True
-                self.data['papers'][bib_key]['found_date'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                self.data['papers'][bib_key]['found_date'] = self._now()
 
         # Update PDF entry
         if pdf_file in self.data['pdfs']:
-            self.data['pdfs'][pdf_file]['status'] = 'MAPPED'
+            self._set_entry_status('pdfs', pdf_file, 'MAPPED')
             self.data['pdfs'][pdf_file]['mapped_paper'] = bib_key
         else:
             # Create new PDF entry for newly found PDFs
@@ -360,15 +932,16 @@ class WorklistManager:
                 'mapped_paper': bib_key,
                 'has_text': False,
                 'newly_found': True,
-                'found_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                'found_date': self._now()
             }
+            self._by_status['pdfs'].setdefault('MAPPED', {})[pdf_file] = None
 
         # Add to mappings list
         mapping = {
             'bib_key': bib_key,
             'pdf_file': pdf_file,
             'confidence': confidence,
-            'verified_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            'verified_date': self._now()
         }
         if notes:
             mapping['notes'] = notes
@@ -376,38 +949,34 @@ class WorklistManager:
             mapping['found'] = True
 
         self.data['mappings'].append(mapping)
+        self._mapping_by_bib.setdefault(bib_key, []).append(mapping)
+        self._mapping_by_pdf.setdefault(pdf_file, []).append(mapping)
         self.data['metadata']['mapped_count'] = len(self.data['mappings'])
-        self.save()
+        self._mark_dirty()
 
+    @_journaled
     def remove_mapping(self, bib_key: str):
         """Remove a mapping."""
-        # Find the mapping
-        mapping_to_remove = None
-        for mapping in self.data['mappings']:
-            if mapping['bib_key'] == bib_key:
-                mapping_to_remove = mapping
-                break
+        mapping_to_remove = self._pop_mapping(bib_key=bib_key)
 
         if mapping_to_remove:
             pdf_file = mapping_to_remove['pdf_file']
 
             # Update paper entry
             if bib_key in self.data['papers']:
-                self.data['papers'][bib_key]['status'] = 'NOT_INVESTIGATED'
+                self._set_entry_status('papers', bib_key, 'NOT_INVESTIGATED')
                 self.data['papers'][bib_key]['mapped_pdf'] = None
 
             # Update PDF entry
             if pdf_file in self.data['pdfs']:
-                self.data['pdfs'][pdf_file]['status'] = 'NOT_INVESTIGATED'
+                self._set_entry_status('pdfs', pdf_file, 'NOT_INVESTIGATED')
                 self.data['pdfs'][pdf_file]['mapped_paper'] = None
 
-            # Remove from mappings
-            self.data['mappings'].remove(mapping_to_remove)
-            self.data['metadata']['mapped_count'] = len(self.data['mappings'])
-            self.save()
+            self._mark_dirty()
             return True
         return False
 
+    @_journaled
     def delete_entry(self, item_type: str, key: str) -> bool:
         """Delete an entry completely from the worklist."""
         collection = self.data.get(item_type)
@@ -416,68 +985,42 @@ class WorklistManager:
 
         # If it's a paper entry, remove any mapping first
         if item_type == 'papers':
-            # Remove mapping if exists
-            mapping_to_remove = None
-            for mapping in self.data['mappings']:
-                if mapping['bib_key'] == key:
-                    mapping_to_remove = mapping
-                    break
-
+            mapping_to_remove = self._pop_mapping(bib_key=key)
             if mapping_to_remove:
                 pdf_file = mapping_to_remove['pdf_file']
                 # Update PDF entry
                 if pdf_file in self.data['pdfs']:
-                    self.data['pdfs'][pdf_file]['status'] = 'NOT_INVESTIGATED'
+                    self._set_entry_status('pdfs', pdf_file, 'NOT_INVESTIGATED')
                     self.data['pdfs'][pdf_file]['mapped_paper'] = None
-                # Remove mapping
-                self.data['mappings'].remove(mapping_to_remove)
-                self.data['metadata']['mapped_count'] = len(self.data['mappings'])
 
         # If it's a PDF entry, remove any mapping first
         if item_type == 'pdfs':
-            # Remove mapping if exists
-            mapping_to_remove = None
-            for mapping in self.data['mappings']:
-                if mapping['pdf_file'] == key:
-                    mapping_to_remove = mapping
-                    break
-
+            mapping_to_remove = self._pop_mapping(pdf_file=key)
             if mapping_to_remove:
-                bib_key = mapping_to_remove['bib_key']
+                bib_key = self._mapping_paper_key(mapping_to_remove)
                 # Update paper entry
                 if bib_key in self.data['papers']:
-                    self.data['papers'][bib_key]['status'] = 'NOT_INVESTIGATED'
+                    self._set_entry_status('papers', bib_key, 'NOT_INVESTIGATED')
                     self.data['papers'][bib_key]['mapped_pdf'] = None
-                # Remove mapping
-                self.data['mappings'].remove(mapping_to_remove)
-                self.data['metadata']['mapped_count'] = len(self.data['mappings'])
 
         # Delete the entry
+        self._drop_from_indexes(item_type, key)
         del collection[key]
-        self.save()
+        self._mark_dirty()
         return True
 
     def get_stats(self) -> Dict:
         """Get overall statistics."""
-        stats = {
+        # Status counts come straight from the reverse indexes, so this is
+        # O(#distinct statuses) rather than a scan over every entry.
+        return {
             'total_papers': len(self.data['papers']),
             'total_pdfs': len(self.data['pdfs']),
             'mapped': len(self.data['mappings']),
-            'papers_status': {},
-            'pdf_status': {}
+            'papers_status': {s: len(keys) for s, keys in self._by_status['papers'].items() if keys},
+            'pdf_status': {s: len(keys) for s, keys in self._by_status['pdfs'].items() if keys}
         }
 
-        # Count by status
-        for entry in self.data['papers'].values():
-            status = entry['status']
-            stats['papers_status'][status] = stats['papers_status'].get(status, 0) + 1
-
-        for entry in self.data['pdfs'].values():
-            status = entry['status']
-            stats['pdf_status'][status] = stats['pdf_status'].get(status, 0) + 1
-
-        return stats
-
     def search(self, item_type: str, field: str, query: str) -> List[Tuple[str, Dict]]:
         """Search entries by field."""
         results = []
@@ -485,90 +1028,189 @@ class WorklistManager:
         if not collection:
             return results
 
-        # Split query into words and make lowercase for case-insensitive search
-        query_words = query.lower().split()
+        lowered, doc_freq = self._get_lower_cache(item_type, field)
+
+        # Split query into words and make lowercase for case-insensitive
+        # search; probe the rarest word first so all() bails out early.
+        query_words = sorted(query.lower().split(), key=lambda w: doc_freq.get(w, 0))
 
-        for key, entry in collection.items():
-            if field in entry and entry[field]:
-                field_value_lower = str(entry[field]).lower()
-                # Check that ALL query words are present in the field (non-contiguous)
-                if all(word in field_value_lower for word in query_words):
-                    results.append((key, entry))
+        for key, field_value_lower in lowered.items():
+            # Check that ALL query words are present in the field (non-contiguous)
+            if all(word in field_value_lower for word in query_words):
+                results.append((key, collection[key]))
 
         return results
 
+    def _get_lower_cache(self, item_type: str, field: str) -> Tuple[Dict[str, str], Dict[str, int]]:
+        """Lowercased field values plus word document-frequencies, cached.
+
+        Built once per (item type, field) pair and invalidated on any
+        mutation, so repeated searches skip the per-entry lowercasing.
+        """
+        cached = self._lower_cache.get((item_type, field))
+        if cached is None:
+            lowered = {}
+            doc_freq: Dict[str, int] = {}
+            for key, entry in self.data[item_type].items():
+                if field in entry and entry[field]:
+                    value = str(entry[field]).lower()
+                    lowered[key] = value
+                    for word in set(value.split()):
+                        doc_freq[word] = doc_freq.get(word, 0) + 1
+            cached = (lowered, doc_freq)
+            self._lower_cache[(item_type, field)] = cached
+        return cached
+
     def find_similar(self, item_type: str, key: str) -> List[Tuple[str, float]]:
-        """Find potentially similar entries."""
+        """Find potentially similar entries.
+
+        Memoized until the next mutation, like suggest_matches_for_pdf.
+        """
         collection = self.data.get(item_type)
         if not collection or key not in collection:
             return []
 
-        target = collection[key]
+        cached = self._similar_cache.get((item_type, key))
+        if cached is not None:
+            return list(cached)
+
         results = []
 
         if item_type == 'papers':
-            target_title = target.get('title', '').lower()
-            target_authors = target.get('authors', '').lower()
-
-            for other_key, other in collection.items():
-                if other_key == key:
-                    continue
+            shingles = self._get_paper_shingles()
+            target_title, target_authors = shingles[key]
+
+            # Below the LSH threshold, scan everything: a few hundred
+            # C-level set intersections beat any pruning and can't lose
+            # a match. The banded index engages once the corpus is big
+            # enough for candidate retrieval to pay for itself.
+            if len(shingles) >= _LSH_MIN_PAPERS:
+                candidates = self._lsh_candidates(key)
+            else:
+                candidates = (k for k in shingles if k != key)
 
-                other_title = other.get('title', '').lower()
-                other_authors = other.get('authors', '').lower()
+            for other_key in candidates:
+                other_title, other_authors = shingles[other_key]
 
-                # Calculate similarity
-                title_sim = SequenceMatcher(None, target_title, other_title).ratio()
-                author_sim = SequenceMatcher(None, target_authors, other_authors).ratio()
+                # Calculate similarity via bigram-set Dice coefficients
+                title_sim = _dice(target_title, other_title)
+                author_sim = _dice(target_authors, other_authors)
 
                 combined_sim = (title_sim * 0.7 + author_sim * 0.3)
 
                 if combined_sim > 0.5:
                     results.append((other_key, combined_sim))
 
-        return sorted(results, key=lambda x: x[1], reverse=True)[:5]
+        result = sorted(results, key=lambda x: x[1], reverse=True)[:5]
+        self._similar_cache[(item_type, key)] = result
+        return list(result)
+
+    def _get_paper_shingles(self) -> Dict[str, Tuple[frozenset, frozenset]]:
+        """Per-paper (title, authors) bigram sets, computed once and reused."""
+        if self._paper_shingles is None:
+            self._paper_shingles = {
+                k: (_bigrams(v.get('title', '').lower()),
+                    _bigrams(v.get('authors', '').lower()))
+                for k, v in self.data['papers'].items()
+            }
+        return self._paper_shingles
+
+    def _get_similar_lsh(self):
+        """Banded-minhash index over paper shingles for candidate retrieval.
+
+        Each paper gets a minhash signature of its title+author bigrams;
+        papers sharing any band of the signature land in the same bucket,
+        so find_similar only scores bucket-mates instead of the whole
+        corpus. Built lazily once per data generation, like the other
+        derived indexes, and kept warm by the daemon.
+        """
+        if self._similar_lsh is None:
+            signatures = {}
+            buckets = {}
+            for key, (title, authors) in self._get_paper_shingles().items():
+                shingle_set = title | authors
+                if not shingle_set:
+                    signatures[key] = None
+                    continue
+                hashes = [_shingle_hash(s) for s in shingle_set]
+                sig = tuple(min((a * h + b) % _LSH_PRIME for h in hashes)
+                            for a, b in _LSH_COEFFS)
+                signatures[key] = sig
+                for band in range(_LSH_BANDS):
+                    band_key = (band, sig[band * _LSH_ROWS:(band + 1) * _LSH_ROWS])
+                    buckets.setdefault(band_key, []).append(key)
+            self._similar_lsh = (signatures, buckets)
+        return self._similar_lsh
+
+    def _lsh_candidates(self, key: str):
+        """Paper keys sharing at least one LSH band with the given paper."""
+        signatures, buckets = self._get_similar_lsh()
+        sig = signatures.get(key)
+        if sig is None:
+            return ()
+        candidates = set()
+        for band in range(_LSH_BANDS):
+            band_key = (band, sig[band * _LSH_ROWS:(band + 1) * _LSH_ROWS])
+            candidates.update(buckets.get(band_key, ()))
+        candidates.discard(key)
+        return candidates
 
     def get_unmapped(self) -> Dict[str, List[str]]:
-        """Get all unmapped items."""
-        unmapped = {
-            'papers': [],
-            'pdfs': []
-        }
-
-        for key, entry in self.data['papers'].items():
-            if entry['status'] != 'MAPPED':
-                unmapped['papers'].append(key)
-
-        for key, entry in self.data['pdfs'].items():
-            if entry['status'] != 'MAPPED':
-                unmapped['pdfs'].append(key)
-
+        """Get all unmapped items, straight from the status indexes."""
+        unmapped = {}
+        for item_type in ('papers', 'pdfs'):
+            keys = []
+            for status, bucket in self._by_status[item_type].items():
+                if status != 'MAPPED':
+                    keys.extend(bucket)
+            unmapped[item_type] = keys
         return unmapped
 
-    def export_mappings(self, output_path: str = "mapping.json"):
-        """Export final mappings."""
-        mappings = {}
+    def _iter_export_mappings(self):
+        """Yield (bib_key, export entry) pairs, one small dict at a time."""
+        # Resolve which mapping wins per paper key up front (the last one,
+        # matching the old dict-overwrite behavior); NO_PDF papers follow.
+        winners = {}
         for mapping in self.data['mappings']:
-            bib_key = mapping['bib_key']
-            mappings[bib_key] = {
+            winners[self._mapping_paper_key(mapping)] = mapping
+
+        # Entries with no PDF; these shadow any stale mapping for the key
+        no_pdf = set(self._by_status['papers'].get('NO_PDF', ()))
+
+        for bib_key, mapping in winners.items():
+            if bib_key in no_pdf:
+                continue
+            yield bib_key, {
                 'pdf': mapping['pdf_file'],
                 'confidence': mapping.get('confidence', 'unknown'),
                 'verified_date': mapping.get('verified_date')
             }
 
-        # Add entries with no PDF
-        for key, entry in self.data['papers'].items():
-            if entry['status'] == 'NO_PDF':
-                mappings[key] = {
-                    'pdf': None,
-                    'confidence': 0,
-                    'notes': 'No PDF found'
-                }
+        for key in no_pdf:
+            yield key, {
+                'pdf': None,
+                'confidence': 0,
+                'notes': 'No PDF found'
+            }
+
+    def export_mappings(self, output_path: str = "mapping.json"):
+        """Export final mappings, streaming one entry at a time.
 
+        Writing entry by entry keeps peak memory at one small dict plus
+        its serialized form, rather than the whole export at once.
+        """
+        count = 0
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(mappings, f, indent=2, ensure_ascii=False)
+            f.write('{')
+            for bib_key, entry in self._iter_export_mappings():
+                serialized = json.dumps(entry, indent=2, ensure_ascii=False)
+                f.write(',' if count else '')
+                f.write('\n  %s: %s' % (json.dumps(bib_key, ensure_ascii=False),
+                                        serialized.replace('\n', '\n  ')))
+                count += 1
+            f.write('\n}' if count else '}')
 
-        return len(mappings)
+        return count
 
     def get_pdf_extract(self, pdf_name: str) -> Optional[str]:
         """Get the extracted text for a PDF."""
@@ -576,128 +1218,198 @@ class WorklistManager:
             return self.pdf_extracts[pdf_name].get('text')
         return None
 
+    def _get_match_features(self) -> Dict[str, Tuple[tuple, tuple, str]]:
+        """Per-paper (significant title words, author last names, year) for matching.
+
+        Derived once from the papers collection and cached; invalidated on
+        any mutation.
+        """
+        if self._match_features is None:
+            features = {}
+            for bib_key, bib_entry in self.data['papers'].items():
+                title_words = bib_entry.get('title', '').lower().split()
+                # Interning dedupes the many shared tokens across titles and
+                # lets membership checks hit the pointer-equality fast path
+                sig_words = tuple(sys.intern(w) for w in title_words if len(w) > 4)[:5]
+
+                last_names = tuple(n for n in _extract_last_names(bib_entry.get('authors', ''))
+                                   if len(n) > 3)
+
+                features[bib_key] = (sig_words, last_names, bib_entry.get('year', ''))
+            self._match_features = features
+        return self._match_features
+
+    def _get_needle_postings(self) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+        """Inverted needle -> paper-key postings for title words and last names.
+
+        One paper key per needle occurrence, so per-paper hit counts fall
+        out of walking the postings of the needles found in a PDF prefix.
+        """
+        if self._needle_postings is None:
+            title_postings: Dict[str, List[str]] = {}
+            author_postings: Dict[str, List[str]] = {}
+            for bib_key, (sig_words, last_names, _year) in self._get_match_features().items():
+                for word in sig_words:
+                    title_postings.setdefault(word, []).append(bib_key)
+                for name in last_names:
+                    author_postings.setdefault(name, []).append(bib_key)
+            self._needle_postings = (title_postings, author_postings)
+        return self._needle_postings
+
     def suggest_matches_for_pdf(self, pdf_name: str, max_suggestions: int = 5) -> List[Tuple[str, Dict, float]]:
-        """Suggest potential paper matches for a PDF."""
+        """Suggest potential paper matches for a PDF.
+
+        Results are memoized until the next mutation, so re-investigating
+        the same PDF (or a long-lived daemon serving repeated calls) costs
+        a dict lookup.
+        """
+        cache_key = (pdf_name, max_suggestions)
+        cached = self._suggest_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
         pdf_text = self.get_pdf_extract(pdf_name)
         if not pdf_text:
             return []
 
-        # Extract key info from PDF text (first 1000 chars usually has title/authors)
-        pdf_text_lower = pdf_text[:1500].lower()
-        suggestions = []
-
-        for bib_key, bib_entry in self.data['papers'].items():
-            if bib_entry['status'] == 'MAPPED':
-                continue
-
-            score = 0.0
-            matches = []
-
-            # Check title similarity
-            if bib_entry.get('title'):
-                title_words = bib_entry['title'].lower().split()
-                # Count significant title words in PDF
-                significant_words = [w for w in title_words if len(w) > 4][:5]
-                title_matches = sum(1 for w in significant_words if w in pdf_text_lower)
-                if title_matches >= 3:
-                    score += title_matches * 0.3
-                    matches.append(f"title:{title_matches} words")
-
-            # Check authors
-            if bib_entry.get('authors'):
-                authors = bib_entry['authors'].lower()
-                # Extract last names
-                author_parts = authors.split(' and ')
-                author_matches = 0
-                for author in author_parts[:3]:  # Check first 3 authors
-                    # Get last name
-                    if ',' in author:
-                        last_name = author.split(',')[0].strip()
-                    else:
-                        parts = author.strip().split()
-                        last_name = parts[-1] if parts else ''
-                    last_name = re.sub(r'[\\{}\"\']', '', last_name)
-                    if len(last_name) > 3 and last_name in pdf_text_lower:
-                        author_matches += 1
-
-                if author_matches > 0:
-                    score += author_matches * 0.2
-                    matches.append(f"authors:{author_matches}")
-
-            # Check year
-            if bib_entry.get('year'):
-                if bib_entry['year'] in pdf_text[:2000]:
-                    score += 0.2
-                    matches.append('year')
-
-            if score > 0.3:
-                suggestions.append((bib_key, bib_entry, score, matches))
-
-        # Sort by score
-        suggestions.sort(key=lambda x: x[2], reverse=True)
-        return [(k, e, s) for k, e, s, m in suggestions[:max_suggestions]]
+        # Extract key info from the PDF text prefix (the first couple of
+        # thousand chars usually have title/authors/year); lowercase it
+        # once and reuse it for every probe below.
+        prefix_lower = pdf_text[:2000].lower()
+        title_postings, author_postings = self._get_needle_postings()
+        papers = self.data['papers']
+        mapped_keys = self._by_status['papers'].get('MAPPED', {})
+
+        scored = _score_pdf_prefix(prefix_lower, title_postings, author_postings,
+                                   self._get_match_features(), mapped_keys,
+                                   max_suggestions)
+        result = [(k, papers[k], s) for k, s in scored]
+        self._suggest_cache[cache_key] = result
+        return list(result)
 
     def auto_map_obvious(self) -> List[Tuple[str, str]]:
         """Automatically map obvious matches based on filename patterns."""
         mapped = []
 
-        for bib_key, bib_entry in self.data['papers'].items():
-            if bib_entry['status'] != 'NOT_INVESTIGATED':
-                continue
+        with self.batch():
+            self._auto_map_obvious(mapped)
 
-            # Extract first author's last name and year
-            authors = bib_entry.get('authors', '')
-            year = bib_entry.get('year', '')
+        return mapped
 
-            if not authors or not year:
+    def _get_paper_matchkeys(self) -> Dict[str, Tuple[str, str, list]]:
+        """Per-paper (first-author last name, year, significant title words).
+
+        Cached alongside the other derived match data and invalidated on
+        any mutation.
+        """
+        if self._paper_matchkeys is None:
+            matchkeys = {}
+            for bib_key, bib_entry in self.data['papers'].items():
+                # Get first author's last name
+                names = _extract_last_names(bib_entry.get('authors', ''), 1)
+                last_name = names[0] if names else ''
+
+                title_words = bib_entry.get('title', '').lower().split()
+                significant_words = [sys.intern(w) for w in title_words if len(w) > 4][:3]
+                matchkeys[bib_key] = (last_name, bib_entry.get('year', ''), significant_words)
+            self._paper_matchkeys = matchkeys
+        return self._paper_matchkeys
+
+    def _get_pdf_prefixes(self) -> Dict[str, str]:
+        """Lowercased 500-char extract prefix per PDF, built once and cached."""
+        if self._pdf_prefixes is None:
+            self._pdf_prefixes = {
+                p: (self.pdf_extracts.get(p, {}).get('text') or '')[:500].lower()
+                for p in self.data['pdfs']
+            }
+        return self._pdf_prefixes
+
+    def _auto_map_obvious(self, mapped: List[Tuple[str, str]]):
+        """Inner loop of auto_map_obvious, run inside a batch().
+
+        Instead of scanning every PDF for every paper, the filenames of
+        NOT_INVESTIGATED PDFs are tokenized once and indexed by
+        (word, year) pairs; each paper then joins against that index by
+        its (first-author last name, year) key.
+        """
+        matchkeys = self._get_paper_matchkeys()
+        prefixes = self._get_pdf_prefixes()
+
+        # (token, year) -> PDF names containing both, in worklist order
+        pair_index: Dict[Tuple[str, str], List[str]] = {}
+        for pdf_name in self._by_status['pdfs'].get('NOT_INVESTIGATED', ()):
+            tokens = _FILENAME_TOKENS.findall(pdf_name.lower())
+            words = {t for t in tokens if not t.isdigit()}
+            years = {t for t in tokens if t.isdigit()}
+            for word in words:
+                for year in years:
+                    pair_index.setdefault((word, year), []).append(pdf_name)
+
+        # Copy the bucket: successful mappings mutate it mid-loop
+        for bib_key in list(self._by_status['papers'].get('NOT_INVESTIGATED', ())):
+            last_name, year, significant_words = matchkeys[bib_key]
+            if not last_name or not year:
                 continue
 
-            # Get first author's last name
-            first_author = authors.split(' and ')[0].strip()
-            # Handle various name formats
-            if ',' in first_author:
-                last_name = first_author.split(',')[0].strip()
-            else:
-                parts = first_author.split()
-                last_name = parts[-1] if parts else ''
+            for pdf_name in pair_index.get((last_name, year), ()):
+                if self.data['pdfs'][pdf_name]['status'] != 'NOT_INVESTIGATED':
+                    continue
 
-            last_name = last_name.lower()
-            # Remove LaTeX formatting
-            last_name = re.sub(r'[\\{}\"\']', '', last_name)
+                # Additional validation - check title similarity if available
+                pdf_text = prefixes.get(pdf_name)
+                if pdf_text:
+                    # Check if significant title words appear in PDF
+                    matches = sum(1 for w in significant_words if w in pdf_text)
 
-            # Look for matching PDFs
-            for pdf_name, pdf_entry in self.data['pdfs'].items():
-                if pdf_entry['status'] != 'NOT_INVESTIGATED':
-                    continue
+                    if matches >= 2:
+                        self.create_mapping(bib_key, pdf_name, confidence="auto-high")
+                        mapped.append((bib_key, pdf_name))
+                        break
 
-                pdf_lower = pdf_name.lower()
 
-                # Check if author name and year are in filename
-                if last_name in pdf_lower and year in pdf_lower:
-                    # Additional validation - check title similarity if available
-                    if self.pdf_extracts.get(pdf_name, {}).get('text'):
-                        pdf_text = self.pdf_extracts[pdf_name]['text'][:500].lower()
-                        title_words = bib_entry.get('title', '').lower().split()
+# Shared option types, instantiated once instead of per command
+ITEM_TYPE = click.Choice(['papers', 'pdfs'])
+STATUS_CHOICE = click.Choice(['NOT_INVESTIGATED', 'INVESTIGATING', 'MAPPED', 'NO_PDF',
+                              'NO_BIBTEX', 'MULTIPLE_CANDIDATES'])
 
-                        # Check if significant title words appear in PDF
-                        significant_words = [w for w in title_words if len(w) > 4][:3]
-                        matches = sum(1 for w in significant_words if w in pdf_text)
 
-                        if matches >= 2:
-                            self.create_mapping(bib_key, pdf_name, confidence="auto-high")
-                            mapped.append((bib_key, pdf_name))
-                            break
+class _LazyContextObj(dict):
+    """ctx.obj mapping that builds the WorklistManager on first access.
 
-        return mapped
+    Commands (and paths like `subcommand --help` or usage errors) that
+    never read ctx.obj['manager'] skip the worklist parse entirely; the
+    existing `ctx.obj['manager']` call sites need no changes.
+    """
+
+    def __missing__(self, key):
+        if key == 'manager':
+            manager = WorklistManager()
+            self['manager'] = manager
+            return manager
+        raise KeyError(key)
+
+
+def _emit_json(payload):
+    """Print a value as one line of machine-readable JSON."""
+    if orjson is not None:
+        click.echo(orjson.dumps(payload).decode('utf-8'))
+    else:
+        click.echo(json.dumps(payload, ensure_ascii=False))
 
 
 # Create the CLI
 @click.group()
+@click.option('--json', 'as_json', is_flag=True,
+              help='Emit machine-readable JSON instead of formatted text')
 @click.pass_context
-def cli(ctx):
+def cli(ctx, as_json):
     """Worklist management tool for paper-to-PDF mapping."""
     ctx.ensure_object(dict)
-    ctx.obj['manager'] = WorklistManager()
+    # The daemon pre-populates ctx.obj with its long-lived manager
+    if 'manager' not in ctx.obj:
+        ctx.obj = _LazyContextObj(ctx.obj)
+    # Set unconditionally: the daemon reuses ctx.obj across invocations
+    ctx.obj['as_json'] = as_json
 
 @cli.group()
 def paper():
@@ -766,12 +1478,32 @@ def paper_set_extracted_info(ctx, bib_key, json_file_path):
 
 @paper.command('list-with-markdown')
 @click.option('--status', default='MAPPED', help='Filter by paper status (default: MAPPED)')
+@click.option('--with-details', is_flag=True,
+              help='Emit one JSON object per line, joined with the mapped PDF, '
+                   'instead of bare keys')
 @click.pass_context
-def paper_list_with_markdown(ctx, status):
-    """List paper entries that have associated markdown files."""
+def paper_list_with_markdown(ctx, status, with_details):
+    """List paper entries that have associated markdown files.
+
+    With --with-details the join against the PDF entry happens here, so
+    callers get everything in one invocation instead of forking this CLI
+    again per key for the paper and PDF records.
+    """
     manager = ctx.obj['manager']
     results = manager.get_paper_with_markdown(status)
 
+    if with_details:
+        pdfs = manager.data['pdfs']
+        for bib_key, entry in results:
+            mapped_pdf = entry['mapped_pdf']
+            click.echo(json.dumps({
+                'bib_key': bib_key,
+                'mapped_pdf': mapped_pdf,
+                'extracted_paper_info': entry.get('extracted_paper_info'),
+                'markdown_file': pdfs[mapped_pdf].get('markdown_file'),
+            }))
+        return
+
     if results:
         for bib_key, entry in results:
             click.echo(bib_key)
@@ -853,7 +1585,7 @@ def tags():
     pass
 
 @tags.command('add')
-@click.argument('item_type', type=click.Choice(['papers', 'pdfs']))
+@click.argument('item_type', type=ITEM_TYPE)
 @click.argument('key')
 @click.argument('tags', nargs=-1, required=True)
 @click.pass_context
@@ -866,7 +1598,7 @@ def tags_add(ctx, item_type, key, tags):
         click.echo(f"Error: {key} not found in {item_type}", err=True)
 
 @tags.command('remove')
-@click.argument('item_type', type=click.Choice(['papers', 'pdfs']))
+@click.argument('item_type', type=ITEM_TYPE)
 @click.argument('key')
 @click.argument('tags', nargs=-1, required=True)
 @click.pass_context
@@ -879,7 +1611,7 @@ def tags_remove(ctx, item_type, key, tags):
         click.echo(f"Error: {key} not found in {item_type}", err=True)
 
 @tags.command('set')
-@click.argument('item_type', type=click.Choice(['papers', 'pdfs']))
+@click.argument('item_type', type=ITEM_TYPE)
 @click.argument('key')
 @click.argument('tags', nargs=-1, required=True)
 @click.pass_context
@@ -892,7 +1624,7 @@ def tags_set(ctx, item_type, key, tags):
         click.echo(f"Error: {key} not found in {item_type}", err=True)
 
 @tags.command('get')
-@click.argument('item_type', type=click.Choice(['papers', 'pdfs']))
+@click.argument('item_type', type=ITEM_TYPE)
 @click.argument('key')
 @click.pass_context
 def tags_get(ctx, item_type, key):
@@ -900,7 +1632,9 @@ def tags_get(ctx, item_type, key):
     manager = ctx.obj['manager']
     tags = manager.get_tags(item_type, key)
     if tags is not None:
-        if tags:
+        if ctx.obj.get('as_json'):
+            _emit_json(tags)
+        elif tags:
             click.echo(', '.join(tags))
         else:
             click.echo("No tags")
@@ -908,7 +1642,7 @@ def tags_get(ctx, item_type, key):
         click.echo(f"Error: {key} not found in {item_type}", err=True)
 
 @tags.command('list')
-@click.argument('item_type', type=click.Choice(['papers', 'pdfs']))
+@click.argument('item_type', type=ITEM_TYPE)
 @click.argument('tag')
 @click.pass_context
 def tags_list(ctx, item_type, tag):
@@ -922,7 +1656,7 @@ def tags_list(ctx, item_type, tag):
         click.echo(f"No {item_type} items found with tag: {tag}")
 
 @tags.command('rename')
-@click.argument('item_type', type=click.Choice(['papers', 'pdfs']))
+@click.argument('item_type', type=ITEM_TYPE)
 @click.argument('old_tag')
 @click.argument('new_tag')
 @click.pass_context
@@ -935,6 +1669,37 @@ def tags_rename(ctx, item_type, old_tag, new_tag):
     else:
         click.echo(f"No {item_type} items found with tag: {old_tag}")
 
+@tags.command('batch')
+@click.option('--from-file', 'source', type=click.File('r'), default='-',
+              help='TSV of op, item_type, key, comma-separated tags (default: stdin)')
+@click.pass_context
+def tags_batch(ctx, source):
+    """Apply many tag operations in one load/save cycle.
+
+    Each line: add|remove|set <TAB> papers|pdfs <TAB> key <TAB> tag1,tag2
+    Pipe a file in rather than looping over `tags add` in the shell.
+    """
+    manager = ctx.obj['manager']
+    handlers = {'add': manager.add_tags, 'remove': manager.remove_tags,
+                'set': manager.set_tags}
+    total = applied = 0
+    with manager.batch():
+        for lineno, line in enumerate(source, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            parts = line.split('\t')
+            if len(parts) != 4 or parts[0] not in handlers or parts[1] not in ('papers', 'pdfs'):
+                click.echo(f"Error: bad batch line {lineno}: {line}", err=True)
+                sys.exit(1)
+            op, item_type, key, tag_field = parts
+            total += 1
+            if handlers[op](item_type, key, [t for t in tag_field.split(',') if t]):
+                applied += 1
+            else:
+                click.echo(f"Warning: {key} not found in {item_type} (line {lineno})", err=True)
+    click.echo(f"Applied {applied}/{total} tag operations")
+
 @cli.group()
 def awards():
     """Award management commands for paper entries."""
@@ -984,22 +1749,54 @@ def awards_get(ctx, bib_key):
     manager = ctx.obj['manager']
     awards = manager.get_awards(bib_key)
     if awards is not None:
-        if awards:
+        if ctx.obj.get('as_json'):
+            _emit_json(awards)
+        elif awards:
             click.echo(', '.join(awards))
         else:
             click.echo("No awards")
     else:
         click.echo(f"Error: {bib_key} not found in paper", err=True)
 
+@awards.command('batch')
+@click.option('--from-file', 'source', type=click.File('r'), default='-',
+              help='TSV of op, bib_key, comma-separated awards (default: stdin)')
+@click.pass_context
+def awards_batch(ctx, source):
+    """Apply many award operations in one load/save cycle.
+
+    Each line: add|remove|set <TAB> bib_key <TAB> award1,award2
+    """
+    manager = ctx.obj['manager']
+    handlers = {'add': manager.add_awards, 'remove': manager.remove_awards,
+                'set': manager.set_awards}
+    total = applied = 0
+    with manager.batch():
+        for lineno, line in enumerate(source, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            parts = line.split('\t')
+            if len(parts) != 3 or parts[0] not in handlers:
+                click.echo(f"Error: bad batch line {lineno}: {line}", err=True)
+                sys.exit(1)
+            op, bib_key, award_field = parts
+            total += 1
+            if handlers[op](bib_key, [a for a in award_field.split(',') if a]):
+                applied += 1
+            else:
+                click.echo(f"Warning: {bib_key} not found in papers (line {lineno})", err=True)
+    click.echo(f"Applied {applied}/{total} award operations")
+
 @cli.group()
 def status():
     """Status management commands."""
     pass
 
 @status.command('update')
-@click.argument('item_type', type=click.Choice(['papers', 'pdfs']))
+@click.argument('item_type', type=ITEM_TYPE)
 @click.argument('key')
-@click.argument('new_status', type=click.Choice(['NOT_INVESTIGATED', 'INVESTIGATING', 'MAPPED', 'NO_PDF', 'NO_BIBTEX', 'MULTIPLE_CANDIDATES']))
+@click.argument('new_status', type=STATUS_CHOICE)
 @click.pass_context
 def status_update(ctx, item_type, key, new_status):
     """Update the status of an item."""
@@ -1009,8 +1806,37 @@ def status_update(ctx, item_type, key, new_status):
     else:
         click.echo(f"Error: {key} not found in {item_type}", err=True)
 
+@status.command('batch-update')
+@click.option('--from-file', 'source', type=click.File('r'), default='-',
+              help='TSV of item_type, key, status (default: stdin)')
+@click.pass_context
+def status_batch_update(ctx, source):
+    """Update many statuses in one load/save cycle.
+
+    Each line: papers|pdfs <TAB> key <TAB> STATUS
+    """
+    manager = ctx.obj['manager']
+    valid_statuses = set(STATUS_CHOICE.choices)
+    total = applied = 0
+    with manager.batch():
+        for lineno, line in enumerate(source, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            parts = line.split('\t')
+            if len(parts) != 3 or parts[0] not in ('papers', 'pdfs') or parts[2] not in valid_statuses:
+                click.echo(f"Error: bad batch line {lineno}: {line}", err=True)
+                sys.exit(1)
+            item_type, key, new_status = parts
+            total += 1
+            if manager.update_status(item_type, key, new_status):
+                applied += 1
+            else:
+                click.echo(f"Warning: {key} not found in {item_type} (line {lineno})", err=True)
+    click.echo(f"Updated {applied}/{total} statuses")
+
 @status.command('get')
-@click.argument('item_type', type=click.Choice(['papers', 'pdfs']))
+@click.argument('item_type', type=ITEM_TYPE)
 @click.argument('key')
 @click.pass_context
 def status_get(ctx, item_type, key):
@@ -1028,7 +1854,7 @@ def next():
     pass
 
 @next.command('uninvestigated')
-@click.argument('item_type', type=click.Choice(['papers', 'pdfs']))
+@click.argument('item_type', type=ITEM_TYPE)
 @click.pass_context
 def next_uninvestigated(ctx, item_type):
     """Get next NOT_INVESTIGATED item."""
@@ -1038,16 +1864,17 @@ def next_uninvestigated(ctx, item_type):
         key, entry = result
         click.echo(f"Next uninvestigated: {key}")
         if item_type == 'papers':
-            click.echo(f"  Title: {entry.get('title', 'N/A')[:80]}")
-            click.echo(f"  Authors: {entry.get('authors', 'N/A')[:80]}")
-            click.echo(f"  Year: {entry.get('year', 'N/A')}")
+            display = manager.get_paper_display(key)
+            click.echo(f"  Title: {display['title80']}")
+            click.echo(f"  Authors: {display['authors80']}")
+            click.echo(f"  Year: {display['year']}")
         else:
             click.echo(f"  Has text: {entry.get('has_text', False)}")
     else:
         click.echo(f"No uninvestigated items in {item_type}")
 
 @next.command('by-status')
-@click.argument('item_type', type=click.Choice(['papers', 'pdfs']))
+@click.argument('item_type', type=ITEM_TYPE)
 @click.argument('status')
 @click.pass_context
 def next_by_status(ctx, item_type, status):
@@ -1061,27 +1888,40 @@ def next_by_status(ctx, item_type, status):
         click.echo(f"No items with status {status} in {item_type}")
 
 @cli.command('list')
-@click.argument('item_type', type=click.Choice(['papers', 'pdfs']))
+@click.argument('item_type', type=ITEM_TYPE)
 @click.option('--status', help='Filter by status')
 @click.option('--limit', default=None, type=int, help='Limit number of results')
+@click.option('--count', is_flag=True, help='Print the total after the listing')
 @click.pass_context
-def list_items(ctx, item_type, status, limit):
-    """List keys, optionally filtered by status."""
-    manager = ctx.obj['manager']
-    keys = manager.list_keys(item_type, status)
+def list_items(ctx, item_type, status, limit, count):
+    """List keys, optionally filtered by status.
 
+    Keys are streamed as they come rather than materialized, so the first
+    line appears immediately even on a huge worklist.
+    """
+    import itertools
+
+    manager = ctx.obj['manager']
+    keys = manager.iter_keys(item_type, status)
     if limit:
-        keys = keys[:limit]
+        keys = itertools.islice(keys, limit)
 
-    if keys:
-        click.echo(f"Found {len(keys)} items:")
-        for key in keys:
-            click.echo(f"  - {key}")
-    else:
+    if ctx.obj.get('as_json'):
+        _emit_json(list(keys))
+        return
+
+    shown = 0
+    for key in keys:
+        click.echo(f"  - {key}")
+        shown += 1
+
+    if not shown:
         click.echo(f"No items found")
+    elif count:
+        click.echo(f"Found {shown} items")
 
 @cli.command('get')
-@click.argument('item_type', type=click.Choice(['papers', 'pdfs']))
+@click.argument('item_type', type=ITEM_TYPE)
 @click.argument('key')
 @click.pass_context
 def get_entry(ctx, item_type, key):
@@ -1089,12 +1929,12 @@ def get_entry(ctx, item_type, key):
     manager = ctx.obj['manager']
     entry = manager.get_entry(item_type, key)
     if entry:
-        click.echo(json.dumps(entry, indent=2))
+        click.echo(_dumps_json(entry))
     else:
         click.echo(f"Error: {key} not found in {item_type}", err=True)
 
 @cli.command('delete')
-@click.argument('item_type', type=click.Choice(['papers', 'pdfs']))
+@click.argument('item_type', type=ITEM_TYPE)
 @click.argument('key')
 @click.pass_context
 def delete_entry(ctx, item_type, key):
@@ -1149,7 +1989,7 @@ def map_auto(ctx):
         click.echo("No obvious matches found")
 
 @cli.command('search')
-@click.argument('item_type', type=click.Choice(['papers', 'pdfs']))
+@click.argument('item_type', type=ITEM_TYPE)
 @click.argument('field')
 @click.argument('query')
 @click.pass_context
@@ -1167,7 +2007,7 @@ def search(ctx, item_type, field, query):
         click.echo("No matches found")
 
 @cli.command('similar')
-@click.argument('item_type', type=click.Choice(['papers', 'pdfs']))
+@click.argument('item_type', type=ITEM_TYPE)
 @click.argument('key')
 @click.pass_context
 def similar(ctx, item_type, key):
@@ -1188,6 +2028,10 @@ def stats(ctx):
     manager = ctx.obj['manager']
     stats = manager.get_stats()
 
+    if ctx.obj.get('as_json'):
+        _emit_json(stats)
+        return
+
     click.echo("\n=== OVERALL STATISTICS ===")
     click.echo(f"Total paper entries: {stats['total_papers']}")
     click.echo(f"Total PDFs: {stats['total_pdfs']}")
@@ -1203,9 +2047,21 @@ def stats(ctx):
         pct = (count / stats['total_pdfs']) * 100
         click.echo(f"  {status}: {count} ({pct:.1f}%)")
 
+def _resolve_show_flag(flag, prompt):
+    """Flag value, or a confirm prompt only when attached to a terminal."""
+    if flag is not None:
+        return flag
+    if sys.stdin.isatty() and sys.stdout.isatty():
+        return click.confirm(prompt)
+    return False
+
 @cli.command('unmapped')
+@click.option('--show-papers/--no-show-papers', default=None,
+              help='List unmapped papers without prompting')
+@click.option('--show-pdfs/--no-show-pdfs', default=None,
+              help='List unmapped PDFs without prompting')
 @click.pass_context
-def unmapped(ctx):
+def unmapped(ctx, show_papers, show_pdfs):
     """Show unmapped items."""
     manager = ctx.obj['manager']
     unmapped = manager.get_unmapped()
@@ -1213,13 +2069,13 @@ def unmapped(ctx):
     click.echo(f"Unmapped paper entries: {len(unmapped['papers'])}")
     click.echo(f"Unmapped PDFs: {len(unmapped['pdfs'])}")
 
-    if click.confirm("Show unmapped paper entries?"):
+    if _resolve_show_flag(show_papers, "Show unmapped paper entries?"):
         for key in unmapped['papers'][:20]:
             click.echo(f"  - {key}")
         if len(unmapped['papers']) > 20:
             click.echo(f"  ... and {len(unmapped['papers']) - 20} more")
 
-    if click.confirm("Show unmapped PDFs?"):
+    if _resolve_show_flag(show_pdfs, "Show unmapped PDFs?"):
         for key in unmapped['pdfs'][:20]:
             click.echo(f"  - {key}")
         if len(unmapped['pdfs']) > 20:
@@ -1269,13 +2125,23 @@ def pdf_suggest(ctx, pdf_file, max):
     manager = ctx.obj['manager']
     suggestions = manager.suggest_matches_for_pdf(pdf_file, max)
 
+    if ctx.obj.get('as_json'):
+        _emit_json([
+            {'bib_key': bib_key, 'score': round(score, 4),
+             'title': entry.get('title'), 'authors': entry.get('authors'),
+             'year': entry.get('year')}
+            for bib_key, entry, score in suggestions
+        ])
+        return
+
     if suggestions:
         click.echo(f"Potential matches for {pdf_file}:\n")
         for i, (bib_key, entry, score) in enumerate(suggestions, 1):
+            display = manager.get_paper_display(bib_key)
             click.echo(f"{i}. {bib_key} (score: {score:.2f})")
-            click.echo(f"   Title: {entry.get('title', 'N/A')[:80]}")
-            click.echo(f"   Authors: {entry.get('authors', 'N/A')[:80]}")
-            click.echo(f"   Year: {entry.get('year', 'N/A')}")
+            click.echo(f"   Title: {display['title80']}")
+            click.echo(f"   Authors: {display['authors80']}")
+            click.echo(f"   Year: {display['year']}")
             click.echo()
     else:
         click.echo(f"No potential matches found for {pdf_file}")
@@ -1327,10 +2193,11 @@ def pdf_investigate(ctx, pdf_file, auto_map, threshold):
     if suggestions:
         click.echo(f"\n=== Potential Matches ===")
         for i, (bib_key, entry, score) in enumerate(suggestions, 1):
+            display = manager.get_paper_display(bib_key)
             click.echo(f"\n{i}. {bib_key} (score: {score:.2f})")
-            click.echo(f"   Title: {entry.get('title', 'N/A')}")
-            click.echo(f"   Authors: {entry.get('authors', 'N/A')[:100]}")
-            click.echo(f"   Year: {entry.get('year', 'N/A')}")
+            click.echo(f"   Title: {display['title']}")
+            click.echo(f"   Authors: {display['authors100']}")
+            click.echo(f"   Year: {display['year']}")
 
         # Auto-map if requested and high confidence
         if auto_map and suggestions[0][2] >= threshold:
@@ -1348,6 +2215,70 @@ def pdf_investigate(ctx, pdf_file, auto_map, threshold):
         click.echo("Recommendation: Mark as NO_BIBTEX with:")
         click.echo(f"  python paper_data_cli.py status update pdfs {pdf_file} NO_BIBTEX")
 
+@pdf.command('investigate-all')
+@click.option('--auto-map', is_flag=True, help='Create mappings for matches above the threshold')
+@click.option('--threshold', default=0.8, help='Confidence threshold for auto-mapping')
+@click.option('--jobs', default=None, type=int, help='Worker processes (default: CPU count)')
+@click.pass_context
+def pdf_investigate_all(ctx, auto_map, threshold, jobs):
+    """Score every unmapped PDF with text against the papers, in parallel.
+
+    Scoring is independent per PDF, so it fans out over a process pool;
+    mapping mutations are then applied serially in this process inside
+    one batch() so the worklist is written once.
+    """
+    import multiprocessing
+
+    manager = ctx.obj['manager']
+
+    tasks = []
+    for pdf_name, entry in manager.data['pdfs'].items():
+        if entry['status'] == 'MAPPED' or not entry.get('has_text'):
+            continue
+        text = manager.get_pdf_extract(pdf_name)
+        if text:
+            tasks.append((pdf_name, text[:2000].lower()))
+
+    if not tasks:
+        click.echo("No unmapped PDFs with extracted text")
+        return
+
+    title_postings, author_postings = manager._get_needle_postings()
+    initargs = (title_postings, author_postings, manager._get_match_features(),
+                frozenset(manager._by_status['papers'].get('MAPPED', ())))
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs > 1 and len(tasks) > 1:
+        with multiprocessing.Pool(jobs, initializer=_pool_init,
+                                  initargs=initargs) as pool:
+            results = list(pool.imap_unordered(_pool_score, tasks, chunksize=8))
+    else:
+        _pool_init(*initargs)
+        results = [_pool_score(task) for task in tasks]
+    results.sort()  # imap_unordered returns in completion order
+
+    auto_mapped = 0
+    with manager.batch():
+        for pdf_name, scored in results:
+            if not scored:
+                continue
+            best_key, best_score = scored[0]
+            click.echo(f"{pdf_name}: {best_key} (score: {best_score:.2f})")
+            if not auto_map or best_score < threshold:
+                continue
+            # Workers scored against a snapshot of the MAPPED set; skip
+            # papers another PDF claimed earlier in this same run.
+            if manager.data['papers'][best_key]['status'] == 'MAPPED':
+                continue
+            confidence = 'high' if best_score > 0.9 else 'medium' if best_score > 0.7 else 'low'
+            manager.create_mapping(best_key, pdf_name, confidence,
+                                   f"Auto-mapped via bulk investigation, score: {best_score:.2f}")
+            auto_mapped += 1
+            click.echo(f"  ✓ mapped to {best_key} (confidence: {confidence})")
+
+    click.echo(f"\nScored {len(tasks)} PDFs" +
+               (f", auto-mapped {auto_mapped}" if auto_map else ""))
+
 @cli.command('export')
 @click.option('--output', default='mapping.json', help='Output file path')
 @click.pass_context
@@ -1365,6 +2296,17 @@ def report(ctx):
     stats = manager.get_stats()
     unmapped = manager.get_unmapped()
 
+    if ctx.obj.get('as_json'):
+        _emit_json({
+            'created': manager.data['metadata']['created'],
+            'last_updated': manager.data['metadata']['last_updated'],
+            'stats': stats,
+            'unmapped_papers': len(unmapped['papers']),
+            'unmapped_pdfs': len(unmapped['pdfs']),
+            'no_pdf': manager.list_keys('papers', 'NO_PDF'),
+        })
+        return
+
     click.echo("\n" + "="*60)
     click.echo("WORKLIST MAPPING REPORT")
     click.echo("="*60)
@@ -1394,7 +2336,7 @@ def report(ctx):
         click.echo(f"    - {status}: {count}")
 
     # Find papers that need PDFs
-    no_pdf = [k for k, v in manager.data['papers'].items() if v['status'] == 'NO_PDF']
+    no_pdf = manager.list_keys('papers', 'NO_PDF')
     if no_pdf:
         click.echo(f"\n⚠️  Papers needing PDFs: {len(no_pdf)}")
         for key in no_pdf[:5]:
@@ -1403,5 +2345,151 @@ def report(ctx):
             if entry.get('title'):
                 click.echo(f"    {entry['title'][:60]}...")
 
+@cli.command('export-sqlite')
+@click.option('--output', default='worklist.db', help='SQLite database path (default: worklist.db)')
+@click.pass_context
+def export_sqlite(ctx, output):
+    """Export the worklist to a SQLite database for ad-hoc SQL querying.
+
+    paper_data.json stays the source of truth (the site and scripts read
+    it directly); this produces an indexed relational snapshot so large
+    analyses don't have to walk the JSON in Python.
+    """
+    import sqlite3
+
+    manager = ctx.obj['manager']
+    data = manager.data
+
+    if os.path.exists(output):
+        os.remove(output)
+
+    conn = sqlite3.connect(output)
+    try:
+        conn.executescript("""
+            CREATE TABLE papers (
+                bib_key TEXT PRIMARY KEY, status TEXT, title TEXT,
+                authors TEXT, year TEXT, venue TEXT, entry_json TEXT);
+            CREATE TABLE pdfs (
+                pdf_file TEXT PRIMARY KEY, status TEXT, mapped_paper TEXT,
+                entry_json TEXT);
+            CREATE TABLE tags (item_type TEXT, key TEXT, tag TEXT);
+            CREATE TABLE awards (bib_key TEXT, award TEXT);
+            CREATE TABLE mappings (
+                paper_key TEXT, pdf_file TEXT, confidence TEXT, verified_date TEXT);
+            CREATE INDEX idx_paper_status ON papers(status);
+            CREATE INDEX idx_pdf_status ON pdfs(status);
+            CREATE INDEX idx_tags_tag ON tags(item_type, tag);
+            CREATE INDEX idx_mappings_paper ON mappings(paper_key);
+            CREATE INDEX idx_mappings_pdf ON mappings(pdf_file);
+        """)
+        conn.executemany(
+            "INSERT INTO papers VALUES (?, ?, ?, ?, ?, ?, ?)",
+            ((k, e.get('status'), e.get('title'), e.get('authors'),
+              e.get('year'), e.get('venue'), json.dumps(e, ensure_ascii=False))
+             for k, e in data['papers'].items()))
+        conn.executemany(
+            "INSERT INTO pdfs VALUES (?, ?, ?, ?)",
+            ((k, e.get('status'), e.get('mapped_paper'),
+              json.dumps(e, ensure_ascii=False))
+             for k, e in data['pdfs'].items()))
+        conn.executemany(
+            "INSERT INTO tags VALUES (?, ?, ?)",
+            ((item_type, k, tag)
+             for item_type in ('papers', 'pdfs')
+             for k, e in data[item_type].items()
+             for tag in e.get('tags', [])))
+        conn.executemany(
+            "INSERT INTO awards VALUES (?, ?)",
+            ((k, award)
+             for k, e in data['papers'].items()
+             for award in e.get('awards', [])))
+        conn.executemany(
+            "INSERT INTO mappings VALUES (?, ?, ?, ?)",
+            ((WorklistManager._mapping_paper_key(m), m['pdf_file'],
+              m.get('confidence'), m.get('verified_date'))
+             for m in data['mappings']))
+        conn.commit()
+    finally:
+        conn.close()
+
+    click.echo(f"Exported {len(data['papers'])} papers, {len(data['pdfs'])} PDFs, "
+               f"{len(data['mappings'])} mappings to {output}")
+
+@cli.command('serve')
+@click.option('--compact', is_flag=True,
+              help='Save without indentation (smaller, faster writes)')
+@click.option('--journal', is_flag=True,
+              help='Append mutations to a journal instead of rewriting the '
+                   'file each time; compacts automatically')
+def serve_daemon(compact, journal):
+    """Run the in-memory daemon (foreground) for fast repeated CLI calls."""
+    from paper_data_daemon import serve
+    serve(compact_saves=compact, journal_saves=journal)
+
+@cli.command('stop')
+def stop_daemon():
+    """Stop a running daemon."""
+    import socket
+    from paper_data_daemon import SOCKET_PATH
+    if not SOCKET_PATH.exists():
+        click.echo("No daemon socket found", err=True)
+        sys.exit(1)
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(SOCKET_PATH))
+            sock.sendall(json.dumps({'op': 'stop'}).encode('utf-8') + b'\n')
+            sock.shutdown(socket.SHUT_WR)
+            sock.recv(65536)
+    except OSError as e:
+        click.echo(f"Error contacting daemon: {e}", err=True)
+        sys.exit(1)
+    click.echo("Daemon stopped")
+
+
+def _try_daemon(argv: List[str]) -> Optional[int]:
+    """Forward argv to a running daemon; None means run in-process instead."""
+    if os.environ.get('PAPER_DATA_NO_DAEMON'):
+        return None
+    if argv and argv[0] in ('serve', 'stop'):
+        return None
+    from paper_data_daemon import SOCKET_PATH
+    if not SOCKET_PATH.exists():
+        return None
+
+    import socket
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(SOCKET_PATH))
+            payload = json.dumps({'argv': argv, 'cwd': os.getcwd()})
+            sock.sendall(payload.encode('utf-8') + b'\n')
+            sock.shutdown(socket.SHUT_WR)
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    except OSError:
+        return None  # Stale socket or daemon died; run in-process
+
+    try:
+        response = json.loads(b''.join(chunks))
+    except ValueError:
+        return None
+    if response.get('error'):
+        return None  # e.g. daemon serving a different directory
+    sys.stdout.write(response.get('stdout', ''))
+    sys.stderr.write(response.get('stderr', ''))
+    return response.get('exit_code', 0)
+
+
+def main():
+    exit_code = _try_daemon(sys.argv[1:])
+    if exit_code is None:
+        cli()
+    else:
+        sys.exit(exit_code)
+
+
 if __name__ == '__main__':
-    cli()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Long-running daemon that keeps the parsed worklist in memory.
+
+Every CLI invocation normally reparses paper_data.json from disk. When
+this daemon is running, paper_data_cli.py forwards its argv over a Unix
+socket instead and the command executes against the manager already held
+in RAM, so scripted loops pay one JSON parse total instead of one per
+call.
+
+Start it with `python paper_data_cli.py serve` (or run this module
+directly) from the directory that holds paper_data.json; stop it with
+`python paper_data_cli.py stop`. Set PAPER_DATA_NO_DAEMON=1 to force the
+CLI to run in-process even while a daemon is up.
+"""
+
+import io
+import json
+import os
+import signal
+import socketserver
+import threading
+from contextlib import redirect_stdout, redirect_stderr
+from pathlib import Path
+
+import paper_data_cli
+
+SOCKET_PATH = Path.home() / '.paper_data.sock'
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Runs one forwarded CLI invocation against the shared manager."""
+
+    def handle(self):
+        server = self.server
+        try:
+            request = json.loads(self.rfile.readline())
+        except (ValueError, OSError):
+            return
+
+        if request.get('op') == 'stop':
+            self._respond({'stdout': 'Daemon stopping\n', 'stderr': '', 'exit_code': 0})
+            # shutdown() deadlocks if called from the handler thread
+            threading.Thread(target=server.shutdown).start()
+            return
+
+        # Worklist paths are relative; a client in another directory would
+        # silently operate on the wrong file, so make it fall back instead.
+        if request.get('cwd') != server.cwd:
+            self._respond({'error': 'cwd-mismatch'})
+            return
+
+        server.refresh_manager()
+
+        out, err = io.StringIO(), io.StringIO()
+        exit_code = 0
+        try:
+            with redirect_stdout(out), redirect_stderr(err):
+                paper_data_cli.cli.main(
+                    args=request.get('argv', []),
+                    prog_name='paper_data_cli.py',
+                    obj={'manager': server.manager},
+                )
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else 1
+        except Exception as e:
+            err.write(f"Error: {e}\n")
+            exit_code = 1
+
+        server.note_dispatched()
+        self._respond({'stdout': out.getvalue(), 'stderr': err.getvalue(),
+                       'exit_code': exit_code})
+
+    def _respond(self, payload):
+        self.wfile.write(json.dumps(payload).encode('utf-8'))
+
+
+class _Server(socketserver.UnixStreamServer):
+    allow_reuse_address = True
+
+    def __init__(self, compact_saves: bool = False, journal_saves: bool = False):
+        if SOCKET_PATH.exists():
+            SOCKET_PATH.unlink()
+        super().__init__(str(SOCKET_PATH), _Handler)
+        self.cwd = os.getcwd()
+        self.manager = paper_data_cli.WorklistManager(
+            compact_saves=compact_saves, journal_saves=journal_saves)
+        self._mtime = self._worklist_mtime()
+
+    def _worklist_mtime(self):
+        try:
+            return self.manager.worklist_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def refresh_manager(self):
+        """Reload the worklist if it changed on disk behind our back."""
+        mtime = self._worklist_mtime()
+        if mtime != self._mtime:
+            self.manager.load()
+            self._mtime = mtime
+
+    def note_dispatched(self):
+        """Record the post-command mtime so our own saves don't trigger reloads."""
+        self._mtime = self._worklist_mtime()
+
+
+def serve(compact_saves: bool = False, journal_saves: bool = False):
+    """Load the worklist once and serve forwarded CLI calls until stopped."""
+    server = _Server(compact_saves=compact_saves, journal_saves=journal_saves)
+
+    def _on_sigterm(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, _on_sigterm)
+    print(f"paper_data daemon listening on {SOCKET_PATH} (cwd: {server.cwd})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # Saves normally happen per mutation, but flush any deferred state
+        server.manager._flush()
+        server.server_close()
+        if SOCKET_PATH.exists():
+            SOCKET_PATH.unlink()
+        print("paper_data daemon stopped")
+
+
+if __name__ == '__main__':
+    serve()
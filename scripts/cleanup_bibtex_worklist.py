@@ -16,12 +16,34 @@ This script:
 Usage: python cleanup_bibtex_worklist.py
 """
 
+import argparse
 import json
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 import bibtexparser
 from bibtexparser.bparser import BibTexParser
-from bibtexparser.latexenc import latex_to_unicode
+
+from _norm import build_bibtex_span_index, normalize_field
+
+try:
+    import citerra  # Rust-backed parser, ~100x faster than bibtexparser 1.x
+except ImportError:
+    citerra = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dump_json(path, data):
+    """Serialize to pretty JSON and write it in one call (orjson when available)."""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(data, indent=2, ensure_ascii=False))
 
 
 def load_bibtex(bib_file='../filtered.bib'):
@@ -31,8 +53,21 @@ def load_bibtex(bib_file='../filtered.bib'):
         print(f"Error: {bib_file} not found", file=sys.stderr)
         sys.exit(1)
 
-    with open(bib_path, 'r', encoding='utf-8') as f:
-        bib_content = f.read()
+    # One read + one decode, rather than TextIOWrapper's incremental
+    # chunk-by-chunk decoding of a multi-MB file
+    bib_content = bib_path.read_bytes().decode('utf-8')
+
+    if citerra is not None:
+        # LaTeX escapes are decoded during the parse, so normalize_field's
+        # latex_to_unicode pass finds nothing left to do on these entries
+        doc = citerra.parse_string(bib_content, latex_to_unicode=True)
+        entries = []
+        for parsed in doc.entries:
+            entry = parsed.to_dict()
+            entry.setdefault('ID', parsed.key)
+            entry.setdefault('ENTRYTYPE', parsed.entry_type)
+            entries.append(entry)
+        return SimpleNamespace(entries=entries), bib_content
 
     parser = BibTexParser(common_strings=True)
     bib_database = bibtexparser.loads(bib_content, parser)
@@ -40,48 +75,6 @@ def load_bibtex(bib_file='../filtered.bib'):
     return bib_database, bib_content
 
 
-def extract_raw_bibtex_entry(bib_content, entry_id):
-    """Extract the raw bibtex text for a specific entry."""
-    # Find the entry in the raw content
-    # Look for @type{entry_id,
-    lines = bib_content.split('\n')
-    in_entry = False
-    entry_lines = []
-    brace_count = 0
-
-    for line in lines:
-        # Check if this line starts an entry with our ID
-        if not in_entry and entry_id in line and '@' in line:
-            in_entry = True
-            entry_lines = [line]
-            brace_count = line.count('{') - line.count('}')
-        elif in_entry:
-            entry_lines.append(line)
-            brace_count += line.count('{') - line.count('}')
-            # When braces balance, we've reached the end of the entry
-            if brace_count == 0:
-                break
-
-    return '\n'.join(entry_lines) if entry_lines else None
-
-
-def normalize_field(field_value):
-    """Normalize field value by removing newlines, extra whitespace, braces, and converting LaTeX to Unicode."""
-    if not field_value:
-        return ""
-    # Convert LaTeX encoded characters to Unicode (e.g., \\'a to á)
-    try:
-        normalized = latex_to_unicode(field_value)
-    except:
-        # If conversion fails, use original value
-        normalized = field_value
-    # Remove newlines and normalize whitespace
-    normalized = ' '.join(normalized.split())
-    # Remove braces (used in bibtex for capitalization preservation)
-    normalized = normalized.replace('{', '').replace('}', '')
-    return normalized.strip()
-
-
 def load_worklist(worklist_file='../paper_data.json'):
     """Load worklist JSON."""
     worklist_path = Path(worklist_file)
@@ -132,20 +125,20 @@ def compare_and_update(worklist_entry, bib_entry, entry_id, raw_bibtex):
     for field, new_value in bib_fields.items():
         old_value = worklist_entry.get(field)
 
-        # Normalize old value for comparison
-        old_value_normalized = normalize_field(str(old_value)) if old_value else ""
+        # Bytewise equal means already normalized — the common case on a
+        # corpus that has been cleaned before, and no work at all
+        if old_value == new_value:
+            continue
 
-        # Always update to normalized value (even if semantically the same,
-        # we want to clean up formatting)
-        if old_value != new_value or old_value_normalized != new_value:
-            if old_value_normalized != new_value:
-                # Content is actually different
-                changes.append({
-                    'field': field,
-                    'old': old_value,
-                    'new': new_value
-                })
-            updated[field] = new_value
+        old_value_normalized = normalize_field(str(old_value)) if old_value else ""
+        if old_value_normalized != new_value:
+            # Content is actually different, not just formatting
+            changes.append({
+                'field': field,
+                'old': old_value,
+                'new': new_value
+            })
+        updated[field] = new_value
 
     # Always add/update raw_bibtex
     if raw_bibtex:
@@ -162,6 +155,11 @@ def compare_and_update(worklist_entry, bib_entry, entry_id, raw_bibtex):
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Re-sync worklist bibtex fields from filtered.bib')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Print every field change (terminal I/O is measurable on big corpora)')
+    args = parser.parse_args()
+
     print("Loading filtered.bib...")
     bib_database, bib_content = load_bibtex()
 
@@ -170,6 +168,9 @@ def main():
 
     print(f"Loaded {len(bib_entries)} entries from filtered.bib\n")
 
+    # Index raw entry text once instead of rescanning the file per entry
+    raw_spans = build_bibtex_span_index(bib_content)
+
     print("Loading paper_data.json...")
     worklist = load_worklist()
 
@@ -183,41 +184,45 @@ def main():
     not_found_count = 0
     unchanged_count = 0
 
-    # Process each entry in worklist
+    # Build the updated collection in one pass and swap it in at the end,
+    # rather than reassigning into the dict being iterated
+    bib_get = bib_entries.get
+    raw_get = raw_spans.get
+    new_bibtex = {}
     for entry_id, worklist_entry in worklist['bibtex'].items():
         # Find matching entry in bibtex
-        if entry_id not in bib_entries:
+        bib_entry = bib_get(entry_id)
+        if bib_entry is None:
             print(f"⚠️  Warning: {entry_id} not found in filtered.bib")
             not_found_count += 1
+            new_bibtex[entry_id] = worklist_entry
             continue
 
-        bib_entry = bib_entries[entry_id]
-        raw_bibtex = extract_raw_bibtex_entry(bib_content, entry_id)
-
         # Compare and update
-        updated_entry, changes = compare_and_update(worklist_entry, bib_entry, entry_id, raw_bibtex)
+        updated_entry, changes = compare_and_update(worklist_entry, bib_entry, entry_id, raw_get(entry_id))
 
         if changes:
-            print(f"✏️  Updated {entry_id}:")
-            for change in changes:
-                if change['field'] == 'raw_bibtex':
-                    print(f"   + {change['field']}: <added>")
-                else:
-                    old_display = repr(change['old'])
-                    new_display = repr(change['new'])
-                    print(f"   - {change['field']}: {old_display} → {new_display}")
-            print()
-
-            worklist['bibtex'][entry_id] = updated_entry
+            if args.verbose:
+                print(f"✏️  Updated {entry_id}:")
+                for change in changes:
+                    if change['field'] == 'raw_bibtex':
+                        print(f"   + {change['field']}: <added>")
+                    else:
+                        old_display = repr(change['old'])
+                        new_display = repr(change['new'])
+                        print(f"   - {change['field']}: {old_display} → {new_display}")
+                print()
             updated_count += 1
         else:
             unchanged_count += 1
+        new_bibtex[entry_id] = updated_entry
+
+    worklist['bibtex'] = new_bibtex
 
     # Save updated worklist
     output_path = Path('../paper_data-updated.json')
     print(f"\nSaving to {output_path}...")
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(worklist, f, indent=2, ensure_ascii=False)
+    dump_json(output_path, worklist)
 
     # Print summary
     print(f"\n{'='*50}")
@@ -12,13 +12,19 @@ This script:
 Usage: python extract_paper_info.py <markdown_path> <output_json_path>
 """
 
+import asyncio
 import os
 import sys
 import json
 import argparse
 from pathlib import Path
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def load_prompt_template(prompt_path='../prompts/paper_info_extraction.prompt'):
@@ -43,24 +49,23 @@ def load_markdown(markdown_path):
         return f.read()
 
 
-def extract_paper_info(markdown_content, prompt_template, api_key, model):
+def extract_paper_info(markdown_content, prompt_head, prompt_tail, client, model):
     """
     Call OpenAI API to extract paper information.
 
     Args:
         markdown_content: The paper content in markdown format
-        prompt_template: The prompt template with {{paper_markdown}} placeholder
-        api_key: OpenAI API key
+        prompt_head: Template text before the {{paper_markdown}} placeholder
+        prompt_tail: Template text after the placeholder
+        client: Shared OpenAI client (keep-alive across batch items)
         model: OpenAI model to use
 
     Returns:
-        dict: Parsed JSON response from the API
+        dict: Parsed JSON response from the API, or None on failure
     """
-    # Replace placeholder with actual markdown
-    prompt = prompt_template.replace('{{paper_markdown}}', markdown_content)
-
-    # Initialize OpenAI client
-    client = OpenAI(api_key=api_key)
+    # The template is pre-split around the placeholder, so building the
+    # prompt is a concatenation instead of a scan of the whole template
+    prompt = prompt_head + markdown_content + prompt_tail
 
     try:
         # Call the API
@@ -76,24 +81,71 @@ def extract_paper_info(markdown_content, prompt_template, api_key, model):
         response_text = response.choices[0].message.content
 
         # Parse as JSON
-        result = json.loads(response_text)
-        return result
+        return json.loads(response_text)
 
     except json.JSONDecodeError as e:
         print(f"Error: Failed to parse JSON response: {e}", file=sys.stderr)
         print(f"Response text: {response_text}", file=sys.stderr)
-        sys.exit(1)
+        return None
     except Exception as e:
         print(f"Error calling OpenAI API: {e}", file=sys.stderr)
-        sys.exit(1)
+        return None
+
+
+def write_result(output_path, result):
+    """Write an extraction result as pretty JSON in one call."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(result, indent=2, ensure_ascii=False))
+
+
+async def _extract_one(client, sem, item, prompt_head, prompt_tail, model):
+    """Run one batch extraction under the concurrency limit."""
+    markdown_content = load_markdown(item['markdown'])
+    prompt = prompt_head + markdown_content + prompt_tail
+
+    async with sem:
+        try:
+            response = await client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ],
+                response_format={"type": "json_object"}
+            )
+            result = json.loads(response.choices[0].message.content)
+        except Exception as e:
+            print(f"Error extracting {item['markdown']}: {e}", file=sys.stderr)
+            return False
+
+    output_path = Path(item['output'])
+    write_result(output_path, result)
+    print(f"  {item['markdown']} -> {output_path}")
+    return True
+
+
+async def _run_batch(items, prompt_head, prompt_tail, api_key, model, concurrency):
+    """Dispatch all batch items concurrently; returns the failure count."""
+    client = AsyncOpenAI(api_key=api_key)
+    sem = asyncio.Semaphore(concurrency)
+    results = await asyncio.gather(
+        *[_extract_one(client, sem, item, prompt_head, prompt_tail, model)
+          for item in items])
+    return results.count(False)
 
 
 def main():
     parser = argparse.ArgumentParser(description='Extract structured information from a paper using OpenAI')
-    parser.add_argument('markdown_path', help='Path to the input markdown file')
-    parser.add_argument('output_json_path', help='Path where the output JSON should be saved')
+    parser.add_argument('markdown_path', nargs='?', help='Path to the input markdown file')
+    parser.add_argument('output_json_path', nargs='?', help='Path where the output JSON should be saved')
     parser.add_argument('--prompt-template', default='../prompts/paper_info_extraction.prompt',
                         help='Path to the prompt template file (default: prompts/paper_info_extraction.prompt)')
+    parser.add_argument('--batch',
+                        help='JSONL file of {"markdown": ..., "output": ...} items, '
+                             'processed in one process with the template loaded once')
     args = parser.parse_args()
 
     # Load environment variables
@@ -107,26 +159,43 @@ def main():
         print("Please create a .env file with your API key", file=sys.stderr)
         sys.exit(1)
 
+    print(f"Loading prompt template from {args.prompt_template}...")
+    prompt_template = load_prompt_template(args.prompt_template)
+    prompt_head, _, prompt_tail = prompt_template.partition('{{paper_markdown}}')
+
+    if args.batch:
+        with open(args.batch, 'r', encoding='utf-8') as f:
+            items = [json.loads(line) for line in f if line.strip()]
+
+        # Each call is dominated by network latency, so run them
+        # concurrently, bounded to stay inside API rate limits
+        concurrency = int(os.getenv('OAI_CONCURRENCY', '8'))
+        print(f"Processing {len(items)} papers with model {model} "
+              f"({concurrency} concurrent)...")
+        failures = asyncio.run(
+            _run_batch(items, prompt_head, prompt_tail, api_key, model, concurrency))
+
+        print(f"Processed {len(items)} papers, {failures} failed")
+        sys.exit(0 if failures == 0 else 1)
+
+    client = OpenAI(api_key=api_key)
+
+    if not args.markdown_path or not args.output_json_path:
+        parser.error('markdown_path and output_json_path are required unless --batch is given')
+
     # Load inputs
     print(f"Loading markdown from {args.markdown_path}...")
     markdown_content = load_markdown(args.markdown_path)
 
-    print(f"Loading prompt template from {args.prompt_template}...")
-    prompt_template = load_prompt_template(args.prompt_template)
-
     # Extract information
     print(f"Calling OpenAI API with model {model}...")
-    result = extract_paper_info(markdown_content, prompt_template, api_key, model)
-
-    # Create output directory if needed
-    output_path = Path(args.output_json_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    result = extract_paper_info(markdown_content, prompt_head, prompt_tail, client, model)
+    if result is None:
+        sys.exit(1)
 
-    # Write result to file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    write_result(Path(args.output_json_path), result)
 
-    print(f"Success! Extracted information saved to {output_path}")
+    print(f"Success! Extracted information saved to {args.output_json_path}")
     sys.exit(0)
 
 
@@ -12,80 +12,56 @@ Usage: python generate_markdown.py <pdf_path> <output_md_path>
 """
 
 import os
-import subprocess
 import sys
-import tempfile
 from pathlib import Path
 import argparse
 
+import requests
 
-def process_pdf_with_grobid(pdf_path, tei_path):
-    """Process a PDF file with GROBID to generate TEI XML."""
-    cmd = [
-        'curl',
-        '-F', f'input=@{pdf_path}',
-        'http://localhost:8070/api/processFulltextDocument',
-        '-o', str(tei_path),
-        '-s',  # Silent mode
-        '-S'   # But show errors
-    ]
+from tei_to_markdown import convert as tei_convert
 
-    print(f"Processing with GROBID: {pdf_path}")
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    if result.returncode != 0:
-        print(f"Error running GROBID: {result.stderr}", file=sys.stderr)
-        return False
+GROBID_URL = 'http://localhost:8070/api/processFulltextDocument'
 
-    # Check if output file was created and has content
-    if not tei_path.exists():
-        print(f"Error: TEI file not created", file=sys.stderr)
-        return False
+# One session keeps the HTTP connection to GROBID alive across a batch,
+# instead of a curl fork + fresh connection per PDF
+_session = requests.Session()
 
-    if tei_path.stat().st_size == 0:
-        print(f"Error: TEI file is empty", file=sys.stderr)
-        return False
 
-    # Check if it's actually XML
+def process_pdf_with_grobid(pdf_path):
+    """Process a PDF file with GROBID; returns TEI XML bytes, or None."""
+    print(f"Processing with GROBID: {pdf_path}")
     try:
-        with open(tei_path, 'r', encoding='utf-8') as f:
-            first_line = f.readline().strip()
-            if not first_line.startswith('<?xml') and not first_line.startswith('<'):
-                print(f"Error: TEI file does not appear to be XML. First line: {first_line[:100]}", file=sys.stderr)
-                return False
-    except Exception as e:
-        print(f"Error reading TEI file: {e}", file=sys.stderr)
-        return False
-
-    return True
-
+        with open(pdf_path, 'rb') as fh:
+            response = _session.post(GROBID_URL, files={'input': fh}, timeout=120)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        print(f"Error running GROBID: {e}", file=sys.stderr)
+        return None
+
+    tei_bytes = response.content
+    if not tei_bytes:
+        print(f"Error: GROBID returned an empty response", file=sys.stderr)
+        return None
 
-def convert_tei_to_markdown(tei_path, md_path):
-    """Convert TEI XML to Markdown using tei_to_markdown.py."""
-    # Find tei_to_markdown.py in same directory
-    script_dir = Path(__file__).parent
-    tei_converter = script_dir / 'tei_to_markdown.py'
+    # Check if it's actually XML
+    if not tei_bytes.lstrip().startswith(b'<'):
+        print(f"Error: GROBID response does not appear to be XML. "
+              f"Start: {tei_bytes[:100]!r}", file=sys.stderr)
+        return None
 
-    if not tei_converter.exists():
-        print(f"Error: tei_to_markdown.py not found at {tei_converter}", file=sys.stderr)
-        return False
+    return tei_bytes
 
-    cmd = [
-        sys.executable,
-        str(tei_converter),
-        str(tei_path),
-        str(md_path),
-        '--omit-references',
-        '--inline-citations', 'author-title'
-    ]
 
+def convert_tei_to_markdown(tei_bytes, md_path):
+    """Convert TEI XML to Markdown in-process (no interpreter per PDF)."""
     print(f"Converting to Markdown: {md_path}")
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    if result.returncode != 0:
-        print(f"Error converting to Markdown: {result.stderr}", file=sys.stderr)
+    try:
+        md = tei_convert(tei_bytes, omit_references=True, inline_citations='author-title')
+    except Exception as e:
+        print(f"Error converting to Markdown: {e}", file=sys.stderr)
         return False
 
+    Path(md_path).write_text(md, encoding='utf-8')
     return True
 
 
@@ -111,34 +87,57 @@ def generate_markdown_from_pdf(pdf_path, output_md_path):
     # Create output directory if needed
     output_md_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Create temporary file for TEI XML
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.tei.xml', delete=False) as tmp:
-        tei_path = Path(tmp.name)
+    # Process PDF with GROBID; the TEI never touches disk
+    tei_bytes = process_pdf_with_grobid(pdf_path)
+    if tei_bytes is None:
+        return False
+
+    # Convert TEI to Markdown
+    if not convert_tei_to_markdown(tei_bytes, output_md_path):
+        return False
 
-    try:
-        # Process PDF with GROBID
-        if not process_pdf_with_grobid(pdf_path, tei_path):
-            return False
+    print(f"Success! Markdown created at: {output_md_path}")
+    return True
 
-        # Convert TEI to Markdown
-        if not convert_tei_to_markdown(tei_path, output_md_path):
-            return False
 
-        print(f"Success! Markdown created at: {output_md_path}")
-        return True
+def generate_markdowns_from_pdfs(pairs, workers=8):
+    """Process many (pdf_path, output_md_path) pairs concurrently.
 
-    finally:
-        # Clean up temporary TEI file
-        if tei_path.exists():
-            tei_path.unlink()
+    The work is network-bound against the GROBID server, so threads
+    sharing the keep-alive session are the right tool; size workers to
+    GROBID's concurrency setting (default 10). Returns the per-pair
+    success flags in input order.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda pair: generate_markdown_from_pdf(*pair), pairs))
 
 
 def main():
     parser = argparse.ArgumentParser(description='Generate markdown from a PDF using GROBID')
-    parser.add_argument('pdf_path', help='Path to the input PDF file')
-    parser.add_argument('output_md_path', help='Path where the markdown should be saved')
+    parser.add_argument('pdf_path', nargs='?', help='Path to the input PDF file')
+    parser.add_argument('output_md_path', nargs='?', help='Path where the markdown should be saved')
+    parser.add_argument('--pdf-dir', help='Process every PDF in this directory instead')
+    parser.add_argument('--out-dir', help='Output directory for --pdf-dir (default: the PDF directory)')
+    parser.add_argument('--workers', type=int, default=8,
+                        help='Concurrent GROBID requests for --pdf-dir (default: 8)')
     args = parser.parse_args()
 
+    if args.pdf_dir:
+        pdf_dir = Path(args.pdf_dir)
+        out_dir = Path(args.out_dir) if args.out_dir else pdf_dir
+        pairs = [(pdf, out_dir / f"{pdf.stem}.md") for pdf in sorted(pdf_dir.glob('*.pdf'))]
+        if not pairs:
+            print(f"No PDFs found in {pdf_dir}", file=sys.stderr)
+            sys.exit(1)
+        results = generate_markdowns_from_pdfs(pairs, workers=args.workers)
+        failed = results.count(False)
+        print(f"Processed {len(pairs)} PDFs, {failed} failed")
+        sys.exit(0 if failed == 0 else 1)
+
+    if not args.pdf_path or not args.output_md_path:
+        parser.error('pdf_path and output_md_path are required unless --pdf-dir is given')
+
     success = generate_markdown_from_pdf(args.pdf_path, args.output_md_path)
     sys.exit(0 if success else 1)
 
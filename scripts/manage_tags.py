@@ -11,18 +11,69 @@ Usage:
     python manage_tags.py assign
 """
 
+import asyncio
+import functools
 import os
+import random
 import sys
 import json
-import subprocess
+import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import (OpenAI, AsyncOpenAI, RateLimitError, APITimeoutError,
+                    APIConnectionError)
+from pydantic import BaseModel
 
 
+class TagList(BaseModel):
+    """Structured-output schema for tag assignment."""
+    tags: list[str]
+
+
+class TaxonomyTag(BaseModel):
+    """One tag in the generated taxonomy."""
+    tag: str
+    description: str = "N/A"
+
+
+class TaxonomyResponse(BaseModel):
+    """Structured-output schema for taxonomy generation."""
+    tags: list[TaxonomyTag]
+
+try:
+    import tiktoken  # exact token counts for the rate limiter
+except ImportError:
+    tiktoken = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _load_json_file(path):
+    """Parse a JSON file in one read (orjson when available)."""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dump_json(path, data):
+    """Serialize to pretty JSON and write it in one call (orjson when available)."""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(data, indent=2, ensure_ascii=False))
+
+
+@functools.lru_cache(maxsize=None)
 def load_prompt_template(prompt_path):
-    """Load a prompt template file."""
+    """Load a prompt template file (cached per path)."""
     prompt_path = Path(prompt_path)
 
     # If path doesn't exist and starts with ../prompts, try from repo root
@@ -47,20 +98,30 @@ def load_all_paper_summaries(paper_info_dir='paper_info_json'):
         print(f"Error: Paper info directory not found: {paper_info_dir}", file=sys.stderr)
         sys.exit(1)
 
-    summaries = []
-    for json_file in paper_info_dir.glob('*.json'):
+    # scandir's DirEntry carries cached type info, skipping the Path
+    # object and stat that Path.glob pays per file
+    with os.scandir(paper_info_dir) as entries:
+        files = [(entry.name[:-len('.json')], entry.path) for entry in entries
+                 if entry.is_file() and entry.name.endswith('.json')]
+
+    def load_one(item):
+        stem, path = item
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                summaries.append({
-                    'file': json_file.stem,
-                    'data': data
-                })
-        except json.JSONDecodeError as e:
-            print(f"Warning: Failed to parse {json_file}: {e}", file=sys.stderr)
-            continue
+            return {
+                'file': stem,
+                'data': _load_json_file(path)
+            }
+        except ValueError as e:
+            print(f"Warning: Failed to parse {path}: {e}", file=sys.stderr)
+            return None
 
-    return summaries
+    # Hundreds of small files: the open/read latency dominates, and the
+    # GIL is released during both the I/O and orjson's parse, so threads
+    # overlap it all
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        results = executor.map(load_one, files)
+
+    return [summary for summary in results if summary is not None]
 
 
 def format_summaries_for_taxonomy_generation(summaries):
@@ -77,8 +138,39 @@ def format_summaries_for_taxonomy_generation(summaries):
     return "\n".join(formatted)
 
 
-def generate_tag_taxonomy(api_key, model):
-    """Generate tag taxonomy from all paper summaries."""
+def _round_robin_batches(summaries, batch_size):
+    """Yield batches sampled round-robin across topic groups.
+
+    Grouping by the extracted `topic` field stands in for embedding
+    clusters: each batch mixes topics, so no single taxonomy call sees a
+    skewed slice of the corpus.
+    """
+    groups = {}
+    for summary in summaries:
+        topic = summary['data'].get('details', {}).get('topic', 'N/A')
+        groups.setdefault(topic, []).append(summary)
+
+    queues = list(groups.values())
+    batch = []
+    while any(queues):
+        for queue in queues:
+            if queue:
+                batch.append(queue.pop(0))
+                if len(batch) == batch_size:
+                    yield batch
+                    batch = []
+    if batch:
+        yield batch
+
+
+def generate_tag_taxonomy(api_key, model, batch_size=150):
+    """Generate tag taxonomy from all paper summaries.
+
+    Corpora larger than batch_size are processed iteratively: the first
+    batch generates a taxonomy and each further batch refines it via
+    tag_taxonomy_update.prompt, keeping every call's prompt bounded
+    instead of concatenating the whole collection.
+    """
     print("Loading paper summaries...")
     summaries = load_all_paper_summaries()
 
@@ -88,48 +180,50 @@ def generate_tag_taxonomy(api_key, model):
 
     print(f"Found {len(summaries)} paper summaries")
 
-    # Load prompt template
-    print("Loading prompt template...")
-    prompt_template = load_prompt_template('../prompts/tag_taxonomy_generation.prompt')
-
-    # Format summaries
-    formatted_summaries = format_summaries_for_taxonomy_generation(summaries)
-
-    # Replace placeholder
-    prompt = prompt_template.replace('{{paper_summaries}}', formatted_summaries)
+    if len(summaries) <= batch_size:
+        batches = [summaries]
+    else:
+        batches = list(_round_robin_batches(summaries, batch_size))
+        print(f"Processing in {len(batches)} batches of up to {batch_size} summaries")
 
     # Call OpenAI API
-    print(f"Calling OpenAI API with model {model}...")
-    client = OpenAI(api_key=api_key)
+    client = _get_client(api_key)
+    taxonomy = None
 
     try:
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "user", "content": prompt}
-            ],
-            response_format={"type": "json_object"}
-        )
+        for batch in batches:
+            formatted_summaries = format_summaries_for_taxonomy_generation(batch)
 
-        response_text = response.choices[0].message.content
-
-        # Parse JSON - expecting {"tags": [...]}
-        result = json.loads(response_text)
-
-        # Extract the tags array from the response
-        if isinstance(result, dict) and 'tags' in result:
-            taxonomy = result['tags']
-        elif isinstance(result, list):
-            # Fallback: if it's already an array, use it directly
-            taxonomy = result
-        else:
-            print(f"Error: Expected JSON object with 'tags' key, got: {result}", file=sys.stderr)
-            sys.exit(1)
+            if taxonomy is None:
+                prompt_template = load_prompt_template('../prompts/tag_taxonomy_generation.prompt')
+                prompt = prompt_template.replace('{{paper_summaries}}', formatted_summaries)
+            else:
+                prompt_template = load_prompt_template('../prompts/tag_taxonomy_update.prompt')
+                prompt = prompt_template.replace('{{current_taxonomy}}',
+                                                 json.dumps(taxonomy, indent=2))
+                prompt = prompt.replace('{{paper_summaries}}', formatted_summaries)
+
+            print(f"Calling OpenAI API with model {model} ({len(batch)} summaries)...")
+            response = _create_with_retry(
+                client,
+                model=model,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ],
+                response_format=TaxonomyResponse
+            )
+
+            # Schema enforcement happens model-side; parsed is a TaxonomyResponse
+            parsed = response.choices[0].message.parsed
+            if parsed is None:
+                print(f"Error: Model refused to produce a taxonomy: "
+                      f"{response.choices[0].message.refusal}", file=sys.stderr)
+                sys.exit(1)
+            taxonomy = [tag_info.model_dump() for tag_info in parsed.tags]
 
         # Save to file
         output_path = Path('tags_taxonomy.json')
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(taxonomy, f, indent=2, ensure_ascii=False)
+        _dump_json(output_path, taxonomy)
 
         print(f"\nSuccess! Tag taxonomy saved to {output_path}")
         print(f"Generated {len(taxonomy)} tags")
@@ -142,10 +236,6 @@ def generate_tag_taxonomy(api_key, model):
             else:
                 print(f"  - {tag_info}")
 
-    except json.JSONDecodeError as e:
-        print(f"Error: Failed to parse JSON response: {e}", file=sys.stderr)
-        print(f"Response: {response_text}", file=sys.stderr)
-        sys.exit(1)
     except Exception as e:
         print(f"Error calling OpenAI API: {e}", file=sys.stderr)
         sys.exit(1)
@@ -158,8 +248,7 @@ def load_tag_taxonomy():
         print("Error: tags_taxonomy.json not found. Run 'generate' mode first.", file=sys.stderr)
         sys.exit(1)
 
-    with open(taxonomy_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return _load_json_file(taxonomy_path)
 
 
 def format_taxonomy_for_assignment(taxonomy):
@@ -170,60 +259,71 @@ def format_taxonomy_for_assignment(taxonomy):
     return "\n".join(formatted)
 
 
-def get_paper_key_by_stem(pdf_stem):
-    """Get paper key using the CLI."""
-    # Determine the correct path to paper_data_cli.py
-    # If running from scripts dir, use ../paper_data_cli.py
-    # If running from repo root, use paper_data_cli.py
-    script_dir = Path(__file__).parent
-    if script_dir.name == 'scripts':
-        cli_path = script_dir.parent / 'paper_data_cli.py'
-    else:
-        cli_path = Path('paper_data_cli.py')
+_manager = None
 
-    cmd = [
-        sys.executable,
-        str(cli_path),
-        'paper', 'get-by-pdf-stem',
-        pdf_stem
-    ]
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+def get_worklist_manager():
+    """Shared in-process WorklistManager.
 
-    if result.returncode != 0:
-        return None
+    Replaces the per-paper CLI forks (paper get-by-pdf-stem / tags set),
+    each of which paid a full interpreter start and a worklist load.
+    """
+    global _manager
+    if _manager is None:
+        # paper_data_cli.py lives at the repo root, one level up from scripts/
+        script_dir = Path(__file__).resolve().parent
+        root = script_dir.parent if script_dir.name == 'scripts' else script_dir
+        sys.path.insert(0, str(root))
+        from paper_data_cli import WorklistManager
+        _manager = WorklistManager(str(root / 'paper_data.json'))
+    return _manager
 
-    return result.stdout.strip()
+
+def get_paper_key_by_stem(pdf_stem):
+    """Get paper key for a PDF stem."""
+    return get_worklist_manager().get_paper_by_pdf_stem(pdf_stem)
 
 
 def set_tags_for_paper(bib_key, tags):
-    """Set tags for a paper entry using the CLI."""
+    """Set tags for a paper entry (replaces existing tags)."""
     if not tags:
         print(f"  Warning: No tags to set for {bib_key}")
         return False
 
-    # Determine the correct path to paper_data_cli.py
-    script_dir = Path(__file__).parent
-    if script_dir.name == 'scripts':
-        cli_path = script_dir.parent / 'paper_data_cli.py'
-    else:
-        cli_path = Path('paper_data_cli.py')
+    return get_worklist_manager().set_tags('papers', bib_key, tags)
 
-    cmd = [
-        sys.executable,
-        str(cli_path),
-        'tags', 'set',
-        'papers',
-        bib_key
-    ] + tags
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+@functools.lru_cache(maxsize=None)
+def _get_client(api_key):
+    """One shared sync OpenAI client.
 
-    if result.returncode != 0:
-        print(f"  Error setting tags: {result.stderr}", file=sys.stderr)
-        return False
+    Constructing a client builds an httpx pool and TLS context; sharing
+    it keeps the connection to api.openai.com warm across calls.
+    """
+    return OpenAI(api_key=api_key)
+
+
+def _parse_tags_response(response_text):
+    """Extract and validate the tags list from a model response."""
+    # Parse JSON - expecting {"tags": ["tag1", "tag2", ...]}
+    result = json.loads(response_text)
+
+    # Extract tags array from response
+    if isinstance(result, dict) and 'tags' in result:
+        tags = result['tags']
+    elif isinstance(result, list):
+        # Fallback: if it's already an array, use it directly
+        tags = result
+    else:
+        print(f"  Warning: Unexpected response format (expected dict with 'tags' key): {result}", file=sys.stderr)
+        return []
+
+    # Validate that tags is a list of strings
+    if not isinstance(tags, list):
+        print(f"  Warning: 'tags' value is not a list: {tags}", file=sys.stderr)
+        return []
 
-    return True
+    return tags
 
 
 def assign_tags_to_paper(paper_summary, taxonomy_text, api_key, model):
@@ -239,49 +339,260 @@ def assign_tags_to_paper(paper_summary, taxonomy_text, api_key, model):
     prompt = prompt.replace('{{paper_summary}}', formatted_summary)
 
     # Call OpenAI API
-    client = OpenAI(api_key=api_key)
+    client = _get_client(api_key)
 
     try:
-        response = client.chat.completions.create(
+        response = _create_with_retry(
+            client,
             model=model,
             messages=[
                 {"role": "user", "content": prompt}
             ],
-            response_format={"type": "json_object"}
+            response_format=TagList
         )
 
-        response_text = response.choices[0].message.content
+        return _extract_parsed_tags(response)
 
-        # Parse JSON - expecting {"tags": ["tag1", "tag2", ...]}
-        result = json.loads(response_text)
+    except Exception as e:
+        print(f"  Error calling OpenAI API: {e}", file=sys.stderr)
+        return []
 
-        # Extract tags array from response
-        if isinstance(result, dict) and 'tags' in result:
-            tags = result['tags']
-        elif isinstance(result, list):
-            # Fallback: if it's already an array, use it directly
-            tags = result
-        else:
-            print(f"  Warning: Unexpected response format (expected dict with 'tags' key): {result}", file=sys.stderr)
-            return []
 
-        # Validate that tags is a list of strings
-        if not isinstance(tags, list):
-            print(f"  Warning: 'tags' value is not a list: {tags}", file=sys.stderr)
+def _extract_parsed_tags(response):
+    """Pull the tags out of a structured-output response."""
+    parsed = response.choices[0].message.parsed
+    if parsed is None:
+        print(f"  Warning: Model refused the request: "
+              f"{response.choices[0].message.refusal}", file=sys.stderr)
+        return []
+    return parsed.tags
+
+
+# Rough completion-size allowance added to each prompt estimate; tag
+# lists are short, so this errs generously
+_COMPLETION_PAD_TOKENS = 500
+
+# Transient API failures worth retrying; anything else fails fast
+_RETRYABLE_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError)
+_MAX_ATTEMPTS = 6
+
+
+def _backoff_delay(attempt):
+    """Exponential backoff with jitter, capped at a minute."""
+    return min(2 ** attempt + random.random(), 60)
+
+
+def _create_with_retry(client, **kwargs):
+    """chat.completions.parse, retrying transient failures with backoff."""
+    for attempt in range(_MAX_ATTEMPTS):
+        try:
+            return client.beta.chat.completions.parse(**kwargs)
+        except _RETRYABLE_ERRORS as e:
+            if attempt == _MAX_ATTEMPTS - 1:
+                raise
+            delay = _backoff_delay(attempt)
+            print(f"  Transient API error ({type(e).__name__}), "
+                  f"retrying in {delay:.1f}s...", file=sys.stderr)
+            time.sleep(delay)
+
+
+async def _acreate_with_retry(client, **kwargs):
+    """Async twin of _create_with_retry."""
+    for attempt in range(_MAX_ATTEMPTS):
+        try:
+            return await client.beta.chat.completions.parse(**kwargs)
+        except _RETRYABLE_ERRORS as e:
+            if attempt == _MAX_ATTEMPTS - 1:
+                raise
+            delay = _backoff_delay(attempt)
+            print(f"  Transient API error ({type(e).__name__}), "
+                  f"retrying in {delay:.1f}s...", file=sys.stderr)
+            await asyncio.sleep(delay)
+
+
+def _estimate_tokens(prompt, model):
+    """Estimate the prompt's token count (tiktoken when available)."""
+    if tiktoken is not None:
+        try:
+            return len(tiktoken.encoding_for_model(model).encode(prompt))
+        except KeyError:
+            pass
+    # ~4 chars per token is close enough for budgeting purposes
+    return len(prompt) // 4 + 1
+
+
+class RateLimiter:
+    """Pre-emptive requests/min + tokens/min budget for the LLM fan-out.
+
+    acquire() blocks until both budgets have room, then debits them; a
+    background task refills each budget once per second at rpm/60 and
+    tpm/60. Spending the quota up front keeps a large gather from
+    tripping HTTP 429s instead of reacting to them after the fact.
+    """
+
+    def __init__(self, rpm, tpm):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._cond = asyncio.Condition()
+        self._refill_task = asyncio.create_task(self._refill())
+
+    async def _refill(self):
+        while True:
+            await asyncio.sleep(1)
+            async with self._cond:
+                self._requests = min(self.rpm, self._requests + self.rpm / 60)
+                self._tokens = min(self.tpm, self._tokens + self.tpm / 60)
+                self._cond.notify_all()
+
+    async def acquire(self, tokens):
+        async with self._cond:
+            await self._cond.wait_for(
+                lambda: self._requests >= 1 and self._tokens >= tokens)
+            self._requests -= 1
+            self._tokens -= tokens
+
+    async def reconcile(self, estimated_tokens, actual_tokens):
+        """Settle the difference once the response reports real usage."""
+        if actual_tokens == estimated_tokens:
+            return
+        async with self._cond:
+            self._tokens -= actual_tokens - estimated_tokens
+            if actual_tokens < estimated_tokens:
+                self._cond.notify_all()
+
+    def close(self):
+        self._refill_task.cancel()
+
+
+# Crash checkpoint for assign mode: one line per completed LLM call, so
+# an interrupted run doesn't pay for those papers again
+_PROGRESS_PATH = Path('tags_progress.jsonl')
+
+
+def _load_progress():
+    """Map pdf stem -> tags recorded by a previous interrupted run."""
+    progress = {}
+    if _PROGRESS_PATH.exists():
+        with open(_PROGRESS_PATH, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    item = json.loads(line)
+                except ValueError:
+                    continue  # torn final line from a crash
+                progress[item['stem']] = item['tags']
+    return progress
+
+
+def _record_progress(stem, tags):
+    """Append one completed assignment to the checkpoint."""
+    with open(_PROGRESS_PATH, 'a', encoding='utf-8') as f:
+        f.write(json.dumps({'stem': stem, 'tags': tags}) + '\n')
+
+
+async def _assign_one(client, sem, limiter, stem, paper_summary, prompt_prefix, model):
+    """Assign tags to one paper under the concurrency and rate limits."""
+    # The taxonomy block is already substituted into prompt_prefix, so
+    # only the per-paper summary is spliced in here
+    prompt = prompt_prefix.replace('{{paper_summary}}', json.dumps(paper_summary, indent=2))
+    est_tokens = _estimate_tokens(prompt, model) + _COMPLETION_PAD_TOKENS
+
+    async with sem:
+        await limiter.acquire(est_tokens)
+        try:
+            response = await _acreate_with_retry(
+                client,
+                model=model,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ],
+                response_format=TagList
+            )
+            if response.usage is not None:
+                await limiter.reconcile(est_tokens, response.usage.total_tokens)
+            tags = _extract_parsed_tags(response)
+            if tags:
+                _record_progress(stem, tags)
+            return tags
+        except Exception as e:
+            print(f"  Error calling OpenAI API: {e}", file=sys.stderr)
             return []
 
-        return tags
 
-    except json.JSONDecodeError as e:
-        print(f"  Error: Failed to parse JSON response: {e}", file=sys.stderr)
-        return []
-    except Exception as e:
-        print(f"  Error calling OpenAI API: {e}", file=sys.stderr)
-        return []
+async def _assign_batch(items, prompt_prefix, api_key, model, concurrency):
+    """Run all tag assignments concurrently; returns tag lists in input order.
 
+    items are (stem, paper_summary) pairs.
+    """
+    client = AsyncOpenAI(api_key=api_key)
+    sem = asyncio.Semaphore(concurrency)
+    # Tier limits; override to match the account (OAI_RPM / OAI_TPM)
+    limiter = RateLimiter(rpm=int(os.getenv('OAI_RPM', '500')),
+                          tpm=int(os.getenv('OAI_TPM', '200000')))
+    try:
+        return await asyncio.gather(
+            *[_assign_one(client, sem, limiter, stem, summary, prompt_prefix, model)
+              for stem, summary in items])
+    finally:
+        limiter.close()
+
+
+def _resolve_paper_keys(summaries):
+    """Pair each summary with its paper key; returns (resolved, skipped).
+
+    Resolving up front keeps the LLM fan-out to papers we can actually
+    tag.
+    """
+    resolved = []
+    skipped = 0
+    for summary_info in summaries:
+        pdf_stem = summary_info['file']
+        bib_key = get_paper_key_by_stem(pdf_stem)
+        if not bib_key:
+            print(f"Warning: No paper key found for PDF stem '{pdf_stem}', skipping")
+            skipped += 1
+            continue
+        resolved.append((bib_key, summary_info))
+    return resolved, skipped
+
+
+def _apply_tag_results(pairs):
+    """Write (bib_key, stem, tags) results under one deferred save.
+
+    Returns (successful, failed) counts.
+    """
+    successful = 0
+    failed = 0
+    with get_worklist_manager().batch():
+        for bib_key, stem, tags in pairs:
+            print(f"Processing {stem} ({bib_key})")
+
+            if not tags:
+                print(f"  Warning: No tags assigned")
+                failed += 1
+                continue
 
-def assign_tags_to_all_papers(api_key, model):
-    """Assign tags to all papers based on taxonomy."""
+            print(f"  Assigned tags: {', '.join(tags)}")
+
+            if set_tags_for_paper(bib_key, tags):
+                print(f"  Success!")
+                successful += 1
+            else:
+                print(f"  Failed to set tags")
+                failed += 1
+    return successful, failed
+
+
+def assign_tags_to_all_papers(api_key, model, force=False):
+    """Assign tags to all papers based on taxonomy.
+
+    Papers whose worklist entry already carries tags are skipped, and
+    completed LLM calls are checkpointed to tags_progress.jsonl, so an
+    interrupted run resumes where it stopped; --force re-tags everything.
+    """
     print("Loading tag taxonomy...")
     taxonomy = load_tag_taxonomy()
     taxonomy_text = format_taxonomy_for_assignment(taxonomy)
@@ -297,45 +608,151 @@ def assign_tags_to_all_papers(api_key, model):
 
     print(f"Found {len(summaries)} papers to tag\n")
 
-    # Track results
-    successful = 0
-    failed = 0
-    skipped = 0
+    resolved, skipped = _resolve_paper_keys(summaries)
 
-    # Process each paper
-    for i, summary_info in enumerate(summaries, 1):
-        pdf_stem = summary_info['file']
-        paper_data = summary_info['data']
+    # Resume support: drop papers that are already tagged in the
+    # worklist, and reuse checkpointed results from an interrupted run
+    if not force:
+        manager = get_worklist_manager()
+        remaining = []
+        for bib_key, summary_info in resolved:
+            if manager.get_tags('papers', bib_key):
+                skipped += 1
+            else:
+                remaining.append((bib_key, summary_info))
+        if len(remaining) < len(resolved):
+            print(f"Skipping {len(resolved) - len(remaining)} already-tagged "
+                  f"papers (use --force to re-tag)")
+        resolved = remaining
+
+    progress = {} if force else _load_progress()
+    to_call = [(bib_key, summary_info) for bib_key, summary_info in resolved
+               if summary_info['file'] not in progress]
+    if len(to_call) < len(resolved):
+        print(f"Resuming: {len(resolved) - len(to_call)} papers already "
+              f"checkpointed in {_PROGRESS_PATH}")
+
+    # Substitute the (identical) taxonomy block once; each task only
+    # splices in its own paper summary
+    prompt_template = load_prompt_template('../prompts/tag_assignment.prompt')
+    prompt_prefix = prompt_template.replace('{{tag_taxonomy}}', taxonomy_text)
 
-        print(f"[{i}/{len(summaries)}] Processing {pdf_stem}")
+    # Each call is dominated by network latency, so run them concurrently,
+    # bounded to stay inside API rate limits
+    concurrency = int(os.getenv('OAI_CONCURRENCY', '8'))
+    print(f"Calling LLM for {len(to_call)} papers ({concurrency} concurrent)...\n")
+    all_tags = asyncio.run(_assign_batch(
+        [(summary_info['file'], summary_info['data']) for _, summary_info in to_call],
+        prompt_prefix, api_key, model, concurrency))
 
-        # Get paper key
-        bib_key = get_paper_key_by_stem(pdf_stem)
-        if not bib_key:
-            print(f"  Warning: No paper key found for PDF stem '{pdf_stem}', skipping")
-            skipped += 1
-            continue
+    tags_by_stem = dict(progress)
+    tags_by_stem.update(
+        (summary_info['file'], tags)
+        for (_, summary_info), tags in zip(to_call, all_tags))
 
-        print(f"  Found paper key: {bib_key}")
+    successful, failed = _apply_tag_results(
+        [(bib_key, summary_info['file'], tags_by_stem.get(summary_info['file'], []))
+         for bib_key, summary_info in resolved])
 
-        # Assign tags
-        print(f"  Calling LLM to assign tags...")
-        tags = assign_tags_to_paper(paper_data, taxonomy_text, api_key, model)
+    # The worklist now holds everything; the checkpoint has served its purpose
+    _PROGRESS_PATH.unlink(missing_ok=True)
 
-        if not tags:
-            print(f"  Warning: No tags assigned")
-            failed += 1
-            continue
+    # Print summary
+    print(f"\n{'='*50}")
+    print(f"Tag assignment complete!")
+    print(f"  Successful: {successful}")
+    print(f"  Failed: {failed}")
+    print(f"  Skipped: {skipped}")
+    print(f"  Total processed: {successful + failed + skipped}")
 
-        print(f"  Assigned tags: {', '.join(tags)}")
 
-        # Set tags via CLI
-        if set_tags_for_paper(bib_key, tags):
-            print(f"  Success!")
-            successful += 1
-        else:
-            print(f"  Failed to set tags")
-            failed += 1
+def assign_tags_via_batch_api(api_key, model, poll_interval=30):
+    """Assign tags to all papers through the OpenAI Batch API.
+
+    Half the per-token price and no RPM contention, at the cost of up to
+    24h turnaround — meant for large runs where latency doesn't matter.
+    """
+    print("Loading tag taxonomy...")
+    taxonomy = load_tag_taxonomy()
+    taxonomy_text = format_taxonomy_for_assignment(taxonomy)
+
+    print(f"Loaded {len(taxonomy)} tags from taxonomy")
+
+    print("\nLoading paper summaries...")
+    summaries = load_all_paper_summaries()
+
+    if not summaries:
+        print("Error: No paper summaries found", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Found {len(summaries)} papers to tag\n")
+
+    resolved, skipped = _resolve_paper_keys(summaries)
+
+    prompt_template = load_prompt_template('../prompts/tag_assignment.prompt')
+    prompt_prefix = prompt_template.replace('{{tag_taxonomy}}', taxonomy_text)
+
+    # One JSONL line per paper, keyed by pdf stem for the result join
+    lines = []
+    for bib_key, summary_info in resolved:
+        prompt = prompt_prefix.replace(
+            '{{paper_summary}}', json.dumps(summary_info['data'], indent=2))
+        lines.append(json.dumps({
+            'custom_id': summary_info['file'],
+            'method': 'POST',
+            'url': '/v1/chat/completions',
+            'body': {
+                'model': model,
+                'messages': [
+                    {"role": "user", "content": prompt}
+                ],
+                'response_format': {"type": "json_object"}
+            }
+        }))
+
+    client = _get_client(api_key)
+    batch_input = client.files.create(
+        file=('tag_assignment_batch.jsonl', '\n'.join(lines).encode('utf-8')),
+        purpose='batch')
+    batch = client.batches.create(input_file_id=batch_input.id,
+                                  endpoint='/v1/chat/completions',
+                                  completion_window='24h')
+    print(f"Submitted batch {batch.id} with {len(lines)} requests; polling...")
+
+    while batch.status in ('validating', 'in_progress', 'finalizing'):
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+        counts = batch.request_counts
+        if counts is not None:
+            print(f"  {batch.status}: {counts.completed}/{counts.total} done, "
+                  f"{counts.failed} failed")
+
+    if batch.status != 'completed':
+        print(f"Error: batch finished with status {batch.status}", file=sys.stderr)
+        sys.exit(1)
+
+    # Join results back to papers by custom_id
+    tags_by_stem = {}
+    output = client.files.content(batch.output_file_id).content
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        stem = item.get('custom_id')
+        response = item.get('response') or {}
+        if response.get('status_code') != 200:
+            print(f"  Warning: request for {stem} failed "
+                  f"(status {response.get('status_code')})", file=sys.stderr)
+            continue
+        try:
+            content = response['body']['choices'][0]['message']['content']
+            tags_by_stem[stem] = _parse_tags_response(content)
+        except (KeyError, IndexError, ValueError) as e:
+            print(f"  Warning: could not parse result for {stem}: {e}", file=sys.stderr)
+
+    successful, failed = _apply_tag_results(
+        [(bib_key, summary_info['file'], tags_by_stem.get(summary_info['file'], []))
+         for bib_key, summary_info in resolved])
 
     # Print summary
     print(f"\n{'='*50}")
@@ -364,9 +781,8 @@ def assign_tags_to_single_paper(paper_key, api_key, model):
 
     print(f"\nLoading paper info for {paper_key}...")
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            paper_data = json.load(f)
-    except json.JSONDecodeError as e:
+        paper_data = _load_json_file(json_file)
+    except ValueError as e:
         print(f"Error: Failed to parse {json_file}: {e}", file=sys.stderr)
         sys.exit(1)
 
@@ -395,6 +811,14 @@ def main():
                         help='Mode: generate taxonomy or assign tags to papers')
     parser.add_argument('--paper',
                         help='For assign mode: assign tags to a single paper by key (e.g., dearstyne2026revealing)')
+    parser.add_argument('--batch', action='store_true',
+                        help='For assign mode: use the OpenAI Batch API '
+                             '(~50%% cheaper, up to 24h turnaround)')
+    parser.add_argument('--force', action='store_true',
+                        help='For assign mode: re-tag papers that already have tags')
+    parser.add_argument('--batch-size', type=int, default=150,
+                        help='For generate mode: summaries per taxonomy call; '
+                             'larger corpora are refined iteratively (default: 150)')
     args = parser.parse_args()
 
     # Load environment variables
@@ -411,7 +835,7 @@ def main():
             print("Error: OPENAI_TAG_GENERATION_MODEL not found in environment", file=sys.stderr)
             sys.exit(1)
         print(f"Generating tag taxonomy using model: {model}\n")
-        generate_tag_taxonomy(api_key, model)
+        generate_tag_taxonomy(api_key, model, batch_size=args.batch_size)
 
     elif args.mode == 'assign':
         model = os.getenv('OPENAI_TAG_ASSIGNMENT_MODEL')
@@ -422,9 +846,12 @@ def main():
         if args.paper:
             print(f"Assigning tags to paper '{args.paper}' using model: {model}\n")
             assign_tags_to_single_paper(args.paper, api_key, model)
+        elif args.batch:
+            print(f"Assigning tags to all papers via the Batch API using model: {model}\n")
+            assign_tags_via_batch_api(api_key, model)
         else:
             print(f"Assigning tags to all papers using model: {model}\n")
-            assign_tags_to_all_papers(api_key, model)
+            assign_tags_to_all_papers(api_key, model, force=args.force)
 
 
 if __name__ == "__main__":
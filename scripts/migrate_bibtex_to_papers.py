@@ -10,10 +10,16 @@ This script:
 """
 
 import json
+import os
 import shutil
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def migrate_paper_data():
     """Migrate the paper_data.json structure."""
 
@@ -25,14 +31,20 @@ def migrate_paper_data():
         print(f"Error: {data_file} not found")
         return False
 
-    # Create backup
+    # Create backup as a hard link: constant-time, no bytes copied. Safe
+    # because the save below replaces the file (new inode) instead of
+    # truncating it in place, so the link keeps the original contents.
     print(f"Creating backup: {backup_file}")
-    shutil.copy(data_file, backup_file)
+    try:
+        os.link(data_file, backup_file)
+    except OSError:
+        # Cross-device or filesystem without hard links
+        shutil.copyfile(data_file, backup_file)
 
     # Load data
     print("Loading paper_data.json...")
-    with open(data_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    raw = data_file.read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
     # Migrate: rename 'bibtex' to 'papers'
     if 'bibtex' in data:
@@ -46,24 +58,33 @@ def migrate_paper_data():
         print("Renaming metadata.total_bibtex → metadata.total_papers")
         data['metadata']['total_papers'] = data['metadata'].pop('total_bibtex')
 
-    # Migrate: update mappings array
+    # Migrate: update mappings array in place; pop with a default does
+    # the membership test and removal in one hash lookup
     if 'mappings' in data:
         print(f"Updating {len(data['mappings'])} mappings...")
         for mapping in data['mappings']:
-            if 'bib_key' in mapping:
-                mapping['paper_key'] = mapping.pop('bib_key')
+            bib_key = mapping.pop('bib_key', None)
+            if bib_key is not None:
+                mapping['paper_key'] = bib_key
 
     # Migrate: update PDF entries that reference bibtex
     if 'pdfs' in data:
         print(f"Updating {len(data['pdfs'])} PDF entries...")
         for pdf_entry in data['pdfs'].values():
-            if 'mapped_bibtex' in pdf_entry:
-                pdf_entry['mapped_paper'] = pdf_entry.pop('mapped_bibtex')
+            mapped = pdf_entry.pop('mapped_bibtex', None)
+            if mapped is not None:
+                pdf_entry['mapped_paper'] = mapped
 
-    # Save migrated data
+    # Save migrated data; write to a temp file and rename so the
+    # hard-linked backup (same inode as the original) is never truncated
     print("Saving migrated data...")
-    with open(data_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    tmp_file = data_file.with_suffix('.json.tmp')
+    if orjson is not None:
+        tmp_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_file, data_file)
 
     print("\n✓ Migration complete!")
     print(f"  Backup saved to: {backup_file}")
@@ -6,51 +6,142 @@ Creates a structured JSON with bib entries and PDF extracts for analysis.
 
 import json
 import re
+import sys
 from pathlib import Path
 
+YEAR_RE = re.compile(r'\d{4}')
+
+
+def _parse_fields(body):
+    """Split an entry body into a field dict, tracking brace depth.
+
+    Fields are separated by top-level commas, so nested values like
+    {Deep {Learning}} stay whole — the old [^}]+ regexes truncated them
+    at the first closing brace.
+    """
+    fields = {}
+
+    def emit(token):
+        name, eq, value = token.partition('=')
+        if not eq:
+            return
+        value = value.strip()
+        if value[:1] == '{' and value[-1:] == '}':
+            value = value[1:-1]
+        elif value[:1] == '"' and value[-1:] == '"':
+            value = value[1:-1]
+        fields[name.strip().lower()] = value
+
+    depth = 0
+    start = 0
+    for i, char in enumerate(body):
+        if char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            emit(body[start:i])
+            start = i + 1
+    emit(body[start:])
+    return fields
+
+
+def _scan_entries(buffer, eof):
+    """Tokenize the complete entries in buffer; returns (entries, consumed).
+
+    Walks the text with find() tracking brace depth, the same approach
+    as the raw-span indexer in _norm.py; keyless blocks (@string,
+    comments) are skipped. An entry whose closing brace hasn't arrived
+    yet is left unconsumed for the next round (unless eof).
+    """
+    found = []
+    pos = 0
+    length = len(buffer)
+    while True:
+        at = buffer.find('@', pos)
+        if at == -1:
+            return found, length
+        brace = buffer.find('{', at)
+        if brace == -1:
+            return (found, length) if eof else (found, at)
+        comma = buffer.find(',', brace)
+
+        # Track brace depth from the opening brace to the entry's end
+        depth = 1
+        i = brace + 1
+        while depth:
+            close_b = buffer.find('}', i)
+            if close_b == -1:
+                if not eof:
+                    return found, at  # entry still incomplete
+                i = length
+                break
+            open_b = buffer.find('{', i, close_b)
+            if open_b != -1:
+                depth += 1
+                i = open_b + 1
+            else:
+                depth -= 1
+                i = close_b + 1
+        pos = i
+
+        if comma == -1 or comma >= i:
+            continue
+        entry_type = buffer[at + 1:brace].strip()
+        key = buffer[brace + 1:comma].strip()
+        body = buffer[comma + 1:i - 1]
+        found.append((entry_type, key, _parse_fields(body), buffer[at:i]))
+
+
+def _iter_bib_entries(fh, chunk_size=1 << 20):
+    """Yield (entry_type, key, fields, raw) without slurping the file.
+
+    Reads in chunks and keeps only the unconsumed tail of a rolling
+    buffer, so peak parsing memory is one chunk plus the largest single
+    entry rather than the whole file.
+    """
+    buffer = ''
+    while True:
+        chunk = fh.read(chunk_size)
+        eof = not chunk
+        buffer += chunk
+        entries, consumed = _scan_entries(buffer, eof)
+        yield from entries
+        buffer = buffer[consumed:]
+        if eof:
+            return
+
+
 def parse_bib_entries(bib_file):
     """Parse bib file to extract entries with key metadata."""
     entries = {}
 
     with open(bib_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Find all entries
-    pattern = r'@(\w+)\{([^,]+),(.*?)\n\}'
-    matches = re.findall(pattern, content, re.DOTALL)
-
-    for entry_type, key, fields in matches:
-        # Extract key fields
-        entry = {
-            'type': entry_type,
-            'key': key,
-            'raw': f"@{entry_type}{{{key},{fields}\n}}"
-        }
-
-        # Extract title
-        title_match = re.search(r'title\s*=\s*\{([^}]+)\}', fields)
-        if title_match:
-            entry['title'] = title_match.group(1)
-
-        # Extract authors
-        author_match = re.search(r'author\s*=\s*\{([^}]+)\}', fields)
-        if author_match:
-            entry['authors'] = author_match.group(1)
-
-        # Extract year
-        year_match = re.search(r'year\s*=\s*\{(\d{4})\}', fields)
-        if year_match:
-            entry['year'] = year_match.group(1)
-
-        # Extract journal/booktitle
-        journal_match = re.search(r'journal\s*=\s*\{([^}]+)\}', fields)
-        booktitle_match = re.search(r'booktitle\s*=\s*\{([^}]+)\}', fields)
-        if journal_match:
-            entry['venue'] = journal_match.group(1)
-        elif booktitle_match:
-            entry['venue'] = booktitle_match.group(1)
-
-        entries[key] = entry
+        for entry_type, key, fields, raw in _iter_bib_entries(f):
+            # Extract key fields; type/year/venue repeat across most of
+            # the corpus, so intern them to share one str object per
+            # distinct value (titles and authors are mostly unique)
+            entry = {
+                'type': sys.intern(entry_type),
+                'key': key,
+                'raw': raw
+            }
+
+            if 'title' in fields:
+                entry['title'] = fields['title']
+
+            if 'author' in fields:
+                entry['authors'] = fields['author']
+
+            year = fields.get('year', '')
+            if YEAR_RE.fullmatch(year):
+                entry['year'] = sys.intern(year)
+
+            venue = fields.get('journal') or fields.get('booktitle')
+            if venue:
+                entry['venue'] = sys.intern(venue)
+
+            entries[key] = entry
 
     return entries
 
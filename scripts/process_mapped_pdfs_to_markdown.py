@@ -14,12 +14,18 @@ This script:
 Usage: python process_mapped_pdfs_to_markdown.py [--force] [--pdfs-dir PDFS_DIR]
 """
 
+import asyncio
 import json
+import os
 import sys
-import subprocess
 import argparse
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def load_worklist(worklist_path='../paper_data.json'):
     """Load the worklist JSON file."""
@@ -30,8 +36,8 @@ def load_worklist(worklist_path='../paper_data.json'):
         print(f"Error: Worklist not found at {worklist_path}", file=sys.stderr)
         sys.exit(1)
 
-    with open(worklist_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    raw = worklist_path.read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 
 def get_mapped_pdfs(worklist):
@@ -45,67 +51,70 @@ def get_mapped_pdfs(worklist):
     return mapped_pdfs
 
 
-def generate_markdown_for_pdf(pdf_name, pdfs_dir, markdowns_dir):
+async def generate_markdowns(pdfs_to_process, pdfs_dir, markdowns_dir, jobs):
     """
-    Generate markdown for a PDF file.
+    Generate markdown for many PDFs concurrently.
 
-    Args:
-        pdf_name: Name of the PDF file
-        pdfs_dir: Directory containing the PDF files
-        markdowns_dir: Directory where markdown files should be saved
+    Each PDF is independent and the work is CPU-bound inside
+    generate_markdown.py, so up to `jobs` subprocesses run at once.
 
     Returns:
-        str: Path to the generated markdown file, or None if failed
+        list: (pdf_name, markdown_path-or-None) pairs in input order
     """
-    pdf_path = pdfs_dir / pdf_name
-    if not pdf_path.exists():
-        print(f"  Warning: PDF file not found at {pdf_path}", file=sys.stderr)
-        return None
-
-    # Create markdown filename (same as PDF but with .md extension)
-    md_name = pdf_name.replace('.pdf', '.md')
-    md_path = markdowns_dir / md_name
-
-    # Run generate_markdown.py (in same directory as this script)
+    # generate_markdown.py is in the same directory as this script
     script_dir = Path(__file__).parent
     generate_script = script_dir / 'generate_markdown.py'
-    cmd = [
-        sys.executable,
-        str(generate_script),
-        str(pdf_path),
-        str(md_path)
-    ]
+    sem = asyncio.Semaphore(jobs)
 
-    print(f"  Generating markdown for {pdf_name}...")
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    async def run_one(pdf_name):
+        pdf_path = pdfs_dir / pdf_name
+        if not pdf_path.exists():
+            print(f"  Warning: PDF file not found at {pdf_path}", file=sys.stderr)
+            return pdf_name, None
 
-    if result.returncode != 0:
-        print(f"  Error generating markdown: {result.stderr}", file=sys.stderr)
-        return None
+        # Create markdown filename (same as PDF but with .md extension)
+        md_path = markdowns_dir / pdf_name.replace('.pdf', '.md')
 
-    return str(md_path)
+        async with sem:
+            print(f"  Generating markdown for {pdf_name}...")
+            proc = await asyncio.create_subprocess_exec(
+                sys.executable, str(generate_script), str(pdf_path), str(md_path),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE)
+            _, stderr = await proc.communicate()
 
+        if proc.returncode != 0:
+            print(f"  Error generating markdown: "
+                  f"{stderr.decode('utf-8', errors='replace')}", file=sys.stderr)
+            return pdf_name, None
 
-def update_worklist_with_markdown(pdf_name, markdown_path):
-    """Update the worklist to add the markdown_file field to a PDF entry."""
-    # CLI is in parent directory
-    script_dir = Path(__file__).parent
-    cli_script = (script_dir / '../paper_data_cli.py').resolve()
-    cmd = [
-        sys.executable,
-        str(cli_script),
-        'pdf', 'set-markdown',
-        pdf_name,
-        markdown_path
-    ]
+        return pdf_name, str(md_path)
+
+    return await asyncio.gather(*[run_one(pdf_name) for pdf_name in pdfs_to_process])
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
 
-    if result.returncode != 0:
-        print(f"  Error updating worklist: {result.stderr}", file=sys.stderr)
-        return False
+_manager = None
 
-    return True
+
+def get_worklist_manager():
+    """Shared in-process WorklistManager.
+
+    Replaces one paper_data_cli.py fork per PDF, each of which re-read
+    and re-wrote the whole worklist.
+    """
+    global _manager
+    if _manager is None:
+        # paper_data_cli.py lives at the repo root, one level up from scripts/
+        root = Path(__file__).resolve().parent.parent
+        sys.path.insert(0, str(root))
+        from paper_data_cli import WorklistManager
+        _manager = WorklistManager(str(root / 'paper_data.json'))
+    return _manager
+
+
+def update_worklist_with_markdown(pdf_name, markdown_path):
+    """Update the worklist to add the markdown_file field to a PDF entry."""
+    return get_worklist_manager().set_markdown_file(pdf_name, markdown_path)
 
 
 def main():
@@ -116,6 +125,8 @@ def main():
                         help='Directory containing PDF files (default: pdfs)')
     parser.add_argument('--markdowns-dir', default='markdowns',
                         help='Directory to save markdown files (default: markdowns)')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(),
+                        help='Concurrent markdown generations (default: CPU count)')
     args = parser.parse_args()
 
     # Set up directories
@@ -156,26 +167,28 @@ def main():
     successful = 0
     failed = 0
 
-    # Process each PDF
-    for i, pdf_name in enumerate(pdfs_to_process, 1):
-        print(f"[{i}/{len(pdfs_to_process)}] Processing {pdf_name}")
+    # Generate all markdowns concurrently, then record the results
+    results = asyncio.run(generate_markdowns(pdfs_to_process, pdfs_dir,
+                                             markdowns_dir, args.jobs))
 
-        # Generate markdown
-        markdown_path = generate_markdown_for_pdf(pdf_name, pdfs_dir, markdowns_dir)
+    # One deferred save for the whole batch instead of a write per PDF
+    with get_worklist_manager().batch():
+        for i, (pdf_name, markdown_path) in enumerate(results, 1):
+            print(f"[{i}/{len(results)}] {pdf_name}")
 
-        if not markdown_path:
-            print(f"  Failed to generate markdown")
-            failed += 1
-            continue
+            if not markdown_path:
+                print(f"  Failed to generate markdown")
+                failed += 1
+                continue
 
-        # Update worklist
-        if not update_worklist_with_markdown(pdf_name, markdown_path):
-            print(f"  Failed to update worklist")
-            failed += 1
-            continue
+            # Update worklist
+            if not update_worklist_with_markdown(pdf_name, markdown_path):
+                print(f"  Failed to update worklist")
+                failed += 1
+                continue
 
-        successful += 1
-        print(f"  Success! Markdown saved to {markdown_path}")
+            successful += 1
+            print(f"  Success! Markdown saved to {markdown_path}")
 
     # Print summary
     print(f"\n{'='*50}")
@@ -4,154 +4,100 @@ Process all mapped papers to extract structured information using OpenAI.
 
 This script:
 1. Creates paper_info_json/ directory if it doesn't exist
-2. Uses CLI to find all paper entries that have associated markdown files
+2. Finds all paper entries that have associated markdown files
 3. For each entry:
    - Checks if extracted_paper_info already exists (skip unless --force)
    - Gets the markdown file path from the associated PDF
-   - Calls extract_paper_info.py to generate JSON summary
+   - Runs the extraction from extract_paper_info concurrently over the API
    - Verifies the output JSON is valid
-   - Updates the paper entry with the extracted info using CLI
+   - Updates the paper entry with the extracted info
 4. Reports success/failure statistics
 
 Usage: python process_papers_extract_info.py [--force]
 """
 
+import asyncio
 import os
 import sys
 import json
-import subprocess
 import argparse
 from pathlib import Path
+from dotenv import load_dotenv
+from openai import AsyncOpenAI
 
+from extract_paper_info import load_prompt_template, _extract_one
 
-def ensure_paper_info_json_dir():
-    """Create paper_info_json directory if it doesn't exist."""
-    paper_info_dir = Path('paper_info_json')
-    paper_info_dir.mkdir(exist_ok=True)
-    return paper_info_dir
-
-
-def get_paper_entries_with_markdown():
-    """Get list of paper keys that have associated markdown files."""
-    cmd = [
-        sys.executable,
-        '../paper_data_cli.py',
-        'paper', 'list-with-markdown',
-        '--status', 'MAPPED'
-    ]
-
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    if result.returncode != 0:
-        print(f"Error getting paper entries: {result.stderr}", file=sys.stderr)
-        sys.exit(1)
-
-    # Parse output - one bib_key per line
-    bib_keys = [line.strip() for line in result.stdout.strip().split('\n') if line.strip()]
-    return bib_keys
-
-
-def get_paper_entry_details(bib_key):
-    """Get full details of a paper entry."""
-    cmd = [
-        sys.executable,
-        '../paper_data_cli.py',
-        'get',
-        'papers',
-        bib_key
-    ]
-
-    result = subprocess.run(cmd, capture_output=True, text=True)
 
-    if result.returncode != 0:
-        print(f"Error getting entry details for {bib_key}: {result.stderr}", file=sys.stderr)
-        return None
+_manager = None
 
-    try:
-        return json.loads(result.stdout)
-    except json.JSONDecodeError as e:
-        print(f"Error parsing JSON for {bib_key}: {e}", file=sys.stderr)
-        return None
 
+def get_worklist_manager():
+    """Shared in-process WorklistManager.
 
-def get_pdf_entry_details(pdf_name):
-    """Get full details of a PDF entry."""
-    cmd = [
-        sys.executable,
-        '../paper_data_cli.py',
-        'get',
-        'pdfs',
-        pdf_name
-    ]
+    The old flow forked paper_data_cli.py three-plus times per paper
+    (list, get paper, get PDF, update); every call is a dict lookup on
+    one loaded worklist now.
+    """
+    global _manager
+    if _manager is None:
+        # paper_data_cli.py lives at the repo root, one level up from scripts/
+        root = Path(__file__).resolve().parent.parent
+        sys.path.insert(0, str(root))
+        from paper_data_cli import WorklistManager
+        _manager = WorklistManager(str(root / 'paper_data.json'))
+    return _manager
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
 
-    if result.returncode != 0:
-        print(f"Error getting PDF details for {pdf_name}: {result.stderr}", file=sys.stderr)
-        return None
+def ensure_paper_info_json_dir():
+    """Create paper_info_json directory if it doesn't exist."""
+    paper_info_dir = Path('paper_info_json')
+    paper_info_dir.mkdir(exist_ok=True)
+    return paper_info_dir
 
-    try:
-        return json.loads(result.stdout)
-    except json.JSONDecodeError as e:
-        print(f"Error parsing JSON for PDF {pdf_name}: {e}", file=sys.stderr)
-        return None
 
+def get_paper_entries_with_markdown():
+    """Joined rows for every MAPPED paper with a markdown file.
 
-def extract_paper_info(markdown_path, output_json_path):
+    The join against the PDF entry happens here in one pass, so the
+    prefilter loop below never fetches paper or PDF records one key at
+    a time. Returns dicts of bib_key / extracted_paper_info /
+    markdown_file.
     """
-    Call extract_paper_info.py to extract information from markdown.
+    manager = get_worklist_manager()
+    pdfs = manager.data['pdfs']
+    return [{
+        'bib_key': bib_key,
+        'extracted_paper_info': entry.get('extracted_paper_info'),
+        'markdown_file': pdfs[entry['mapped_pdf']]['markdown_file'],
+    } for bib_key, entry in manager.get_paper_with_markdown('MAPPED')]
 
-    Returns:
-        bool: True if successful, False otherwise
-    """
-    cmd = [
-        sys.executable,
-        'extract_paper_info.py',
-        str(markdown_path),
-        str(output_json_path)
-    ]
-
-    print(f"  Extracting information from {markdown_path}...")
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    if result.returncode != 0:
-        print(f"  Error: extract_paper_info.py failed with exit code {result.returncode}", file=sys.stderr)
-        print(f"  {result.stderr}", file=sys.stderr)
-        return False
 
-    # Verify output file exists
-    if not output_json_path.exists():
-        print(f"  Error: Output JSON file not created at {output_json_path}", file=sys.stderr)
-        return False
-
-    # Verify it's valid JSON
+def update_paper_with_extracted_info(bib_key, json_file_path):
+    """Update paper entry with extracted info."""
     try:
-        with open(output_json_path, 'r', encoding='utf-8') as f:
-            json.load(f)
+        with open(json_file_path, 'r', encoding='utf-8') as f:
+            info_data = json.load(f)
     except json.JSONDecodeError as e:
         print(f"  Error: Output JSON is invalid: {e}", file=sys.stderr)
         return False
 
-    return True
+    return get_worklist_manager().set_extracted_paper_info(bib_key, info_data)
 
 
-def update_paper_with_extracted_info(bib_key, json_file_path):
-    """Update paper entry with extracted info using CLI."""
-    cmd = [
-        sys.executable,
-        '../paper_data_cli.py',
-        'paper', 'set-extracted-info',
-        bib_key,
-        str(json_file_path)
-    ]
-
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    if result.returncode != 0:
-        print(f"  Error updating worklist: {result.stderr}", file=sys.stderr)
-        return False
+async def _extract_all(items, api_key, model, concurrency):
+    """Run all extractions concurrently against the API.
 
-    return True
+    Each extraction is dominated by the OpenAI round-trip, so fanning
+    out with a bounded semaphore turns N serial network waits into
+    roughly N/concurrency. Returns per-item success flags in order.
+    """
+    client = AsyncOpenAI(api_key=api_key)
+    sem = asyncio.Semaphore(concurrency)
+    prompt_template = load_prompt_template()
+    prompt_head, _, prompt_tail = prompt_template.partition('{{paper_markdown}}')
+    return await asyncio.gather(
+        *[_extract_one(client, sem, item, prompt_head, prompt_tail, model)
+          for item in items])
 
 
 def main():
@@ -160,52 +106,42 @@ def main():
                         help='Regenerate extracted info even if it already exists')
     args = parser.parse_args()
 
+    # Load environment variables
+    load_dotenv()
+
+    api_key = os.getenv('OPENAI_API_KEY')
+    model = os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
+
+    if not api_key:
+        print("Error: OPENAI_API_KEY not found in environment", file=sys.stderr)
+        print("Please create a .env file with your API key", file=sys.stderr)
+        sys.exit(1)
+
     # Create paper_info_json directory
     print("Setting up paper_info_json directory...")
     paper_info_dir = ensure_paper_info_json_dir()
 
-    # Get all paper entries with markdown
+    # Get all paper entries with markdown, joined with their PDF entry
     print("Finding paper entries with markdown...")
-    bib_keys = get_paper_entries_with_markdown()
+    rows = get_paper_entries_with_markdown()
 
-    if not bib_keys:
+    if not rows:
         print("No paper entries with markdown found")
         return
 
-    print(f"Found {len(bib_keys)} paper entries with markdown")
+    print(f"Found {len(rows)} paper entries with markdown")
 
-    # Filter entries that need processing
+    # Filter entries that need processing — pure dict lookups, no fetches
     entries_to_process = []
-    for bib_key in bib_keys:
-        bib_entry = get_paper_entry_details(bib_key)
-        if not bib_entry:
-            print(f"Warning: Could not get details for {bib_key}, skipping")
-            continue
-
+    for row in rows:
         # Skip if already has extracted_paper_info (unless --force)
-        if not args.force and bib_entry.get('extracted_paper_info'):
-            print(f"Skipping {bib_key} (extracted_paper_info already exists). Use --force to regenerate.")
-            continue
-
-        # Get PDF details to find markdown path
-        mapped_pdf = bib_entry.get('mapped_pdf')
-        if not mapped_pdf:
-            print(f"Warning: {bib_key} has no mapped_pdf, skipping")
-            continue
-
-        pdf_entry = get_pdf_entry_details(mapped_pdf)
-        if not pdf_entry:
-            print(f"Warning: Could not get PDF details for {mapped_pdf}, skipping {bib_key}")
-            continue
-
-        markdown_file = pdf_entry.get('markdown_file')
-        if not markdown_file:
-            print(f"Warning: {mapped_pdf} has no markdown_file, skipping {bib_key}")
+        if not args.force and row['extracted_paper_info']:
+            print(f"Skipping {row['bib_key']} (extracted_paper_info already exists). Use --force to regenerate.")
             continue
 
         entries_to_process.append({
-            'bib_key': bib_key,
-            'markdown_file': markdown_file
+            'bib_key': row['bib_key'],
+            'markdown_file': row['markdown_file']
         })
 
     if not entries_to_process:
@@ -218,32 +154,39 @@ def main():
     successful = 0
     failed = 0
 
-    # Process each entry
-    for i, entry in enumerate(entries_to_process, 1):
-        bib_key = entry['bib_key']
-        markdown_file = entry['markdown_file']
-
-        print(f"[{i}/{len(entries_to_process)}] Processing {bib_key}")
-
-        # Define output path using markdown filename (without extension)
-        markdown_path = Path(markdown_file)
+    # Run every extraction concurrently, then record the results
+    items = []
+    for entry in entries_to_process:
+        markdown_path = Path(entry['markdown_file'])
         json_filename = markdown_path.stem + '.json'  # Use stem to get filename without extension
-        output_json_path = paper_info_dir / json_filename
-
-        # Extract information
-        if not extract_paper_info(Path(markdown_file), output_json_path):
-            print(f"  Failed to extract information")
-            failed += 1
-            continue
-
-        # Update worklist
-        if not update_paper_with_extracted_info(bib_key, output_json_path):
-            print(f"  Failed to update worklist")
-            failed += 1
-            continue
+        items.append({
+            'markdown': entry['markdown_file'],
+            'output': str(paper_info_dir / json_filename)
+        })
 
-        successful += 1
-        print(f"  Success! Info saved to {output_json_path}")
+    concurrency = int(os.getenv('OAI_CONCURRENCY', '8'))
+    results = asyncio.run(_extract_all(items, api_key, model, concurrency))
+
+    # One deferred save for the whole batch instead of a write per paper
+    with get_worklist_manager().batch():
+        for i, (entry, item, ok) in enumerate(
+                zip(entries_to_process, items, results), 1):
+            bib_key = entry['bib_key']
+            print(f"[{i}/{len(entries_to_process)}] Processing {bib_key}")
+
+            if not ok:
+                print(f"  Failed to extract information")
+                failed += 1
+                continue
+
+            # Update worklist
+            if not update_paper_with_extracted_info(bib_key, item['output']):
+                print(f"  Failed to update worklist")
+                failed += 1
+                continue
+
+            successful += 1
+            print(f"  Success! Info saved to {item['output']}")
 
     # Print summary
     print(f"\n{'='*50}")
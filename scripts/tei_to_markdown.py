@@ -21,11 +21,50 @@ Examples:
 """
 
 import argparse
+import io
 import re
+import sys
 from lxml import etree
 
 NS = {"t": "http://www.tei-c.org/ns/1.0"}
 
+# Shared parser tuned for read-only conversion: skip building the XML:ID
+# hash table (we look ids up via our own refmap, not the parser's).
+# A fully streaming iterparse doesn't fit here: inline citations need
+# the back-matter biblStructs resolved before the body is walked, and
+# section divs nest, so the tree is needed whole anyway. Whitespace-only
+# text nodes are kept — dropping them can merge words around inline refs.
+_PARSER = etree.XMLParser(collect_ids=False)
+
+# XPath expressions compiled once at import. lxml recompiles a string
+# expression on every .xpath() call, which dominates build_biblio_map on
+# reference-heavy papers; as callables the compile cost is paid once.
+_XP_BIBLSTRUCT = etree.XPath("//t:back//t:listBibl//t:biblStruct", namespaces=NS)
+_XP_ALL_TEXT = etree.XPath(".//text()", namespaces=NS)
+_XP_TITLE = etree.XPath("string(//t:teiHeader//t:titleStmt/t:title)", namespaces=NS)
+_XP_ABSTRACT = etree.XPath("//t:abstract", namespaces=NS)
+_XP_STRING = etree.XPath("string()")
+_XP_DIRECT_P = etree.XPath("./t:p", namespaces=NS)
+_XP_DIRECT_FIG = etree.XPath("./t:figure", namespaces=NS)
+_XP_DIRECT_TABLE = etree.XPath("./t:table", namespaces=NS)
+_XP_FIGDESC = etree.XPath(".//t:figDesc//text()", namespaces=NS)
+_XP_TABLE_HEAD = etree.XPath(".//t:head//text()", namespaces=NS)
+
+# Clark-notation tags for the single-pass biblStruct walk below
+_TEI = "{http://www.tei-c.org/ns/1.0}"
+_TAG_ANALYTIC = _TEI + "analytic"
+_TAG_MONOGR = _TEI + "monogr"
+_TAG_AUTHOR = _TEI + "author"
+_TAG_TITLE = _TEI + "title"
+_TAG_SURNAME = _TEI + "surname"
+_TAG_ORGNAME = _TEI + "orgName"
+_REF_TAG = _TEI + "ref"
+
+# Section-numbering patterns for detect_heading_level, compiled once
+_RE_ROMAN = re.compile(r'^[IVX]+\.?\s+')
+_RE_LETTER = re.compile(r'^[A-Z]\.?\s+')
+_RE_NUM = re.compile(r'^(?:\d+\.?|\(\d+\))\s+')
+
 def norm_space(s: str) -> str:
     return re.sub(r"\s+", " ", (s or "")).strip()
 
@@ -36,31 +75,64 @@ def get_text(node) -> str:
 def build_biblio_map(doc):
     """
     Build a map from reference xml:id -> dict with 'surname', 'title', 'full'
+
+    Each biblStruct is walked exactly once with iterwalk; the old version
+    ran five separate XPath traversals of the same subtree per entry
+    (analytic/monogr title, two surname variants, orgName) plus a sixth
+    for the full text.
     """
     refmap = {}
-    for bibl in doc.xpath("//t:back//t:listBibl//t:biblStruct", namespaces=NS):
+    for bibl in _XP_BIBLSTRUCT(doc):
         bid = bibl.get("{http://www.w3.org/XML/1998/namespace}id")
         if not bid:
             continue
 
-        # Try analytic (article) title first, then monogr (book/conference)
-        title = bibl.xpath("string(.//t:analytic//t:title)", namespaces=NS).strip()
-        if not title:
-            title = bibl.xpath("string(.//t:monogr//t:title)", namespaces=NS).strip()
-
-        # First author surname (prefer analytic authors, then monogr)
-        surname = bibl.xpath("string(.//t:analytic//t:author[1]//t:persName//t:surname)", namespaces=NS).strip()
-        if not surname:
-            surname = bibl.xpath("string(.//t:monogr//t:author[1]//t:persName//t:surname)", namespaces=NS).strip()
-        if not surname:
-            # Sometimes orgName is present; fall back to that
-            surname = bibl.xpath("string(.//t:author[1]//t:orgName)", namespaces=NS).strip()
-
-        full = norm_space(" ".join(bibl.xpath(".//text()", namespaces=NS)))
+        # Titles prefer analytic (article) over monogr (book/conference);
+        # surnames prefer the first analytic author, then the first monogr
+        # author, then an orgName on a first author as last resort.
+        a_title = m_title = a_surname = m_surname = org_name = None
+        section = None          # analytic/monogr container we're inside
+        in_first_author = False
+        authors_seen = 0
+        texts = []
+
+        for ev, node in etree.iterwalk(bibl, events=("start", "end")):
+            tag = node.tag
+            if ev == "start":
+                if node.text:
+                    texts.append(node.text)
+                if tag == _TAG_ANALYTIC or tag == _TAG_MONOGR:
+                    section = tag
+                    authors_seen = 0
+                elif tag == _TAG_AUTHOR:
+                    authors_seen += 1
+                    in_first_author = authors_seen == 1
+                elif tag == _TAG_TITLE:
+                    if section == _TAG_ANALYTIC and a_title is None:
+                        a_title = "".join(node.itertext())
+                    elif section == _TAG_MONOGR and m_title is None:
+                        m_title = "".join(node.itertext())
+                elif tag == _TAG_SURNAME and in_first_author:
+                    if section == _TAG_ANALYTIC and a_surname is None:
+                        a_surname = "".join(node.itertext())
+                    elif section == _TAG_MONOGR and m_surname is None:
+                        m_surname = "".join(node.itertext())
+                elif tag == _TAG_ORGNAME and in_first_author and org_name is None:
+                    org_name = "".join(node.itertext())
+            else:
+                if tag == _TAG_ANALYTIC or tag == _TAG_MONOGR:
+                    section = None
+                elif tag == _TAG_AUTHOR:
+                    in_first_author = False
+                if node is not bibl and node.tail:
+                    texts.append(node.tail)
+
+        title = (a_title or m_title or "").strip()
+        surname = (a_surname or m_surname or org_name or "").strip()
         refmap[bid] = {
             "surname": surname or "Unknown",
             "title": title or "Untitled",
-            "full": full
+            "full": norm_space(" ".join(texts))
         }
     return refmap
 
@@ -86,27 +158,31 @@ def para_text_with_inline_cites(element, refmap, style, omit_citations=False):
     """
     parts = []
 
-    def recurse(node):
-        # If it's a citation ref
-        if node.tag == f"{{{NS['t']}}}ref" and node.get("type") == "bibr":
-            if omit_citations:
-                # Skip the citation entirely
-                return
-            elif style:
-                # Replace with formatted citation
-                target = node.get("target", "").lstrip("#")
-                parts.append(cite_string(target, refmap, style))
-                return
-        # Otherwise append node text if present
-        if node.text:
-            parts.append(node.text)
-        # Recurse children
-        for child in node:
-            recurse(child)
-            if child.tail:
-                parts.append(child.tail)
-
-    recurse(element)
+    # iterwalk instead of Python recursion: no per-node call frames on
+    # deep trees, and the ref tag is a hoisted constant rather than an
+    # f-string rebuilt (and rehashed) for every element visited.
+    walker = etree.iterwalk(element, events=("start", "end"))
+    for ev, node in walker:
+        if ev == "start":
+            # If it's a citation ref, replace or drop it whole; its tail
+            # still arrives with the end event below
+            if node.tag == _REF_TAG and node.get("type") == "bibr":
+                if omit_citations:
+                    # Skip the citation entirely
+                    walker.skip_subtree()
+                    continue
+                elif style:
+                    # Replace with formatted citation
+                    target = node.get("target", "").lstrip("#")
+                    parts.append(cite_string(target, refmap, style))
+                    walker.skip_subtree()
+                    continue
+            # Otherwise append node text if present
+            if node.text:
+                parts.append(node.text)
+        elif node is not element and node.tail:
+            parts.append(node.tail)
+
     return norm_space("".join(parts))
 
 def detect_heading_level(text, default_depth=2):
@@ -120,21 +196,19 @@ def detect_heading_level(text, default_depth=2):
     - Numbers (1., 2., 3., etc.) or (1), (2), (3) -> Level 3
     - Otherwise use default_depth
     """
-    import re
-
     # Strip and normalize text
     text = text.strip()
 
     # Roman numeral pattern at start (I., II., III., IV., V., VI., VII., VIII., IX., X., etc.)
-    if re.match(r'^[IVX]+\.?\s+', text):
+    if _RE_ROMAN.match(text):
         return 1
 
     # Single letter pattern (A., B., C., etc.)
-    if re.match(r'^[A-Z]\.?\s+', text):
+    if _RE_LETTER.match(text):
         return 2
 
     # Number pattern (1., 2., 3.) or (1), (2), (3)
-    if re.match(r'^\d+\.?\s+', text) or re.match(r'^\(\d+\)\s+', text):
+    if _RE_NUM.match(text):
         return 3
 
     # Default to provided depth
@@ -145,11 +219,10 @@ def heading_md(level, text, max_level=3):
     return f'{"#"*lvl} {text}'.strip()
 
 def extract_title(doc):
-    title = doc.xpath("string(//t:teiHeader//t:titleStmt/t:title)", namespaces=NS)
-    return norm_space(title)
+    return norm_space(_XP_TITLE(doc))
 
 def extract_abstract(doc):
-    abstr = doc.xpath("//t:abstract", namespaces=NS)
+    abstr = _XP_ABSTRACT(doc)
     if not abstr:
         return ""
     # Prefer preserving inline citation replacements here too (rare in abstracts, but possible)
@@ -159,47 +232,56 @@ def walk_body_divs(div, refmap, style, depth=1, max_level=3, omit_citations=Fals
     """
     Yield Markdown chunks for a div (section) recursively.
     """
-    chunks = []
+    # Generator so nested sections stream straight into the caller's md
+    # list; `last` tracks the most recent chunk (None = nothing emitted)
+    # to preserve the trailing-blank spacing without materializing lists.
+    last = None
+
     # Some TEI use <head> for section titles; there can be multiple heads; use the first visible one
     head = div.find("t:head", namespaces=NS)
     if head is not None:
-        htxt = norm_space(head.xpath("string()", namespaces=NS))
+        htxt = norm_space(_XP_STRING(head))
         if htxt:
             # Use pattern detection to determine the appropriate heading level
             detected_level = detect_heading_level(htxt, default_depth=depth)
-            chunks.append(heading_md(detected_level, htxt, max_level))
-            chunks.append("")
+            yield heading_md(detected_level, htxt, max_level)
+            yield ""
+            last = ""
 
     # Process only direct children elements (not nested in subdivs)
     # First collect all child divs to exclude their content
     child_divs = div.findall("t:div", namespaces=NS)
 
     # Paragraphs - only direct children not inside nested divs
-    for p in div.xpath("./t:p", namespaces=NS):
+    for p in _XP_DIRECT_P(div):
         text = para_text_with_inline_cites(p, refmap, style, omit_citations=omit_citations)
         if text:
-            chunks.append(text)
+            yield text
+            last = text
 
     # Figures - only direct children not inside nested divs
-    for fig in div.xpath("./t:figure", namespaces=NS):
-        cap = norm_space(" ".join(fig.xpath(".//t:figDesc//text()", namespaces=NS)))
+    for fig in _XP_DIRECT_FIG(div):
+        cap = norm_space(" ".join(_XP_FIGDESC(fig)))
         if cap:
-            chunks.append(f"> **Figure.** {cap}")
+            last = f"> **Figure.** {cap}"
+            yield last
 
     # Tables - only direct children not inside nested divs
-    for tb in div.xpath("./t:table", namespaces=NS):
-        cap = norm_space(" ".join(tb.xpath(".//t:head//text()", namespaces=NS)))
+    for tb in _XP_DIRECT_TABLE(div):
+        cap = norm_space(" ".join(_XP_TABLE_HEAD(tb)))
         if cap:
-            chunks.append(f"> **Table.** {cap}")
+            last = f"> **Table.** {cap}"
+            yield last
 
     # Recurse into child divs as subsections with incremented depth
     for child in child_divs:
-        chunks.extend(walk_body_divs(child, refmap, style, depth=depth+1, max_level=max_level, omit_citations=omit_citations))
+        for chunk in walk_body_divs(child, refmap, style, depth=depth+1, max_level=max_level, omit_citations=omit_citations):
+            yield chunk
+            last = chunk
 
     # Spacing after a section
-    if chunks and chunks[-1] != "":
-        chunks.append("")
-    return chunks
+    if last is not None and last != "":
+        yield ""
 
 def tei_to_markdown(doc, inline_style=None, max_level=3, omit_references=False, omit_citations=False):
     """
@@ -233,20 +315,34 @@ def tei_to_markdown(doc, inline_style=None, max_level=3, omit_references=False,
     # References
     # We keep the original numbered list (in order as in TEI), even if inline citations were rewritten.
     if not omit_references:
-        bibls = doc.xpath("//t:back//t:listBibl//t:biblStruct", namespaces=NS)
+        bibls = _XP_BIBLSTRUCT(doc)
         if bibls:
             md.append(heading_md(2, "References", max_level=max_level))
             md.append("")
             for i, bibl in enumerate(bibls, 1):
-                full = norm_space(" ".join(bibl.xpath(".//text()", namespaces=NS)))
+                full = norm_space(" ".join(_XP_ALL_TEXT(bibl)))
                 md.append(f"{i}. {full}")
             md.append("")
 
     return "\n".join(md).rstrip() + "\n"
 
+def convert(tei_xml, inline_citations=None, max_level=3, omit_references=False, omit_citations=False):
+    """
+    Convert TEI XML (bytes or str) to a Markdown string, in-process.
+
+    This is the library entry point for callers like generate_markdown.py,
+    which would otherwise pay a fresh interpreter + lxml import per PDF by
+    shelling out to the CLI below.
+    """
+    if isinstance(tei_xml, str):
+        tei_xml = tei_xml.encode("utf-8")
+    doc = etree.parse(io.BytesIO(tei_xml), _PARSER)
+    return tei_to_markdown(doc, inline_style=inline_citations, max_level=max_level,
+                           omit_references=omit_references, omit_citations=omit_citations)
+
 def main():
     ap = argparse.ArgumentParser(description="Convert GROBID TEI XML to Markdown with optional inline citation replacement.")
-    ap.add_argument("input", help="Input TEI XML from GROBID")
+    ap.add_argument("input", help="Input TEI XML from GROBID ('-' reads stdin)")
     ap.add_argument("output", help="Output Markdown file")
     ap.add_argument("--inline-citations", choices=["author-title"], default=None,
                     help="Rewrite inline citations, e.g., (Surname, \"Title\").")
@@ -258,7 +354,7 @@ def main():
                     help="Remove inline citation markers from the text")
     args = ap.parse_args()
 
-    doc = etree.parse(args.input)
+    doc = etree.parse(sys.stdin.buffer if args.input == "-" else args.input, _PARSER)
     md = tei_to_markdown(doc, inline_style=args.inline_citations, max_level=args.max_level,
                         omit_references=args.omit_references, omit_citations=args.omit_citations)
     with open(args.output, "w", encoding="utf-8") as f:
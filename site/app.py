@@ -1,9 +1,11 @@
 from flask import Flask, send_from_directory, send_file, request, Response, stream_with_context, session, jsonify
-from flask_apscheduler import APScheduler
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 from openai import AzureOpenAI
+import functools
+import hashlib
 import threading
+import time
 import logging
 import secrets
 import tiktoken
@@ -29,7 +31,6 @@ MAX_MESSAGE_TOKENS = 1000
 MAX_MESSAGES_PER_CONVERSATION = 10
 MAX_MESSAGES_PER_HOUR = 20
 INACTIVITY_TIMEOUT_MINUTES = 10
-CLEANUP_INTERVAL_MINUTES = 5
 
 # System prompt template
 SYSTEM_PROMPT_TEMPLATE = """You are an AI assistant for discussing a specific research paper.
@@ -169,23 +170,34 @@ paper_chat_client = None
 chat_store = None
 paper_data_cache = None
 canned_questions = []
-scheduler = APScheduler()
 
 
 # ============================================================================
 # Initialization Functions
 # ============================================================================
 
+@functools.lru_cache(maxsize=None)
+def _get_encoding(model):
+    """Cached tiktoken encoder; encoding_for_model is far too slow to
+    run on every request."""
+    return tiktoken.encoding_for_model(model)
+
+
 def count_tokens(text, model="gpt-4"):
     """Count tokens in a text string."""
     try:
-        encoding = tiktoken.encoding_for_model(model)
-        return len(encoding.encode(text))
+        return len(_get_encoding(model).encode(text))
     except:
         # Fallback: rough estimate
         return len(text) // 4
 
 
+# Paper markdown contents, decoded once at startup. The whole corpus is
+# a few MB, so holding it in memory removes the open/read per new
+# conversation (and the pages are shared copy-on-write across workers).
+_paper_markdowns = {}
+
+
 def initialize_paper_data():
     """Load and cache paper data with chat availability at startup."""
     global paper_data_cache
@@ -196,20 +208,24 @@ def initialize_paper_data():
 
     papers = data.get('papers', {})
 
-    # Pre-compute chat availability for each paper
+    # Pre-compute chat availability and preload markdown for each paper
     chat_available_count = 0
     for paper_id, paper in papers.items():
         # Determine markdown filename
         markdown_filename = paper.get('markdown') or (paper.get('mapped_pdf') or '').replace('.pdf', '.md')
 
-        # Check if markdown file exists
-        if markdown_filename:
+        paper['chat_available'] = False
+        if markdown_filename and markdown_filename not in _paper_markdowns:
             markdown_path = os.path.join('markdowns', markdown_filename)
-            paper['chat_available'] = os.path.exists(markdown_path)
-            if paper['chat_available']:
-                chat_available_count += 1
-        else:
-            paper['chat_available'] = False
+            try:
+                with open(markdown_path, 'r', encoding='utf-8') as f:
+                    _paper_markdowns[markdown_filename] = f.read()
+            except OSError:
+                pass
+
+        if markdown_filename in _paper_markdowns:
+            paper['chat_available'] = True
+            chat_available_count += 1
 
     # Cache the data
     paper_data_cache = data
@@ -221,7 +237,7 @@ def initialize_paper_data():
 
 
 def load_paper_markdown(paper_id):
-    """Load markdown content for a paper from cache.
+    """Get a paper and its markdown content from the startup caches.
 
     Returns (paper_dict, markdown_content) or (None, None) if not available.
     """
@@ -234,25 +250,69 @@ def load_paper_markdown(paper_id):
     # Determine markdown filename
     markdown_filename = paper.get('markdown') or (paper.get('mapped_pdf') or '').replace('.pdf', '.md')
 
-    if not markdown_filename:
+    # Content was preloaded at startup; no per-conversation disk read
+    content = _paper_markdowns.get(markdown_filename)
+    if not content or not content.strip():
+        logger.warning(f"Empty or missing markdown for paper {paper_id}")
         return None, None
 
-    # Load markdown content
-    markdown_path = os.path.join('markdowns', markdown_filename)
+    return paper, content
 
-    try:
-        with open(markdown_path, 'r', encoding='utf-8') as f:
-            content = f.read()
 
-        if not content.strip():
-            logger.warning(f"Empty markdown file for paper {paper_id}")
-            return None, None
+@functools.lru_cache(maxsize=32)
+def build_system_message(paper_id):
+    """Build the system prompt (with full paper content) for a paper.
+
+    Cached because every conversation init otherwise re-reads the
+    markdown from disk and re-formats the same multi-thousand-token
+    prompt string. Returns None if the paper or markdown is unavailable.
+    """
+    paper, content = load_paper_markdown(paper_id)
+    if not paper or not content:
+        return None
 
-        return paper, content
+    # Determine venue based on publication type
+    if paper.get('type') == 'inproceedings':
+        venue = paper.get('booktitle') or paper.get('venue', 'Unknown')
+    elif paper.get('type') == 'article':
+        venue = paper.get('journal') or paper.get('venue', 'Unknown')
+    else:
+        venue = paper.get('venue', 'Unknown')
+
+    return SYSTEM_PROMPT_TEMPLATE.format(
+        title=paper.get('title', 'Unknown'),
+        authors=paper.get('authors', 'Unknown'),
+        year=paper.get('year', 'Unknown'),
+        venue=venue,
+        content=content
+    )
 
-    except Exception as e:
-        logger.error(f"Failed to load markdown for paper {paper_id}: {e}")
-        return None, None
+
+# Static assets cached aggressively: JS/CSS/PDF content only changes on
+# deploy, so clients can revalidate with an ETag computed once at startup
+# instead of the server re-hashing the file on every request.
+_STATIC_CACHE_EXTS = ('.js', '.css', '.pdf')
+_STATIC_CACHE_MAX_AGE = 31536000  # one year; ETag catches redeploys
+_asset_etags = {}
+
+
+def precompute_asset_etags():
+    """Hash cacheable static files once so serving them is stat-free."""
+    count = 0
+    for dirpath, dirnames, filenames in os.walk('.'):
+        # Skip hidden directories (.git etc.)
+        dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+        for name in filenames:
+            if name.endswith(_STATIC_CACHE_EXTS):
+                full = os.path.join(dirpath, name)
+                rel = os.path.relpath(full, '.').replace(os.sep, '/')
+                try:
+                    with open(full, 'rb') as f:
+                        _asset_etags[rel] = hashlib.md5(f.read()).hexdigest()
+                    count += 1
+                except OSError as e:
+                    logger.warning(f"Could not hash static asset {rel}: {e}")
+    logger.info(f"Precomputed ETags for {count} static assets")
 
 
 def load_canned_questions():
@@ -269,6 +329,23 @@ def load_canned_questions():
         canned_questions = []
 
 
+def _cleanup_loop():
+    """Run cleanup_inactive when the next expiry is actually due.
+
+    Replaces the fixed 5-minute scheduler job: sleeps until the store's
+    earliest scheduled expiry (at least 1 second, at most the inactivity
+    timeout), so an idle site spends no CPU on sweeps and expired
+    conversations are reaped as soon as they lapse.
+    """
+    while True:
+        delay = chat_store.peek_next_expiry() - time.monotonic()
+        time.sleep(min(max(delay, 1.0), INACTIVITY_TIMEOUT_MINUTES * 60))
+        try:
+            chat_store.cleanup_inactive()
+        except Exception as e:
+            logger.error(f"Chat cleanup failed: {e}")
+
+
 def initialize_app():
     """Initialize all components at app startup."""
     global paper_chat_client, chat_store, paper_data_cache
@@ -279,6 +356,9 @@ def initialize_app():
     # 2. Load canned questions
     load_canned_questions()
 
+    # 2b. Precompute ETags for long-lived static assets
+    precompute_asset_etags()
+
     # 3. Initialize Azure OpenAI client
     try:
         paper_chat_client = AzureOpenAI(
@@ -319,19 +399,13 @@ def initialize_app():
     # 5. Initialize analytics database
     init_analytics_db()
 
-    # 6. Initialize cleanup scheduler (only needed for in-memory storage)
+    # 6. Start the cleanup thread (only needed for in-memory storage)
     if chat_store and isinstance(chat_store, InMemoryChatStore):
-        scheduler.init_app(app)
-        scheduler.start()
-        scheduler.add_job(
-            id='cleanup_conversations',
-            func=lambda: chat_store.cleanup_inactive(),
-            trigger='interval',
-            minutes=CLEANUP_INTERVAL_MINUTES
-        )
-        logger.info("Chat cleanup scheduler started for in-memory storage")
+        threading.Thread(target=_cleanup_loop, name='chat-cleanup',
+                         daemon=True).start()
+        logger.info("Adaptive chat cleanup thread started for in-memory storage")
     elif chat_store and isinstance(chat_store, RedisChatStore):
-        logger.info("Redis TTL handles cleanup automatically - scheduler not needed")
+        logger.info("Redis TTL handles cleanup automatically - cleanup thread not needed")
 
 
 # Run initialization
@@ -414,29 +488,11 @@ def chat_with_paper(paper_id):
     conversation = chat_store.get_conversation(session_id, paper_id)
 
     if not conversation:
-        # Load paper content
-        paper, content = load_paper_markdown(paper_id)
-        if not paper or not content:
+        # Build (or reuse the cached) system message with full metadata
+        system_message = build_system_message(paper_id)
+        if system_message is None:
             return jsonify({'error': 'Paper or markdown not found'}), 404
 
-        # Determine venue based on publication type
-        venue = 'Unknown'
-        if paper.get('type') == 'inproceedings':
-            venue = paper.get('booktitle') or paper.get('venue', 'Unknown')
-        elif paper.get('type') == 'article':
-            venue = paper.get('journal') or paper.get('venue', 'Unknown')
-        else:
-            venue = paper.get('venue', 'Unknown')
-
-        # Create system message with full metadata
-        system_message = SYSTEM_PROMPT_TEMPLATE.format(
-            title=paper.get('title', 'Unknown'),
-            authors=paper.get('authors', 'Unknown'),
-            year=paper.get('year', 'Unknown'),
-            venue=venue,
-            content=content
-        )
-
         # Initialize conversation (this clears any other active chats for session)
         messages = [{'role': 'system', 'content': system_message}]
         chat_store.init_conversation(session_id, paper_id, messages, message_count=0)
@@ -452,11 +508,16 @@ def chat_with_paper(paper_id):
 
     # Check for inactivity timeout
     last_activity = conversation.get('last_activity')
-    if isinstance(last_activity, str):
-        last_activity = datetime.fromisoformat(last_activity)
+    if isinstance(last_activity, (int, float)):
+        # In-memory store keeps monotonic seconds
+        inactive = time.monotonic() - last_activity > INACTIVITY_TIMEOUT_MINUTES * 60
+    else:
+        # Redis store serializes wall-clock timestamps as ISO strings
+        if isinstance(last_activity, str):
+            last_activity = datetime.fromisoformat(last_activity)
+        inactive = datetime.now() - last_activity > timedelta(minutes=INACTIVITY_TIMEOUT_MINUTES)
 
-    inactive_duration = datetime.now() - last_activity
-    if inactive_duration > timedelta(minutes=INACTIVITY_TIMEOUT_MINUTES):
+    if inactive:
         chat_store.delete_conversation(session_id, paper_id)
         return jsonify({
             'error': 'Chat ended due to inactivity',
@@ -549,8 +610,20 @@ def serve_ai_matters(path):
 
 @app.route('/<path:path>')
 def serve_static(path):
-    """Serve all other static files (JS, CSS, JSON, PDFs, etc.)"""
-    return send_from_directory('.', path)
+    """Serve all other static files (JS, CSS, JSON, PDFs, etc.)
+
+    Assets with precomputed ETags get a one-year immutable Cache-Control
+    and header-only 304s; HTML and everything else keeps Flask's default
+    conditional handling.
+    """
+    etag = _asset_etags.get(path)
+    resp = send_from_directory('.', path, conditional=True)
+    if etag is not None:
+        resp.set_etag(etag)
+        resp.cache_control.max_age = _STATIC_CACHE_MAX_AGE
+        resp.cache_control.immutable = True
+        resp.make_conditional(request)
+    return resp
 
 if __name__ == '__main__':
     # For local development
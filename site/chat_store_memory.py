@@ -1,6 +1,8 @@
 """In-memory implementation of chat storage."""
 
+import heapq
 import threading
+import time
 from datetime import datetime, timedelta
 from typing import Optional, Tuple, List, Dict, Any
 import logging
@@ -16,15 +18,26 @@ class InMemoryChatStore(ChatStore):
     ⚠️ DEPLOYMENT NOTE: Requires single-worker mode (gunicorn --workers=1)
     For multi-worker deployments, use RedisChatStore instead.
 
+    Locking is striped by session_id: each session hashes to one of a
+    fixed set of locks, so concurrent traffic for unrelated sessions
+    (e.g. rate-limit checks during long SSE streams) doesn't serialize
+    through a single global mutex.
+
+    Timestamps (last_activity, rate windows) are time.monotonic() float
+    seconds: cheaper than datetime construction on every message and
+    immune to wall-clock jumps. Only rate-limit reset times are converted
+    to datetime, at the API boundary.
+
     Attributes:
         conversations: Dict mapping session_id -> paper_id -> conversation data
         rate_limits: Dict mapping session_id -> rate limit data
-        lock: Thread lock for concurrent access
-        timeout: Inactivity timeout for conversations
+        timeout: Inactivity timeout in seconds
         max_messages_per_hour: Rate limit threshold
         inactivity_timeout_minutes: Minutes before conversation expires
     """
 
+    _N_STRIPES = 64
+
     def __init__(self, max_messages_per_hour: int = 20, inactivity_timeout_minutes: int = 10):
         """Initialize in-memory store.
 
@@ -34,72 +47,107 @@ class InMemoryChatStore(ChatStore):
         """
         self.conversations = {}  # {session_id: {paper_id: {...}}}
         self.rate_limits = {}    # {session_id: {count, window_start}}
-        self.lock = threading.Lock()
-        self.timeout = timedelta(minutes=inactivity_timeout_minutes)
+        self._stripes = [threading.Lock() for _ in range(self._N_STRIPES)]
+        self.timeout = inactivity_timeout_minutes * 60.0
         self.max_messages_per_hour = max_messages_per_hour
         self.inactivity_timeout_minutes = inactivity_timeout_minutes
 
+        # Expiry bookkeeping so cleanup pops only what actually expired
+        # instead of scanning every conversation. Heap entries carry a
+        # generation number; touching a conversation bumps its generation,
+        # which lazily invalidates the older heap entries.
+        self._expiry_heap = []   # [(expiry, session_id, paper_id, gen)]
+        self._gen = {}           # {(session_id, paper_id): gen}
+        self._rl_heap = []       # [(purge_time, session_id, window_start)]
+        self._heap_lock = threading.Lock()
+
+    def _lock_for(self, session_id: str) -> threading.Lock:
+        """Stripe lock guarding one session's conversations and rate data."""
+        return self._stripes[hash(session_id) & (self._N_STRIPES - 1)]
+
+    def _touch(self, session_id: str, paper_id: str, last_activity: float) -> None:
+        """Record a fresh expiry for a conversation (caller holds the stripe)."""
+        key = (session_id, paper_id)
+        gen = self._gen.get(key, 0) + 1
+        self._gen[key] = gen
+        with self._heap_lock:
+            heapq.heappush(self._expiry_heap,
+                           (last_activity + self.timeout, session_id, paper_id, gen))
+
+    def _forget(self, session_id: str, paper_ids) -> None:
+        """Drop generation entries; their heap entries go stale and get skipped."""
+        for paper_id in paper_ids:
+            self._gen.pop((session_id, paper_id), None)
+
     def get_conversation(self, session_id: str, paper_id: str) -> Optional[Dict[str, Any]]:
         """Get conversation dict or None."""
-        with self.lock:
-            if session_id not in self.conversations:
-                return None
-            return self.conversations[session_id].get(paper_id)
+        # Plain dict reads are atomic under the GIL; no lock needed for a
+        # point lookup (the caller gets the live dict, same as before)
+        papers = self.conversations.get(session_id)
+        if papers is None:
+            return None
+        return papers.get(paper_id)
 
     def init_conversation(self, session_id: str, paper_id: str,
                          messages: List[Dict[str, str]], message_count: int = 0) -> None:
         """Initialize new conversation. Clears other conversations for session."""
-        with self.lock:
+        with self._lock_for(session_id):
+            now = time.monotonic()
             # Clear all other conversations for this session (one chat at a time)
-            self.conversations[session_id] = {}
-
-            # Create new conversation
-            self.conversations[session_id][paper_id] = {
-                'messages': messages,
-                'message_count': message_count,
-                'last_activity': datetime.now()
+            # and create the new conversation in one assignment
+            self._forget(session_id, self.conversations.get(session_id, ()))
+            self.conversations[session_id] = {
+                paper_id: {
+                    'messages': messages,
+                    'message_count': message_count,
+                    'last_activity': now
+                }
             }
+            self._touch(session_id, paper_id, now)
 
     def add_message(self, session_id: str, paper_id: str, role: str, content: str) -> None:
         """Add message to conversation and increment count."""
-        with self.lock:
+        with self._lock_for(session_id):
             conv = self.conversations.get(session_id, {}).get(paper_id)
             if conv:
                 conv['messages'].append({'role': role, 'content': content})
                 conv['message_count'] += 1
-                conv['last_activity'] = datetime.now()
+                conv['last_activity'] = time.monotonic()
+                self._touch(session_id, paper_id, conv['last_activity'])
 
     def delete_conversation(self, session_id: str, paper_id: Optional[str] = None) -> None:
         """Delete conversation(s)."""
-        with self.lock:
-            if session_id not in self.conversations:
+        with self._lock_for(session_id):
+            papers = self.conversations.get(session_id)
+            if papers is None:
                 return
 
             if paper_id:
                 # Delete specific conversation
-                if paper_id in self.conversations[session_id]:
-                    del self.conversations[session_id][paper_id]
+                papers.pop(paper_id, None)
+                self._forget(session_id, (paper_id,))
             else:
                 # Delete all conversations for session
                 del self.conversations[session_id]
+                self._forget(session_id, papers)
 
     def update_activity(self, session_id: str, paper_id: str) -> None:
         """Update last activity timestamp."""
-        with self.lock:
+        with self._lock_for(session_id):
             conv = self.conversations.get(session_id, {}).get(paper_id)
             if conv:
-                conv['last_activity'] = datetime.now()
+                conv['last_activity'] = time.monotonic()
+                self._touch(session_id, paper_id, conv['last_activity'])
 
     def get_message_count(self, session_id: str, paper_id: str) -> int:
         """Get message count for conversation."""
-        with self.lock:
-            conv = self.conversations.get(session_id, {}).get(paper_id)
-            return conv['message_count'] if conv else 0
+        conv = self.conversations.get(session_id, {}).get(paper_id)
+        return conv['message_count'] if conv else 0
 
     def check_rate_limit(self, session_id: str) -> Tuple[bool, int, Optional[datetime]]:
         """Check if session has exceeded rate limit."""
-        with self.lock:
-            now = datetime.now()
+        with self._lock_for(session_id):
+            now = time.monotonic()
 
             # Initialize if not exists
             if session_id not in self.rate_limits:
@@ -107,18 +155,23 @@ class InMemoryChatStore(ChatStore):
                     'count': 0,
                     'window_start': now
                 }
+                self._schedule_rl_purge(session_id, now)
 
             user_data = self.rate_limits[session_id]
             window_age = now - user_data['window_start']
 
             # Reset if window expired (>1 hour)
-            if window_age > timedelta(hours=1):
+            if window_age > 3600.0:
                 user_data['count'] = 0
                 user_data['window_start'] = now
+                self._schedule_rl_purge(session_id, now)
 
             # Check limit
             if user_data['count'] >= self.max_messages_per_hour:
-                reset_time = user_data['window_start'] + timedelta(hours=1)
+                # Monotonic internally; convert to wall clock only here,
+                # where the caller shows the reset time to the user
+                reset_time = datetime.now() + timedelta(
+                    seconds=3600.0 - (now - user_data['window_start']))
                 return False, 0, reset_time
 
             remaining = self.max_messages_per_hour - user_data['count']
@@ -126,43 +179,79 @@ class InMemoryChatStore(ChatStore):
 
     def increment_rate_limit(self, session_id: str) -> None:
         """Increment hourly message counter."""
-        with self.lock:
+        with self._lock_for(session_id):
             if session_id in self.rate_limits:
                 self.rate_limits[session_id]['count'] += 1
 
-    def cleanup_inactive(self) -> int:
-        """Remove conversations inactive for timeout period.
+    def peek_next_expiry(self) -> float:
+        """Earliest scheduled expiry, in monotonic seconds.
 
-        Returns:
-            Number of conversations removed
+        Lets the cleanup loop sleep until work is actually due instead of
+        polling on a fixed interval. Defaults to one minute out when
+        nothing is scheduled.
         """
-        with self.lock:
-            now = datetime.now()
-            removed_count = 0
-
-            sessions_to_delete = []
+        with self._heap_lock:
+            candidates = [heap[0][0] for heap in (self._expiry_heap, self._rl_heap)
+                          if heap]
+        return min(candidates) if candidates else time.monotonic() + 60.0
 
-            for session_id, papers in list(self.conversations.items()):
-                papers_to_delete = []
+    def _schedule_rl_purge(self, session_id: str, window_start: float) -> None:
+        """Queue a rate-limit entry for deletion well after its window ends."""
+        with self._heap_lock:
+            heapq.heappush(self._rl_heap,
+                           (window_start + 7200.0, session_id, window_start))
 
-                for paper_id, conv in list(papers.items()):
-                    if now - conv['last_activity'] > self.timeout:
-                        papers_to_delete.append(paper_id)
-                        removed_count += 1
+    def cleanup_inactive(self) -> int:
+        """Remove conversations inactive for timeout period.
 
-                # Delete expired conversations
-                for paper_id in papers_to_delete:
-                    del papers[paper_id]
+        Pops expired entries off the min-heaps instead of scanning every
+        conversation: O(k log N) for k actual expirations. Entries whose
+        generation is stale (the conversation was touched after the push)
+        or whose conversation is already gone are skipped.
 
-                # If session has no conversations, mark for deletion
+        Returns:
+            Number of conversations removed
+        """
+        now = time.monotonic()
+        removed_count = 0
+
+        while True:
+            with self._heap_lock:
+                if not self._expiry_heap or self._expiry_heap[0][0] > now:
+                    break
+                _, session_id, paper_id, gen = heapq.heappop(self._expiry_heap)
+
+            with self._lock_for(session_id):
+                key = (session_id, paper_id)
+                if self._gen.get(key) != gen:
+                    # Touched since this entry was pushed, or already deleted
+                    continue
+                del self._gen[key]
+
+                papers = self.conversations.get(session_id)
+                if papers is None or paper_id not in papers:
+                    continue
+                del papers[paper_id]
+                removed_count += 1
+
+                # If session has no conversations, delete it
                 if not papers:
-                    sessions_to_delete.append(session_id)
+                    del self.conversations[session_id]
 
-            # Delete empty sessions
-            for session_id in sessions_to_delete:
-                del self.conversations[session_id]
+        # Rate-limit windows expire the same way; an entry is only dropped
+        # if its window hasn't been replaced by a newer one since the push
+        while True:
+            with self._heap_lock:
+                if not self._rl_heap or self._rl_heap[0][0] > now:
+                    break
+                _, session_id, window_start = heapq.heappop(self._rl_heap)
+
+            with self._lock_for(session_id):
+                user_data = self.rate_limits.get(session_id)
+                if user_data and user_data['window_start'] == window_start:
+                    del self.rate_limits[session_id]
 
-            if removed_count > 0:
-                logger.info(f"Cleaned up {removed_count} inactive conversations")
+        if removed_count > 0:
+            logger.info(f"Cleaned up {removed_count} inactive conversations")
 
-            return removed_count
\ No newline at end of file
+        return removed_count